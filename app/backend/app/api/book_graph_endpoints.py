@@ -1,7 +1,8 @@
 # project
+from app.core.book_catalog import book_catalog
 from app.core.graph import graph_instance
 from app.core.logging import get_logger
-from app.schemas.books_search import BookSearchItem
+from app.schemas.books_search import BookReference, BookSearchItem
 from app.schemas.graph import Node
 # 3rd party
 from fastapi import APIRouter, HTTPException
@@ -16,33 +17,53 @@ CODE_PROPERTY_KEY = "code"
     "/add_to_graph",
     response_model=Node,
     summary="Add book to user's graph",
-    description="Adds a book to the user's graph using book data from search results. "
+    description="Adds a book to the user's graph using book data from search results, "
+    "or only its code or ISBN if it was found by an earlier search. "
     "If the book already exists, returns the existing node.",
 )
-async def add_book_to_graph(book: BookSearchItem) -> Node:
+async def add_book_to_graph(reference: BookReference) -> Node:
     """Add a book to the user's graph using book data from search results.
 
     The function:
-    1. Checks if the book already exists in the graph (by code)
-    2. Adds the book as a node if it doesn't exist
-    3. Returns the book node
+    1. Completes the book data from the local book catalog (by code or ISBN)
+    2. Checks if the book already exists in the graph (by code)
+    3. Adds the book as a node if it doesn't exist
+    4. Returns the book node
 
-    This endpoint expects book data from the search endpoint response,
-    avoiding duplicate API calls to Google Books API.
+    This endpoint expects book data from the search endpoint response
+    (or a code or ISBN of a book in it), avoiding duplicate API calls to
+    Google Books API.
 
     Args:
-        book (BookSearchItem): Book data from search endpoint response
+        reference (BookReference): Book data from search endpoint response
 
     Raises:
+        HTTPException: If a book sent only by code or ISBN is not in the catalog (404)
         HTTPException: If the book data is invalid (422)
 
     Returns:
         Node: The book node added to or found in the graph
     """
+    stored = book_catalog.find(code=reference.code, isbn=reference.isbn)
+    if stored is None and not reference.title and (reference.code or reference.isbn):
+        logger.warning(
+            "Book not found in catalog",
+            book_code=reference.code,
+            book_isbn=reference.isbn,
+        )
+        raise HTTPException(
+            status_code=404,
+            detail="Book not found in the local catalog",
+        )
+    data = stored.model_dump() if stored is not None else {"author": "", "title": "", "code": ""}
+    data.update(reference.model_dump(exclude_none=True))
+    book = BookSearchItem(**data)
+
     logger.info(
         "Adding book to graph",
         book_code=book.code,
         book_title=book.title,
+        resolved_from_catalog=stored is not None,
     )
 
     # Validate required fields
@@ -79,16 +100,7 @@ async def add_book_to_graph(book: BookSearchItem) -> Node:
         return existing_node
 
     # Create book properties for the graph node
-    book_properties = {
-        CODE_PROPERTY_KEY: book.code,
-        "title": book.title,
-        "author": book.author,
-        "published": book.published,
-        "isbn": book.isbn,
-        "subjects": book.subjects,
-        "description": book.description,
-        "cover": book.cover,
-    }
+    book_properties = book.to_node_properties()
 
     # Add node to graph - используем название книги как label
     new_node = graph_instance.add_node(
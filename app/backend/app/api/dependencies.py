@@ -0,0 +1,28 @@
+# project
+from app.core.config import GraphSettings
+from app.core.graph import graph_instance
+from app.core.logging import get_logger
+
+# 3rd party
+from fastapi import HTTPException
+
+
+logger = get_logger(__name__)
+
+graph_settings = GraphSettings()
+
+
+async def require_graph_ready() -> None:
+    """Wait for the graph to be loaded before serving a graph endpoint.
+
+    Raises:
+        HTTPException: If the graph is still loading after the timeout (503)
+    """
+    if await graph_instance.wait_until_ready(graph_settings.ready_timeout):
+        return
+    logger.warning("Graph request rejected, graph is still loading")
+    raise HTTPException(
+        status_code=503,
+        detail="Graph is still loading, retry later",
+        headers={"Retry-After": "1"},
+    )
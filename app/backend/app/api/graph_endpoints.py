@@ -1,35 +1,326 @@
 # python
-from typing import Dict
+import asyncio
+import base64
+import json
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Tuple
 
 # project
 from app.schemas.graph import (AddNodeRequest, ChangeNodeRequest, AddEdgeRequest,
-                               Graph, Node, Edge)
-from app.core.graph import graph_instance
+                               Node, Edge, GraphChange, GraphChangesResponse, GraphPage,
+                               GraphNeighborhood, GraphBatchRequest, GraphBatchResponse,
+                               GraphOperationResult, GraphAnalyticsResponse,
+                               GraphSearchHit, GraphSearchResponse)
+from app.core.graph import graph_instance, GraphBatchError
+from app.core.graph_analytics import graph_analytics
+from app.core.graph_search import graph_search
 from app.core.logging import get_logger
 
 # 3rd party
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+DEFAULT_PAGE_SIZE = 1000
 
-@router.get("/show_graph")
-async def show_graph() -> Graph:
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against the current ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _encode_cursor(version: int, offset: int) -> str:
+    raw = f"{graph_instance.instance_token}:{version}:{offset}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, int, int]:
+    """Decode a pagination cursor into (instance, version, offset).
+
+    Raises:
+        HTTPException: if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        instance, version, offset = raw.split(":")
+        if int(offset) < 0:
+            raise ValueError("Negative cursor offset")
+        return instance, int(version), int(offset)
+    except (ValueError, UnicodeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+@router.get("/show_graph", response_model=GraphPage, response_model_exclude_none=True)
+async def show_graph(
+    cursor: Optional[str] = Query(
+        default=None, description="Cursor from the previous page"),
+    limit: Optional[int] = Query(
+        default=None, ge=1, le=10000, description="Max nodes and edges per page"),
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
     """Show graph structure
 
+    The serialized graph is cached per graph version and sent with an ETag.
+    A request with a matching If-None-Match header gets 304 Not Modified.
+
+    With `limit` and/or `cursor` the graph is returned page by page, nodes
+    first, then edges. A cursor is only valid for the graph version it was
+    issued at; if the graph changed meanwhile the request fails with 409
+    and pagination must restart (or catch up through /graph/changes).
+
+    Args:
+        cursor (str, optional): cursor from the previous page
+        limit (int, optional): max nodes and edges per page
+        if_none_match (str, optional): ETag of the graph the client already has
+
+    Raises:
+        HTTPException: if the cursor is invalid or stale
+
     Returns:
-        Graph: graph structure
+        Response: graph structure (or page) as JSON, or empty 304 response
     """
+    if cursor is not None or limit is not None:
+        return _show_graph_page(cursor, limit or DEFAULT_PAGE_SIZE)
+
     logger.debug("Showing graph structure")
-    graph = graph_instance.show_graph()
+    etag, body = graph_instance.show_graph_json()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        # Starting point for delta sync through /graph/changes
+        "X-Graph-Version": str(graph_instance.version),
+        "X-Graph-Instance": graph_instance.instance_token,
+    }
+    if _etag_matches(if_none_match, etag):
+        logger.debug("Graph structure not modified", etag=etag)
+        return Response(status_code=304, headers=headers)
     logger.info(
         "Graph structure retrieved",
-        nodes_count=len(graph.nodes),
-        edges_count=len(graph.edges),
+        version=graph_instance.version,
+        size_bytes=len(body),
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _show_graph_page(cursor: Optional[str], limit: int) -> Response:
+    version = graph_instance.version
+    offset = 0
+    if cursor is not None:
+        instance, cursor_version, offset = _decode_cursor(cursor)
+        if instance != graph_instance.instance_token or cursor_version != version:
+            logger.info("Stale graph pagination cursor",
+                        cursor_version=cursor_version, version=version)
+            raise HTTPException(
+                status_code=409,
+                detail="Graph changed since the cursor was issued, restart pagination",
+            )
+
+    page, next_offset = graph_instance.get_page(offset, limit)
+    body = {**page, "version": version}
+    if next_offset is not None:
+        body["next_cursor"] = _encode_cursor(version, next_offset)
+    logger.info(
+        "Graph page retrieved",
+        version=version,
+        offset=offset,
+        nodes_count=len(page["nodes"]),
+        edges_count=len(page["edges"]),
+    )
+    return Response(
+        content=json.dumps(body, ensure_ascii=False, separators=(",", ":")),
+        media_type="application/json",
+    )
+
+
+@router.get("/stream")
+async def stream_graph(
+    chunk_size: int = Query(default=500, ge=1, le=10000),
+) -> StreamingResponse:
+    """Stream graph structure as NDJSON
+
+    The first line is a header with the graph version, then one line per
+    node followed by one line per edge, and a final line with the version
+    at the end of the stream. Mutations made while streaming can be
+    fetched afterwards through /graph/changes?since=<header version>.
+
+    Args:
+        chunk_size (int): number of lines rendered per chunk
+
+    Returns:
+        StreamingResponse: NDJSON stream
+    """
+    nodes_count, edges_count = graph_instance.count_elements()
+    logger.info(
+        "Streaming graph structure",
+        version=graph_instance.version,
+        nodes_count=nodes_count,
+        edges_count=edges_count,
+    )
+
+    async def generate() -> AsyncIterator[bytes]:
+        header = {
+            "type": "header",
+            "version": graph_instance.version,
+            "instance": graph_instance.instance_token,
+            "nodes_count": nodes_count,
+            "edges_count": edges_count,
+        }
+        yield _ndjson_line(header)
+        for chunk in graph_instance.iter_structure_chunks(chunk_size):
+            yield b"".join(
+                _ndjson_line({"type": element_type, **data})
+                for element_type, data in chunk
+            )
+            # Let other requests run between chunks
+            await asyncio.sleep(0)
+        yield _ndjson_line({"type": "end", "version": graph_instance.version})
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _ndjson_line(data: Dict[str, Any]) -> bytes:
+    return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+@router.get("/search", response_model=GraphSearchResponse)
+async def search_graph(
+    q: str = Query(..., min_length=1, max_length=500, description="Free text query"),
+    limit: int = Query(default=20, ge=1, le=100, description="Max number of results"),
+) -> GraphSearchResponse:
+    """Search nodes of the graph
+
+    Matches labels, titles, authors, subjects and descriptions, ignoring
+    case and diacritics, and ranks nodes by BM25 relevance.
+
+    Args:
+        q (str): query
+        limit (int): max number of results
+
+    Returns:
+        GraphSearchResponse: matching nodes, most relevant first
+    """
+    await graph_search.ensure_built()
+    total, ranked = graph_search.search(q, limit)
+    results = []
+    for node_id, score in ranked:
+        node_data = graph_instance.get_node_data(node_id)
+        if node_data is not None:
+            results.append(GraphSearchHit(node=Node(**node_data), score=score))
+    logger.info("Graph searched", query=q, total=total, results_count=len(results))
+    return GraphSearchResponse(query=q, total=total, results=results)
+
+
+@router.get("/neighborhood/{node_id}")
+async def neighborhood(
+    node_id: str,
+    depth: int = Query(default=1, ge=0, le=10, description="Max number of hops"),
+    direction: Literal["in", "out", "both"] = Query(
+        default="both", description="Follow outgoing, incoming or all edges"),
+    max_nodes: int = Query(default=500, ge=1, le=10000,
+                           description="Max number of returned nodes"),
+) -> GraphNeighborhood:
+    """Show k-hop neighborhood of a node
+
+    Args:
+        node_id (str): id of the center node
+        depth (int): max number of hops
+        direction (str): "in", "out" or "both"
+        max_nodes (int): max number of returned nodes
+
+    Raises:
+        HTTPException: if the node is not found
+
+    Returns:
+        GraphNeighborhood: subgraph induced by the neighborhood
+    """
+    try:
+        subgraph, truncated = graph_instance.neighborhood(
+            node_id, depth, direction, max_nodes)
+    except KeyError:
+        logger.warning("Node not found", node_id=node_id)
+        raise HTTPException(status_code=404, detail="Node not found")
+    logger.info(
+        "Graph neighborhood retrieved",
+        node_id=node_id,
+        depth=depth,
+        direction=direction,
+        nodes_count=len(subgraph["nodes"]),
+        edges_count=len(subgraph["edges"]),
+        truncated=truncated,
+    )
+    return GraphNeighborhood(
+        **subgraph,
+        center=node_id,
+        depth=depth,
+        direction=direction,
+        truncated=truncated,
+    )
+
+
+@router.get("/changes", response_model_exclude_none=True)
+async def graph_changes(
+    since: int = Query(..., ge=0, description="Graph version the client already has"),
+    instance: Optional[str] = Query(
+        default=None, description="Instance token from a previous response"),
+) -> GraphChangesResponse:
+    """Show graph changes since a version
+
+    Falls back to a full snapshot if the change log no longer covers the
+    requested version or the graph instance has changed (e.g. a restart).
+
+    Args:
+        since (int): graph version the client already has
+        instance (str, optional): instance token the version belongs to
+
+    Returns:
+        GraphChangesResponse: changes since the version or full snapshot
+    """
+    version = graph_instance.version
+    instance_token = graph_instance.instance_token
+    changes = None
+    if instance is None or instance == instance_token:
+        changes = graph_instance.changes_since(since)
+
+    if changes is None:
+        logger.info(
+            "Graph changes not available, sending full snapshot",
+            since=since,
+            version=version,
+        )
+        return GraphChangesResponse(
+            version=version,
+            instance=instance_token,
+            full_snapshot=True,
+            graph=graph_instance.show_graph(),
+        )
+
+    logger.debug("Graph changes retrieved", since=since,
+                 version=version, changes_count=len(changes))
+    return GraphChangesResponse(
+        version=version,
+        instance=instance_token,
+        changes=[
+            GraphChange(
+                version=change_version,
+                op=mutation["op"],
+                node=mutation.get("node"),
+                node_id=mutation.get("id"),
+                edge=mutation.get("edge"),
+                source=mutation.get("source"),
+                target=mutation.get("target"),
+            )
+            for change_version, mutation in changes
+        ],
     )
-    return graph
 
 
 @router.post("/add_node")
@@ -172,3 +463,113 @@ async def remove_edge(source_id: str, target_id: str) -> Dict[str, str]:
         target_id=target_id,
     )
     return {"message": "Edge removed successfully"}
+
+
+@router.post(
+    "/batch",
+    response_model=GraphBatchResponse,
+    response_model_exclude_none=True,
+    responses={400: {"model": GraphBatchResponse}},
+)
+async def apply_batch(request: GraphBatchRequest) -> Any:
+    """Apply a batch of graph operations atomically
+
+    Either all operations are applied and persisted with a single write,
+    or none are (400 with the failing operation marked).
+
+    Args:
+        request (GraphBatchRequest): operations to apply in order
+
+    Returns:
+        GraphBatchResponse: per-operation results
+    """
+    operations = [operation.model_dump() for operation in request.operations]
+    logger.info("Applying graph batch", operations_count=len(operations))
+    try:
+        results = graph_instance.apply_batch(operations)
+    except GraphBatchError as e:
+        logger.warning(
+            "Graph batch rolled back",
+            failed_index=e.index,
+            error=e.message,
+        )
+        response = GraphBatchResponse(
+            applied=False,
+            version=graph_instance.version,
+            results=[
+                GraphOperationResult(
+                    index=index,
+                    op=operation.op,
+                    success=index < e.index,
+                    error=e.message if index == e.index else None,
+                )
+                for index, operation in enumerate(request.operations[:e.index + 1])
+            ],
+        )
+        return JSONResponse(status_code=400, content=response.model_dump(exclude_none=True))
+
+    logger.info(
+        "Graph batch applied",
+        operations_count=len(operations),
+        version=graph_instance.version,
+    )
+    return GraphBatchResponse(
+        applied=True,
+        version=graph_instance.version,
+        results=[
+            GraphOperationResult(index=index, op=operation.op, success=True, **result)
+            for index, (operation, result) in enumerate(zip(request.operations, results))
+        ],
+    )
+
+
+@router.get("/persistence/metrics")
+async def persistence_metrics() -> Dict[str, Any]:
+    """Show graph persistence metrics
+
+    Returns:
+        dict: persistence mode, flush latency and coalescing ratio
+    """
+    return graph_instance.persistence_metrics()
+
+
+@router.get(
+    "/analytics/{metric}",
+    response_model=GraphAnalyticsResponse,
+    response_model_exclude_none=True,
+)
+async def graph_analytics_metric(
+    metric: Literal["pagerank", "in_degree", "out_degree", "betweenness", "components"],
+    top: Optional[int] = Query(
+        default=None, ge=1, le=10000, description="Return only the top nodes or components"),
+    allow_stale: bool = Query(
+        default=False,
+        description="Return the last result right away even if the graph changed since"),
+) -> GraphAnalyticsResponse:
+    """Show a graph metric
+
+    Results are cached per graph version and recomputed on the first
+    request after the graph changed. Betweenness is sampled on large graphs
+    (`sample_size` is then set).
+
+    Args:
+        metric (str): "pagerank", "in_degree", "out_degree", "betweenness" or "components"
+        top (int, optional): max number of returned nodes or components
+        allow_stale (bool): accept a result computed at an older graph version
+
+    Returns:
+        GraphAnalyticsResponse: scores per node, highest first, or components
+    """
+    result = await graph_analytics.get(metric, allow_stale=allow_stale)
+    if top is not None:
+        if result.get("values") is not None:
+            result["values"] = dict(islice(result["values"].items(), top))
+        if result.get("components") is not None:
+            result["components"] = result["components"][:top]
+    logger.info(
+        "Graph metric retrieved",
+        metric=metric,
+        version=result["version"],
+        stale=result["stale"],
+    )
+    return GraphAnalyticsResponse(**result)
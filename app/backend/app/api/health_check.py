@@ -1,11 +1,14 @@
 # python
-from typing import Dict
+from typing import Any, Dict
 
 # project
+from app.core.graph import graph_instance
+from app.core.http_clients import http_clients
 from app.core.logging import get_logger
 
 # 3rd party
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 
 router = APIRouter(
@@ -28,3 +31,34 @@ async def health_check() -> Dict[str, str]:
     """
     logger.debug("Health check requested")
     return {"status": "200 OK"}
+
+
+@router.get("/ready", summary="Readiness Check Endpoint",
+            description="Check if the graph is loaded and the API can serve it",
+            response_model=Dict[str, Any],
+            responses={503: {"description": "Graph is still loading"}})
+async def readiness_check() -> JSONResponse:
+    """Check if the graph was loaded from storage
+
+    Returns:
+        JSONResponse: status and load timings; 503 while the graph is loading
+    """
+    if not graph_instance.is_ready:
+        return JSONResponse(status_code=503, content={"status": "loading"})
+    return JSONResponse(content={
+        "status": "ready",
+        "timings": graph_instance.load_timings,
+    })
+
+
+@router.get("/http_clients", summary="Upstream Connection Pools",
+            description="Connection pool utilization per upstream service",
+            response_model=Dict[str, Any])
+async def http_clients_metrics() -> Dict[str, Any]:
+    """Report the pooled connections of each upstream service
+
+    Returns:
+        Dict[str, Any]: requests, open/active/idle connections and
+            utilization per upstream
+    """
+    return http_clients.metrics()
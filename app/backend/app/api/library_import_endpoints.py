@@ -0,0 +1,95 @@
+# python
+from typing import AsyncIterator
+
+# project
+from app.api.search_endpoints import books_search_service
+from app.core.graph import graph_instance
+from app.core.library_import import ImportFormatError, LibraryImportService
+from app.core.logging import get_logger
+from app.schemas.library_import import LibraryImportStatus
+
+# 3rd party
+from fastapi import APIRouter, File, HTTPException, UploadFile
+
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/json")
+
+library_import_service = LibraryImportService(
+    search_service=books_search_service,
+    graph_manager=graph_instance,
+)
+
+
+@router.post(
+    "/import",
+    response_model=LibraryImportStatus,
+    status_code=202,
+    summary="Import a reading list into user's graph",
+    description="Upload a CSV or NDJSON file of ISBNs or titles. Entries are resolved "
+    "through Google Books in the background; poll the returned job for progress.",
+)
+async def import_library(file: UploadFile = File(...)) -> LibraryImportStatus:
+    """Import a reading list into the user's graph.
+
+    Args:
+        file (UploadFile): CSV (isbn/title/author columns or one value per line)
+            or NDJSON file
+
+    Raises:
+        HTTPException: If the file cannot be parsed (422)
+
+    Returns:
+        LibraryImportStatus: Initial progress of the import job
+    """
+    filename = (file.filename or "").lower()
+    if filename.endswith(NDJSON_EXTENSIONS) or file.content_type in NDJSON_CONTENT_TYPES:
+        file_format = "ndjson"
+    else:
+        file_format = "csv"
+
+    logger.info(
+        "Importing library",
+        filename=file.filename,
+        file_format=file_format,
+    )
+
+    async def read_chunks() -> AsyncIterator[bytes]:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    try:
+        job = await library_import_service.start_import(read_chunks(), file_format)
+    except ImportFormatError as exc:
+        logger.warning("Invalid library import file", error=str(exc))
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    return LibraryImportStatus(**job.to_dict())
+
+
+@router.get(
+    "/import/{job_id}",
+    response_model=LibraryImportStatus,
+    summary="Get library import progress",
+    description="Progress of an import job, with the report of unresolved rows once completed.",
+)
+async def get_import_status(job_id: str) -> LibraryImportStatus:
+    """Get progress of a library import.
+
+    Args:
+        job_id (str): id of the import job
+
+    Raises:
+        HTTPException: If the job is not found (404)
+
+    Returns:
+        LibraryImportStatus: Progress or final report of the job
+    """
+    job = library_import_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return LibraryImportStatus(**job.to_dict())
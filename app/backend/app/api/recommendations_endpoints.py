@@ -1,10 +1,14 @@
+# python
+from typing import Any, Dict
+
 # project
 from app.core.graph import graph_instance
 from app.core.logging import get_logger
 from app.core.recommendation_service import (
-    GeminiRecommendationService,
     IRecommendationService,
+    create_recommendation_service,
 )
+from app.core.single_flight import recommendations_flight
 from app.schemas.recommendations import (
     RecommendationsResponse,
     UserRecommendationsRequest,
@@ -17,7 +21,7 @@ from app.core.error_utils import handle_endpoint_error
 router = APIRouter()
 logger = get_logger(__name__)
 
-recommendation_service: IRecommendationService = GeminiRecommendationService()
+recommendation_service: IRecommendationService = create_recommendation_service()
 
 
 @router.post(
@@ -37,16 +41,23 @@ async def get_user_recommendations(
         limit=request.limit,
     )
 
-    try:
+    async def generate() -> RecommendationsResponse:
         # Get graph state from instance
         graph = graph_instance.show_graph()
 
-        recommendations = await recommendation_service.get_recommendations(
+        return await recommendation_service.get_recommendations(
             user_id=request.user_id,
             graph=graph,
             limit=request.limit,
         )
 
+    try:
+        # Identical concurrent requests for the same graph share one generation
+        recommendations = await recommendations_flight.do(
+            (request.user_id, graph_instance.version, request.limit),
+            generate,
+        )
+
         logger.info(
             "Recommendations successfully generated",
             user_id=request.user_id,
@@ -65,6 +76,16 @@ async def get_user_recommendations(
         )
 
 
+@router.get("/recommendations/coalescing/metrics")
+async def recommendations_coalescing_metrics() -> Dict[str, Any]:
+    """Show how many requests joined an identical generation in flight
+
+    Returns:
+        dict: calls, executions, coalesced calls and generations in flight
+    """
+    return recommendations_flight.metrics()
+
+
 @router.get(
     "/recommendations",
     response_model=RecommendationsResponse,
@@ -1,21 +1,53 @@
+# python
+from typing import Any, Dict, Optional
+
 # project
-from app.core.config import ApiBooksSettings
+from app.core.book_catalog import (
+    CatalogingBooksSearchService,
+    LocalCatalogBooksSearchService,
+    book_catalog,
+)
+from app.core.book_suggest import book_suggest
+from app.core.config import SearchCacheSettings
+from app.core.search_cache import CachingBooksSearchService, SearchPrefetcher, search_cache
+from app.core.single_flight import CoalescingBooksSearchService, books_search_flight
+from app.core.books_search_service import (
+    BooksApiError,
+    GoogleBooksSearchService,
+    IBooksSearchService,
+)
 from app.core.logging import get_logger
 from app.schemas.books_search import (
     BookSearchRequest,
-    BookSearchItem,
     BookSearchResponse,
+    BookSuggestResponse,
+    BookSuggestion,
 )
 
 # 3rd party
-from fastapi import APIRouter, HTTPException
-import httpx
+from fastapi import APIRouter, HTTPException, Query
 
 
 router = APIRouter()
 logger = get_logger(__name__)
 
-api_books_settings = ApiBooksSettings()
+# Repeated searches are answered from the cache; every result is kept in the
+# local catalog (candidates of local recommendations), which can also answer
+# searches itself. Identical concurrent searches share one pass through the chain.
+search_cache_settings = SearchCacheSettings()
+books_search_service: IBooksSearchService = GoogleBooksSearchService()
+if search_cache_settings.enabled:
+    books_search_service = CachingBooksSearchService(books_search_service, search_cache)
+books_search_service = CatalogingBooksSearchService(books_search_service, book_catalog)
+local_catalog_search = LocalCatalogBooksSearchService(books_search_service, book_catalog)
+books_search_service = CoalescingBooksSearchService(local_catalog_search, books_search_flight)
+
+# Next pages are fetched ahead into the cache; a request for a page still
+# being fetched joins that fetch
+search_prefetcher: Optional[SearchPrefetcher] = None
+if search_cache_settings.enabled and search_cache_settings.prefetch_enabled:
+    search_prefetcher = SearchPrefetcher(
+        books_search_service, search_cache, search_cache_settings.max_prefetches)
 
 
 @router.post(
@@ -28,7 +60,8 @@ async def search_books(request: BookSearchRequest) -> BookSearchResponse:
     """Search books through Google Books API
 
     Args:
-        request (BookSearchRequest): request with query and max results
+        request (BookSearchRequest): request with query, page position and
+            size (may exceed one Google Books page)
 
     Raises:
         HTTPException: if the Google Books API returns an error
@@ -37,104 +70,96 @@ async def search_books(request: BookSearchRequest) -> BookSearchResponse:
     Returns:
         BookSearchResponse: list of search results
     """
+    page_size = request.page_size or request.max_results
     logger.info(
         "Searching books",
         query=request.query,
-        max_results=request.max_results,
+        max_results=page_size,
+        start_index=request.start_index,
     )
 
-    params = {
-        "q": request.query,
-        "maxResults": request.max_results,
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                api_books_settings.API_BOOKS_URL,
-                params=params,
-                headers={"X-API-Key": api_books_settings.API_BOOKS_KEY},
-            )
-    except httpx.RequestError as exc:
-        logger.error(
-            "Error connecting to Google Books API",
-            query=request.query,
-            error=str(exc),
-            exc_info=True,
-        )
+        items = await books_search_service.search(request.query, page_size, request.start_index)
+    except BooksApiError as exc:
         raise HTTPException(
-            status_code=502,
-            detail=f"Error Google Books API: {exc}",
+            status_code=exc.status_code,
+            detail=exc.detail,
         ) from exc
 
-    if response.status_code != 200:
-        logger.warning(
-            "Google Books API returned error",
-            query=request.query,
-            status_code=response.status_code,
-        )
-        raise HTTPException(
-            status_code=response.status_code,
-            detail="Google Books API returned an Exception",
-        )
-
-    data = response.json()
-    items = []
-
-    for item in data.get("items", []):
-        volume_info = item.get("volumeInfo", {}) or {}
-        title = volume_info.get("title") or ""
-        authors = volume_info.get("authors") or []
-        code = item.get("id") or ""
-
-        if not title:
-            continue
-
-        author = ", ".join(authors) if authors else ""
-
-        published = volume_info.get("publishedDate")
-
-        isbn = None
-        for identifier in volume_info.get("industryIdentifiers", []) or []:
-            id_type = identifier.get("type")
-            id_val = identifier.get("identifier")
-            if id_type == "ISBN_13" and id_val:
-                isbn = id_val
-                break
-            if id_type == "ISBN_10" and id_val and not isbn:
-                isbn = id_val
-
-        # Subjects / categories
-        subjects = volume_info.get("categories") or []
-
-        # Description
-        description = volume_info.get("description")
-
-        # Cover (thumbnail)
-        image_links = volume_info.get("imageLinks") or {}
-        cover = (
-            image_links.get("thumbnail")
-            or image_links.get("smallThumbnail")
-            or None
-        )
-
-        items.append(
-            BookSearchItem(
-                author=author,
-                title=title,
-                code=code,
-                published=published,
-                isbn=isbn,
-                subjects=subjects,
-                description=description,
-                cover=cover,
-            )
-        )
-
     logger.info(
         "Books search completed",
         query=request.query,
         items_found=len(items),
     )
 
-    return BookSearchResponse(items=items)
+    next_start_index = request.start_index + page_size if items else None
+    if request.prefetch_next and next_start_index is not None and search_prefetcher is not None:
+        search_prefetcher.schedule(request.query, page_size, next_start_index)
+
+    return BookSearchResponse(
+        items=items,
+        start_index=request.start_index,
+        next_start_index=next_start_index,
+    )
+
+
+@router.get("/search/cache/metrics")
+async def search_cache_metrics() -> Dict[str, Any]:
+    """Show search cache metrics
+
+    Returns:
+        dict: hits (memory and disk), misses, evictions, expirations, size
+            and next page prefetches
+    """
+    return {
+        **search_cache.metrics(),
+        "prefetch": search_prefetcher.metrics() if search_prefetcher is not None else None,
+    }
+
+
+@router.get("/catalog/metrics")
+async def book_catalog_metrics() -> Dict[str, Any]:
+    """Show local book catalog metrics
+
+    Returns:
+        dict: catalog size and searches answered locally or by the upstream
+    """
+    return local_catalog_search.metrics()
+
+
+@router.get("/search/coalescing/metrics")
+async def search_coalescing_metrics() -> Dict[str, Any]:
+    """Show how many searches joined an identical one in flight
+
+    Returns:
+        dict: calls, executions, coalesced calls and searches in flight
+    """
+    return books_search_flight.metrics()
+
+
+@router.get(
+    "/suggest",
+    response_model=BookSuggestResponse,
+    response_model_exclude_none=True,
+    summary="Suggest titles and authors for a typed prefix",
+    description="Typeahead over the books of the graph and previous search results, without calling Google Books",
+)
+async def suggest_books(
+    prefix: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(default=10, ge=1, le=50),
+) -> BookSuggestResponse:
+    """Suggest titles and authors starting with a prefix
+
+    Args:
+        prefix (str): typed text, matched at the start of any word
+        limit (int): max number of suggestions
+
+    Returns:
+        BookSuggestResponse: suggestions ranked by frequency and graph centrality
+    """
+    suggestions = await book_suggest.suggest(prefix, limit)
+    logger.debug("Books suggested", prefix=prefix, suggestions_count=len(suggestions))
+    return BookSuggestResponse(
+        prefix=prefix,
+        suggestions=[BookSuggestion(**suggestion) for suggestion in suggestions],
+    )
@@ -1,5 +1,6 @@
 # python
 import json
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -73,13 +74,18 @@ class BaseJsonStorage:
 
     def _save_json(self, data: Dict[str, Any]) -> None:
         """Generic method to save JSON data.
+
+        Data is written to a temporary file and atomically moved over the
+        target, so a crash mid-write never leaves a truncated file.
         
         Args:
             data (Dict[str, Any]): Data to save
         """
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.file_path)
 
             logger.info(
                 f"{self.entity_name} saved to storage",
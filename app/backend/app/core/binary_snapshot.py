@@ -0,0 +1,492 @@
+# python
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# project
+from app.core.graph_persistence import IGraphStorage, JsonGraphStorage
+from app.core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Compact binary graph snapshot format (little-endian):
+#
+#   header   magic b"BLGS", u16 format version, u16 reserved,
+#            u32 string count, u32 string blob length, u32 int count,
+#            u32 weight count, u32 extras length
+#   ends     u32 end of each string in the decoded blob, in characters
+#   strings  UTF-8 blob of all distinct strings, concatenated
+#   ints     int32 stream describing nodes and edges (see below)
+#   weights  float64 edge weights
+#   extras   JSON array of values that are neither strings, lists nor
+#            None/bool (numbers, nested dicts)
+#
+# Strings are length-delimited, so they may contain any character (format
+# version 1 separated them by NUL instead and is still read). Strings are
+# referenced by their index in the string table, so repeated
+# values such as authors and subjects are stored once and shared by all
+# nodes after loading. The index `string count` stands for None.
+#
+# Nodes are stored column-wise, grouped by "shape" (their tuple of property
+# keys), so most columns decode with a single C-level map over the string
+# table instead of a per-value Python loop:
+#
+#   n_nodes, n_shapes,
+#   per shape: n_rows, n_keys, key*, position*, id*, label*,
+#              per key: kind, column
+#   n_edges, source*, target*
+#
+# Column kinds: 0 - strings or None (one index per row); 1 - lists of
+# strings (row lengths followed by all items); 2 - anything else, one
+# tagged value per row: an index or -1 None, -2 True, -3 False,
+# -4 list (length and items follow), -5 extra (index into extras follows).
+#
+# Converter and startup benchmark:
+#   python -m app.core.binary_snapshot convert app/data/graph.json app/data/graph.blgs
+#   python -m app.core.binary_snapshot benchmark app/data/graph.json
+MAGIC = b"BLGS"
+FORMAT_VERSION = 2
+NUL_SEPARATED_VERSION = 1
+HEADER = struct.Struct("<4sHHIIIII")
+
+COLUMN_STRINGS = 0
+COLUMN_STRING_LISTS = 1
+COLUMN_TAGGED = 2
+
+TAG_NONE = -1
+TAG_TRUE = -2
+TAG_FALSE = -3
+TAG_LIST = -4
+TAG_EXTRA = -5
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a valid binary graph snapshot."""
+
+
+class _Encoder:
+    """Builds the string table, int stream and extras of a snapshot."""
+
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.ints = array("i")
+        self.weights = array("d")
+        self.extras: List[Any] = []
+        # Rows referencing None are patched once the string table is complete
+        self.none_positions: List[int] = []
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def string_or_none(self, value: Optional[str]) -> None:
+        if value is None:
+            self.none_positions.append(len(self.ints))
+            self.ints.append(0)
+        else:
+            self.ints.append(self.string(value))
+
+    def tagged(self, value: Any) -> None:
+        if isinstance(value, str):
+            self.ints.append(self.string(value))
+        elif value is None:
+            self.ints.append(TAG_NONE)
+        elif value is True:
+            self.ints.append(TAG_TRUE)
+        elif value is False:
+            self.ints.append(TAG_FALSE)
+        elif isinstance(value, (list, tuple)):
+            self.ints.extend((TAG_LIST, len(value)))
+            for item in value:
+                self.tagged(item)
+        else:
+            self.ints.extend((TAG_EXTRA, len(self.extras)))
+            self.extras.append(value)
+
+    def column(self, values: List[Any]) -> None:
+        if all(value is None or isinstance(value, str) for value in values):
+            self.ints.append(COLUMN_STRINGS)
+            for value in values:
+                self.string_or_none(value)
+        elif all(
+            isinstance(value, list) and all(isinstance(item, str) for item in value)
+            for value in values
+        ):
+            self.ints.append(COLUMN_STRING_LISTS)
+            self.ints.extend(len(value) for value in values)
+            for value in values:
+                self.ints.extend(self.string(item) for item in value)
+        else:
+            self.ints.append(COLUMN_TAGGED)
+            for value in values:
+                self.tagged(value)
+
+
+def encode_graph(graph_data: Dict[str, Any]) -> bytes:
+    """Encode graph data into the binary snapshot format.
+
+    Args:
+        graph_data (Dict[str, Any]): Graph data with 'nodes' and 'edges' keys
+
+    Returns:
+        bytes: Snapshot content
+    """
+    encoder = _Encoder()
+    nodes = graph_data.get("nodes", [])
+    edges = graph_data.get("edges", [])
+
+    shapes: Dict[Tuple[str, ...], List[int]] = {}
+    for position, node in enumerate(nodes):
+        keys = tuple(str(key) for key in (node.get("properties") or {}))
+        shapes.setdefault(keys, []).append(position)
+
+    encoder.ints.extend((len(nodes), len(shapes)))
+    for keys, positions in shapes.items():
+        rows = [nodes[position] for position in positions]
+        encoder.ints.extend((len(rows), len(keys)))
+        encoder.ints.extend(encoder.string(key) for key in keys)
+        encoder.ints.extend(positions)
+        encoder.ints.extend(encoder.string(str(node["id"])) for node in rows)
+        encoder.ints.extend(encoder.string(node.get("label") or "") for node in rows)
+        for key in keys:
+            encoder.column([node["properties"][key] for node in rows])
+
+    encoder.ints.append(len(edges))
+    encoder.ints.extend(encoder.string(str(edge["source"])) for edge in edges)
+    encoder.ints.extend(encoder.string(str(edge["target"])) for edge in edges)
+    encoder.weights.extend(float(edge.get("weight", 1.0)) for edge in edges)
+
+    none_index = len(encoder.strings)
+    for position in encoder.none_positions:
+        encoder.ints[position] = none_index
+
+    ends = array("I", accumulate(map(len, encoder.strings)))
+    blob = "".join(encoder.strings).encode("utf-8")
+    extras = json.dumps(encoder.extras, ensure_ascii=False).encode("utf-8")
+    if sys.byteorder == "big":
+        ends.byteswap()
+        encoder.ints.byteswap()
+        encoder.weights.byteswap()
+
+    return b"".join((
+        HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(encoder.strings), len(blob),
+                    len(encoder.ints), len(encoder.weights), len(extras)),
+        ends.tobytes(),
+        blob,
+        encoder.ints.tobytes(),
+        encoder.weights.tobytes(),
+        extras,
+    ))
+
+
+def _decode_tagged(ints: List[int], pos: int, strings: List[Any], extras: List[Any]) -> Tuple[Any, int]:
+    tag = ints[pos]
+    pos += 1
+    if tag >= 0:
+        return strings[tag], pos
+    if tag == TAG_NONE:
+        return None, pos
+    if tag == TAG_TRUE:
+        return True, pos
+    if tag == TAG_FALSE:
+        return False, pos
+    if tag == TAG_LIST:
+        length = ints[pos]
+        pos += 1
+        items = []
+        for _ in range(length):
+            item, pos = _decode_tagged(ints, pos, strings, extras)
+            items.append(item)
+        return items, pos
+    if tag == TAG_EXTRA:
+        return extras[ints[pos]], pos + 1
+    raise SnapshotFormatError(f"Unknown value tag: {tag}")
+
+
+def decode_graph(buffer: Any) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, str, float]]]:
+    """Decode snapshot content into networkx-ready node and edge tuples.
+
+    Args:
+        buffer: bytes-like snapshot content (e.g. an mmap)
+
+    Raises:
+        SnapshotFormatError: If the content is not a valid snapshot
+
+    Returns:
+        Tuple: (node_id, {"label", "properties"}) and (source, target, weight) lists
+    """
+    if len(buffer) < HEADER.size:
+        raise SnapshotFormatError("Snapshot is truncated")
+    magic, version, _, n_strings, blob_len, n_ints, n_weights, extras_len = \
+        HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise SnapshotFormatError("Not a binary graph snapshot")
+    if version not in (FORMAT_VERSION, NUL_SEPARATED_VERSION):
+        raise SnapshotFormatError(f"Unsupported snapshot version: {version}")
+
+    pos = HEADER.size
+    ends_len = n_strings * 4 if version == FORMAT_VERSION else 0
+    expected = pos + ends_len + blob_len + n_ints * 4 + n_weights * 8 + extras_len
+    if len(buffer) < expected:
+        raise SnapshotFormatError("Snapshot is truncated")
+
+    text = bytes(buffer[pos + ends_len:pos + ends_len + blob_len]).decode("utf-8")
+    strings: List[Any]
+    if version == NUL_SEPARATED_VERSION:
+        strings = text.split("\0") if n_strings else []
+    else:
+        ends = array("I")
+        ends.frombytes(buffer[pos:pos + ends_len])
+        if sys.byteorder == "big":
+            ends.byteswap()
+        starts = [0, *ends[:-1]]
+        strings = list(map(text.__getitem__, map(slice, starts, ends)))
+        pos += ends_len
+    # Index n_strings stands for None
+    strings.append(None)
+    lookup = strings.__getitem__
+    pos += blob_len
+    int_array = array("i")
+    int_array.frombytes(buffer[pos:pos + n_ints * 4])
+    pos += n_ints * 4
+    weight_array = array("d")
+    weight_array.frombytes(buffer[pos:pos + n_weights * 8])
+    pos += n_weights * 8
+    extras = json.loads(bytes(buffer[pos:pos + extras_len])) if extras_len else []
+    if sys.byteorder == "big":
+        int_array.byteswap()
+        weight_array.byteswap()
+
+    ints = int_array.tolist()
+    n_nodes, n_shapes = ints[0], ints[1]
+    cursor = 2
+    nodes: List[Any] = [None] * n_nodes
+    for _ in range(n_shapes):
+        n_rows, n_keys = ints[cursor], ints[cursor + 1]
+        cursor += 2
+        keys = list(map(lookup, ints[cursor:cursor + n_keys]))
+        cursor += n_keys
+        positions = ints[cursor:cursor + n_rows]
+        cursor += n_rows
+        ids = map(lookup, ints[cursor:cursor + n_rows])
+        cursor += n_rows
+        labels = map(lookup, ints[cursor:cursor + n_rows])
+        cursor += n_rows
+
+        columns = []
+        for _ in range(n_keys):
+            kind = ints[cursor]
+            cursor += 1
+            if kind == COLUMN_STRINGS:
+                columns.append(list(map(lookup, ints[cursor:cursor + n_rows])))
+                cursor += n_rows
+            elif kind == COLUMN_STRING_LISTS:
+                lengths = ints[cursor:cursor + n_rows]
+                cursor += n_rows
+                flat = list(map(lookup, ints[cursor:cursor + sum(lengths)]))
+                cursor += len(flat)
+                column = []
+                offset = 0
+                for length in lengths:
+                    column.append(flat[offset:offset + length])
+                    offset += length
+                columns.append(column)
+            elif kind == COLUMN_TAGGED:
+                column = []
+                for _ in range(n_rows):
+                    value, cursor = _decode_tagged(ints, cursor, strings, extras)
+                    column.append(value)
+                columns.append(column)
+            else:
+                raise SnapshotFormatError(f"Unknown column kind: {kind}")
+
+        rows = zip(*columns) if columns else ((),) * n_rows
+        for position, node_id, label, row in zip(positions, ids, labels, rows):
+            nodes[position] = (node_id, {"label": label, "properties": dict(zip(keys, row))})
+
+    n_edges = ints[cursor]
+    cursor += 1
+    sources = map(lookup, ints[cursor:cursor + n_edges])
+    targets = map(lookup, ints[cursor + n_edges:cursor + 2 * n_edges])
+    edges = list(zip(sources, targets, weight_array.tolist()))
+    return nodes, edges
+
+
+class BinaryGraphStorage(IGraphStorage):
+    """Graph storage in the compact binary snapshot format.
+
+    The snapshot is read through a memory map. `load_graph_tuples` returns
+    networkx-ready tuples for bulk insertion without intermediate dicts.
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[Path] = None,
+        legacy_json_path: Optional[Path] = None,
+    ) -> None:
+        """Initialize binary storage.
+
+        Args:
+            file_path (Path, optional): Path to snapshot file.
+                Defaults to app/backend/app/data/graph.blgs
+            legacy_json_path (Path, optional): JSON graph file imported when
+                the snapshot does not exist yet, so switching backends keeps the data
+        """
+        if file_path is None:
+            file_path = Path(__file__).parent.parent / "data" / "graph.blgs"
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if (
+            not self.file_path.exists()
+            and legacy_json_path is not None
+            and Path(legacy_json_path).exists()
+        ):
+            graph_data = JsonGraphStorage(legacy_json_path).load_graph()
+            if graph_data.get("nodes"):
+                self.save_graph(graph_data)
+                logger.info(
+                    "Graph imported into binary snapshot",
+                    path=str(self.file_path),
+                    source=str(legacy_json_path),
+                )
+
+    def load_graph_tuples(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, str, float]]]:
+        """Load snapshot as (node_id, attributes) and (source, target, weight) tuples."""
+        if not self.file_path.exists() or self.file_path.stat().st_size == 0:
+            logger.info(
+                "Graph snapshot does not exist, returning empty value",
+                path=str(self.file_path),
+            )
+            return [], []
+        with open(self.file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                nodes, edges = decode_graph(mapped)
+        logger.info(
+            "Graph snapshot loaded",
+            path=str(self.file_path),
+            nodes_count=len(nodes),
+            edges_count=len(edges),
+        )
+        return nodes, edges
+
+    def load_graph(self) -> Dict[str, Any]:
+        """Load graph data from the snapshot.
+
+        Returns:
+            Dict[str, Any]: Graph data with 'nodes' and 'edges' keys
+        """
+        nodes, edges = self.load_graph_tuples()
+        return {
+            "nodes": [{"id": node_id, **attributes} for node_id, attributes in nodes],
+            "edges": [
+                {"source": source, "target": target, "weight": weight}
+                for source, target, weight in edges
+            ],
+        }
+
+    def save_graph(self, graph_data: Dict[str, Any]) -> None:
+        """Save graph data as a binary snapshot (atomically).
+
+        Args:
+            graph_data (Dict[str, Any]): Graph data with 'nodes' and 'edges' keys
+
+        Raises:
+            IOError: If write operation fails
+        """
+        content = encode_graph(graph_data)
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self.file_path)
+        except IOError as e:
+            logger.error(
+                "Failed to save graph snapshot",
+                path=str(self.file_path),
+                error=str(e),
+            )
+            raise
+        logger.info(
+            "Graph snapshot saved",
+            path=str(self.file_path),
+            size_bytes=len(content),
+        )
+
+
+def convert_json_to_binary(json_path: Path, binary_path: Path) -> Tuple[int, int]:
+    """Convert a JSON graph file into a binary snapshot.
+
+    Returns:
+        Tuple[int, int]: Sizes of the JSON and binary files in bytes
+    """
+    graph_data = JsonGraphStorage(json_path).load_graph()
+    BinaryGraphStorage(binary_path).save_graph(graph_data)
+    return json_path.stat().st_size, binary_path.stat().st_size
+
+
+def benchmark_startup(json_path: Path, repeat: int = 3) -> Dict[str, Any]:
+    """Compare cold-start load time of the JSON file and its binary snapshot.
+
+    Each run loads the file and hydrates a fresh GraphManager, which is
+    what happens at application startup.
+
+    Returns:
+        Dict[str, Any]: Best load times in seconds and file sizes
+    """
+    # Imported here to avoid a circular import at module load
+    from app.core.graph import GraphManager
+    from app.core.graph_persistence import GraphPersistenceService
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        binary_path = Path(tmp_dir) / "graph.blgs"
+        json_size, binary_size = convert_json_to_binary(json_path, binary_path)
+        results: Dict[str, Any] = {"json_bytes": json_size, "binary_bytes": binary_size}
+        for name, storage in (
+            ("json", JsonGraphStorage(json_path)),
+            ("binary", BinaryGraphStorage(binary_path)),
+        ):
+            timings = []
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                GraphManager(persistence_service=GraphPersistenceService(storage))
+                timings.append(time.perf_counter() - start_time)
+            results[f"{name}_seconds"] = min(timings)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Binary graph snapshot tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser("convert", help="Convert graph.json to a binary snapshot")
+    convert_parser.add_argument("json_path", type=Path)
+    convert_parser.add_argument("binary_path", type=Path)
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="Compare startup time of both formats")
+    benchmark_parser.add_argument("json_path", type=Path)
+    benchmark_parser.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args()
+    if args.command == "convert":
+        json_size, binary_size = convert_json_to_binary(args.json_path, args.binary_path)
+        print(f"{args.json_path} ({json_size} bytes) -> {args.binary_path} ({binary_size} bytes)")
+    else:
+        results = benchmark_startup(args.json_path, args.repeat)
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
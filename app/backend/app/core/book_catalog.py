@@ -0,0 +1,415 @@
+# python
+import asyncio
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# project
+from app.core.books_search_service import BooksApiError, IBooksSearchService
+from app.core.config import BookCatalogSettings
+from app.core.graph import normalize_isbn, normalize_text
+from app.core.graph_search import tokenize
+from app.core.logging import get_logger
+from app.schemas.books_search import BookSearchItem
+
+
+logger = get_logger(__name__)
+
+SEARCH_FALLBACKS = ("partial", "empty", "never")
+ISBN_QUERY_PREFIX = "isbn:"
+
+
+class SqliteBookCatalogStore:
+    """On-disk copy of the book catalog, one row per book.
+
+    `seen` orders the rows from least to most recently seen, so the catalog
+    is restored with its eviction order. The database is only opened (and
+    created) on first use, not when the store is constructed.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS books (
+            code TEXT PRIMARY KEY,
+            seen INTEGER NOT NULL,
+            item TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, file_path: Optional[Path] = None) -> None:
+        """Initialize the store.
+
+        Args:
+            file_path (Path, optional): Path to the database file.
+                Defaults to app/backend/app/data/book_catalog.sqlite3
+        """
+        if file_path is None:
+            file_path = Path(__file__).parent.parent / "data" / "book_catalog.sqlite3"
+        self.file_path = Path(file_path)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (lock must be held)."""
+        if self._connection is None:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.file_path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self.SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def load(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """(seen, item) of all books, least recently seen first."""
+        with self._lock:
+            rows = self._connect().execute("SELECT seen, item FROM books ORDER BY seen").fetchall()
+        return [(seen, json.loads(item)) for seen, item in rows]
+
+    def write(self, upserts: List[Tuple[str, int, Dict[str, Any]]], deletes: List[str]) -> None:
+        """Apply added or refreshed (code, seen, item) rows and deleted codes at once."""
+        rows = [
+            (code, seen, json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+            for code, seen, item in upserts
+        ]
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO books (code, seen, item) VALUES (?, ?, ?)", rows)
+                connection.executemany(
+                    "DELETE FROM books WHERE code = ?", [(code,) for code in deletes])
+                connection.execute("COMMIT")
+            except sqlite3.Error:
+                connection.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        """Close the database; a later call opens it again."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class BookCatalog:
+    """Books seen in search results, keyed by Google Books code.
+
+    Bounded: once `max_size` books are held, the least recently seen ones
+    are evicted. `version` changes with every modification, so consumers
+    can cache data derived from the catalog. Books are also indexed by
+    ISBN, by title and by the words of their title and author, so they can
+    be resolved and searched without the books API. With a store, changes
+    are written there by `persist` and restored by `load`.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, store: Optional[SqliteBookCatalogStore] = None):
+        self._max_size = max_size or BookCatalogSettings().max_size
+        self._store = store
+        self._books: "OrderedDict[str, BookSearchItem]" = OrderedDict()
+        self._version = 0
+        # code -> position in the order books were seen, higher is more recent
+        self._seen: Dict[str, int] = {}
+        self._sequence = 0
+        self._by_isbn: Dict[str, str] = {}
+        self._by_title: Dict[str, Set[str]] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+        # Changes not written to the store yet
+        self._upserts: Set[str] = set()
+        self._deletes: Set[str] = set()
+        self._persist_lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def add_many(self, items: Iterable[BookSearchItem]) -> None:
+        """Add or refresh books."""
+        changed = False
+        for item in items:
+            if not item.code:
+                continue
+            previous = self._books.get(item.code)
+            if previous != item:
+                if previous is not None:
+                    self._unindex(previous)
+                self._books[item.code] = item
+                self._index(item)
+                changed = True
+            self._books.move_to_end(item.code)
+            self._sequence += 1
+            self._seen[item.code] = self._sequence
+            if self._store is not None:
+                self._upserts.add(item.code)
+                self._deletes.discard(item.code)
+        if self._evict():
+            changed = True
+        if changed:
+            self._version += 1
+
+    def _evict(self) -> bool:
+        evicted = False
+        while len(self._books) > self._max_size:
+            code, item = self._books.popitem(last=False)
+            self._unindex(item)
+            del self._seen[code]
+            if self._store is not None:
+                self._upserts.discard(code)
+                self._deletes.add(code)
+            evicted = True
+        return evicted
+
+    def _index(self, item: BookSearchItem) -> None:
+        isbn = normalize_isbn(item.isbn)
+        if isbn:
+            self._by_isbn[isbn] = item.code
+        title = normalize_text(item.title)
+        if title:
+            self._by_title.setdefault(title, set()).add(item.code)
+        for token in self._tokens(item):
+            self._by_token.setdefault(token, set()).add(item.code)
+
+    def _unindex(self, item: BookSearchItem) -> None:
+        isbn = normalize_isbn(item.isbn)
+        if isbn and self._by_isbn.get(isbn) == item.code:
+            del self._by_isbn[isbn]
+        title = normalize_text(item.title)
+        if title:
+            self._discard(self._by_title, title, item.code)
+        for token in self._tokens(item):
+            self._discard(self._by_token, token, item.code)
+
+    @staticmethod
+    def _tokens(item: BookSearchItem) -> Set[str]:
+        return set(tokenize(item.title)) | set(tokenize(item.author))
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, code: str) -> None:
+        codes = index.get(key)
+        if codes is not None:
+            codes.discard(code)
+            if not codes:
+                del index[key]
+
+    def get(self, code: str) -> Optional[BookSearchItem]:
+        return self._books.get(code)
+
+    def get_by_isbn(self, isbn: str) -> Optional[BookSearchItem]:
+        code = self._by_isbn.get(normalize_isbn(isbn) or "")
+        return self._books.get(code) if code is not None else None
+
+    def find(
+        self,
+        *,
+        code: Optional[str] = None,
+        isbn: Optional[str] = None,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+    ) -> Optional[BookSearchItem]:
+        """Resolve a book by code, else ISBN, else title (and author, if given).
+
+        Returns:
+            Optional[BookSearchItem]: The book, the most recently seen one
+                if several share the title; None if not in the catalog
+        """
+        if code and code in self._books:
+            return self._books[code]
+        if isbn:
+            item = self.get_by_isbn(isbn)
+            if item is not None:
+                return item
+        codes = self._by_title.get(normalize_text(title) or "")
+        if not codes:
+            return None
+        wanted_author = normalize_text(author)
+        matches = [
+            self._books[code] for code in codes
+            if wanted_author is None or wanted_author in self._authors(self._books[code])
+        ]
+        return max(matches, key=lambda item: self._seen[item.code], default=None)
+
+    @staticmethod
+    def _authors(item: BookSearchItem) -> Set[str]:
+        authors = {normalize_text(name) for name in item.author.split(",")}
+        authors.add(normalize_text(item.author))
+        return authors
+
+    def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        """Books whose title and author contain all words of a query.
+
+        Books with all the words in their title come first, then the most
+        recently seen. An "isbn:" query looks the ISBN up.
+        """
+        if query.strip().lower().startswith(ISBN_QUERY_PREFIX):
+            item = self.get_by_isbn(query.strip()[len(ISBN_QUERY_PREFIX):])
+            return [item] if item is not None and start_index == 0 else []
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+        postings = sorted((self._by_token.get(token, set()) for token in tokens), key=len)
+        codes = set(postings[0]).intersection(*postings[1:])
+        ranked = sorted(codes, key=lambda code: (
+            not tokens.issubset(tokenize(self._books[code].title)),
+            -self._seen[code],
+        ))
+        return [self._books[code] for code in ranked[start_index:start_index + max_results]]
+
+    def items(self) -> List[BookSearchItem]:
+        """All books, least recently seen first."""
+        return list(self._books.values())
+
+    async def load(self) -> None:
+        """Restore the books of the store (if any)."""
+        if self._store is None:
+            return
+        rows = await asyncio.to_thread(self._store.load)
+        for seen, data in rows:
+            item = BookSearchItem.model_validate(data)
+            self._books[item.code] = item
+            self._index(item)
+            self._seen[item.code] = seen
+            self._sequence = max(self._sequence, seen)
+        self._evict()
+        self._version += 1
+        logger.info("Book catalog loaded", books_count=len(self._books))
+
+    async def persist(self) -> None:
+        """Write the changes since the last call to the store (if any)."""
+        if self._store is None:
+            return
+        # Serialized: writes of older changes must not land after newer ones
+        async with self._persist_lock:
+            if not self._upserts and not self._deletes:
+                return
+            upserts = [
+                (code, self._seen[code], self._books[code].model_dump()) for code in self._upserts
+            ]
+            deletes = list(self._deletes)
+            self._upserts, self._deletes = set(), set()
+            try:
+                await asyncio.to_thread(self._store.write, upserts, deletes)
+            except sqlite3.Error as e:
+                logger.warning("Failed to write book catalog", error=str(e))
+                # Retried by the next call, unless changed again meanwhile
+                for code, _, _ in upserts:
+                    if code in self._books and code not in self._deletes:
+                        self._upserts.add(code)
+                for code in deletes:
+                    if code not in self._books and code not in self._upserts:
+                        self._deletes.add(code)
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+
+
+class CatalogingBooksSearchService(IBooksSearchService):
+    """Search service decorator recording every result in a catalog."""
+
+    def __init__(self, search_service: IBooksSearchService, catalog: BookCatalog):
+        self._search_service = search_service
+        self._catalog = catalog
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        items = await self._search_service.search(query, max_results, start_index)
+        self._catalog.add_many(items)
+        await self._catalog.persist()
+        return items
+
+
+class LocalCatalogBooksSearchService(IBooksSearchService):
+    """Search service decorator answering from the book catalog.
+
+    With `local_search`, a search is answered from the catalog when it has
+    enough results (see BookCatalogSettings.search_fallback); otherwise the
+    upstream is asked, for at most `fallback_timeout` seconds when the local
+    results could answer instead. A late upstream search still completes in
+    the background, so its results reach the catalog. Whatever the mode,
+    local results answer when the upstream fails.
+    """
+
+    def __init__(
+        self,
+        search_service: IBooksSearchService,
+        catalog: BookCatalog,
+        settings: Optional[BookCatalogSettings] = None,
+    ):
+        self._search_service = search_service
+        self._catalog = catalog
+        self._settings = settings or BookCatalogSettings()
+        if self._settings.search_fallback not in SEARCH_FALLBACKS:
+            raise ValueError(f"Unknown book catalog search fallback: {self._settings.search_fallback}")
+        self._background: Set[asyncio.Task] = set()
+        self._metrics = {"local": 0, "upstream": 0, "upstream_timeouts": 0, "upstream_errors": 0}
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        local: List[BookSearchItem] = []
+        if self._settings.local_search:
+            local = self._catalog.search(query, max_results, start_index)
+            fallback = self._settings.search_fallback
+            if (
+                len(local) >= max_results
+                or fallback == "never"
+                or (fallback == "empty" and local)
+            ):
+                self._metrics["local"] += 1
+                return local
+
+        upstream = asyncio.create_task(self._search_service.search(query, max_results, start_index))
+        try:
+            if local:
+                items = await asyncio.wait_for(asyncio.shield(upstream), self._settings.fallback_timeout)
+            else:
+                items = await upstream
+        except asyncio.TimeoutError:
+            self._metrics["upstream_timeouts"] += 1
+            self._background.add(upstream)
+            upstream.add_done_callback(self._finish_background)
+            logger.info("Books search answered locally, upstream too slow", query=query)
+            return local
+        except BooksApiError as exc:
+            local = local or self._catalog.search(query, max_results, start_index)
+            if not local:
+                raise
+            self._metrics["upstream_errors"] += 1
+            logger.warning(
+                "Books search answered locally, upstream failed",
+                query=query,
+                status_code=exc.status_code,
+            )
+            return local
+        self._metrics["upstream"] += 1
+        return items
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.info("Background books search failed", error=str(task.exception()))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self._metrics,
+            "books_count": len(self._catalog),
+            "version": self._catalog.version,
+            "local_search": self._settings.local_search,
+            "search_fallback": self._settings.search_fallback,
+        }
+
+
+def create_book_catalog(settings: Optional[BookCatalogSettings] = None) -> BookCatalog:
+    """Create the book catalog, with its store if persistence is enabled."""
+    settings = settings or BookCatalogSettings()
+    store = None
+    if settings.persist:
+        store = SqliteBookCatalogStore(Path(settings.path) if settings.path else None)
+    return BookCatalog(settings.max_size, store)
+
+
+book_catalog = create_book_catalog()
@@ -0,0 +1,241 @@
+# python
+import asyncio
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+# project
+from app.core.book_catalog import BookCatalog, book_catalog
+from app.core.config import BookSuggestSettings
+from app.core.graph import GraphManager, graph_instance
+from app.core.graph_analytics import GraphAnalyticsService, graph_analytics
+from app.core.graph_search import tokenize
+from app.core.logging import get_logger
+from app.schemas.books_search import BookSearchItem
+
+# 3rd party
+import numpy as np
+
+
+logger = get_logger(__name__)
+
+# Sorts after every character, closes the key range of a prefix
+KEY_RANGE_END = "\U0010ffff"
+
+# (kind, normalized text) of a suggestion
+SuggestionKey = Tuple[str, str]
+
+
+def suggestion_key(text: str) -> str:
+    """Normalized form of suggested text and prefixes: folded words, single spaces."""
+    return " ".join(tokenize(text))
+
+
+class PrefixIndex:
+    """Immutable sorted-array prefix index over suggestions.
+
+    Each suggestion is indexed under its normalized text and under the rest
+    of it from each of its first words on, so "potter" finds
+    "Harry Potter". A prefix is a binary search for its key range; the
+    suggestions in the range are then ranked by score. Very short prefixes
+    have the largest ranges, so their best suggestions are ranked once, when
+    the index is built.
+    """
+
+    def __init__(
+        self,
+        suggestions: List[Tuple[str, str, float, Optional[str]]],
+        max_words: int,
+        precomputed_length: int,
+        max_limit: int,
+    ):
+        """
+        Args:
+            suggestions (List[Tuple[str, str, float, Optional[str]]]):
+                (kind, text, score, code) of each suggestion
+            max_words (int): Suggestions are found by prefixes of their
+                text starting at any of their first `max_words` words
+            precomputed_length (int): Prefixes up to this length are ranked
+                at build time
+            max_limit (int): Max number of suggestions per lookup
+        """
+        self.suggestions = suggestions
+        self.scores = np.array([suggestion[2] for suggestion in suggestions])
+        self.max_limit = max_limit
+        keys: List[Tuple[str, int]] = []
+        for position, (_, text, _, _) in enumerate(suggestions):
+            words = suggestion_key(text).split(" ")
+            for start in range(min(len(words), max_words)):
+                keys.append((" ".join(words[start:]), position))
+        keys.sort()
+        self.keys = [key for key, _ in keys]
+        self.positions = np.array([position for _, position in keys], dtype=np.int64)
+
+        self._precomputed_length = precomputed_length
+        self._precomputed: Dict[str, List[int]] = {}
+        for length in range(1, precomputed_length + 1):
+            # Keys sharing a prefix are contiguous; shorter keys have none of this length
+            start = 0
+            while start < len(self.keys):
+                prefix = self.keys[start][:length]
+                if len(prefix) < length:
+                    start += 1
+                    continue
+                end = start + 1
+                while end < len(self.keys) and self.keys[end][:length] == prefix:
+                    end += 1
+                self._precomputed[prefix] = self._rank(start, end, max_limit)
+                start = end
+
+    def __len__(self) -> int:
+        return len(self.suggestions)
+
+    def lookup(self, prefix: str, limit: int) -> List[int]:
+        """Positions of the best suggestions matching a normalized prefix."""
+        limit = min(limit, self.max_limit)
+        if len(prefix) <= self._precomputed_length:
+            return self._precomputed.get(prefix, [])[:limit]
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + KEY_RANGE_END, lo=start)
+        return self._rank(start, end, limit)
+
+    def _rank(self, start: int, end: int, limit: int) -> List[int]:
+        """Best suggestions of a key range, highest score first."""
+        positions = np.unique(self.positions[start:end])
+        if len(positions) > limit:
+            positions = positions[np.argpartition(-self.scores[positions], limit - 1)[:limit]]
+        return positions[np.argsort(-self.scores[positions], kind="stable")].tolist()
+
+
+class BookSuggestService:
+    """Typeahead suggestions of titles and authors, answered locally.
+
+    Suggestions come from the books of the graph and the books seen in
+    search results. Each one is scored by how often it occurs (graph books
+    count more) plus the PageRank of its graph books, scaled so that an
+    average book adds 1. The index is rebuilt on a worker thread when the
+    graph, the catalog or the PageRank changed; meanwhile the previous one
+    keeps answering.
+    """
+
+    def __init__(
+        self,
+        graph_manager: GraphManager,
+        catalog: BookCatalog,
+        analytics: GraphAnalyticsService,
+        settings: Optional[BookSuggestSettings] = None,
+    ):
+        self._graph_manager = graph_manager
+        self._catalog = catalog
+        self._analytics = analytics
+        self._settings = settings or BookSuggestSettings()
+        self._index: Optional[PrefixIndex] = None
+        self._index_key: Optional[Tuple[int, int, int]] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    async def suggest(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """Suggest titles and authors starting with a prefix (at any word).
+
+        Args:
+            prefix (str): Typed text
+            limit (int): Max number of suggestions
+
+        Returns:
+            List[Dict[str, Any]]: kind, text, score and (for titles) code of
+                the best suggestions
+        """
+        key = suggestion_key(prefix)
+        if not key:
+            return []
+        index = await self._get_index()
+        return [
+            {"kind": kind, "text": text, "score": round(score, 4), "code": code}
+            for kind, text, score, code in (
+                index.suggestions[position] for position in index.lookup(key, limit))
+        ]
+
+    async def _get_index(self) -> PrefixIndex:
+        pagerank = self._analytics.peek("pagerank") if self._graph_manager.is_ready else None
+        index_key = (
+            self._graph_manager.version,
+            self._catalog.version,
+            pagerank["version"] if pagerank is not None else -1,
+        )
+        if index_key != self._index_key and (self._rebuild_task is None or self._rebuild_task.done()):
+            self._rebuild_task = asyncio.create_task(self._rebuild(index_key, pagerank))
+            self._rebuild_task.add_done_callback(self._log_failure)
+        if self._index is None:
+            # Shielded: the first build is shared by all waiting requests
+            await asyncio.shield(self._rebuild_task)
+        return self._index
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            logger.error(
+                "Book suggestion index build failed",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+
+    async def _rebuild(self, index_key: Tuple[int, int, int], pagerank: Optional[Dict[str, Any]]) -> None:
+        start_time = time.perf_counter()
+        # Taken on the loop, where the graph and the catalog change
+        nodes = list(self._graph_manager.iter_node_data()) if self._graph_manager.is_ready else []
+        items = self._catalog.items()
+        centrality = pagerank["values"] if pagerank is not None else {}
+        self._index = await asyncio.to_thread(self._build, nodes, items, centrality)
+        self._index_key = index_key
+        logger.info(
+            "Book suggestion index built",
+            suggestions_count=len(self._index),
+            keys_count=len(self._index.keys),
+            build_time=f"{time.perf_counter() - start_time:.4f}s",
+        )
+
+    def _build(
+        self,
+        nodes: List[Dict[str, Any]],
+        items: List[BookSearchItem],
+        centrality: Dict[str, float],
+    ) -> PrefixIndex:
+        # key -> [text, score, code]
+        entries: Dict[SuggestionKey, List[Any]] = {}
+
+        def add(kind: str, text: Any, score: float, code: Optional[str]) -> None:
+            if not isinstance(text, str):
+                return
+            key = suggestion_key(text)
+            if not key:
+                return
+            entry = entries.get((kind, key))
+            if entry is None:
+                entries[(kind, key)] = [text.strip(), score, code]
+            else:
+                entry[1] += score
+                entry[2] = entry[2] or code
+
+        graph_weight = self._settings.graph_weight
+        # PageRank sums to 1 over all nodes: scaled, an average node adds 1
+        centrality_scale = self._settings.centrality_weight * len(nodes)
+        for node in nodes:
+            properties = node.get("properties") or {}
+            score = graph_weight + centrality_scale * centrality.get(node["id"], 0.0)
+            add("title", properties.get("title") or node.get("label"), score, properties.get("code"))
+            for author in str(properties.get("author") or "").split(","):
+                add("author", author, score, None)
+        for item in items:
+            add("title", item.title, 1.0, item.code)
+            for author in item.author.split(","):
+                add("author", author, 1.0, None)
+
+        return PrefixIndex(
+            [(kind, text, score, code) for (kind, _), (text, score, code) in entries.items()],
+            max_words=self._settings.max_words,
+            precomputed_length=self._settings.precomputed_prefix_length,
+            max_limit=self._settings.max_limit,
+        )
+
+
+book_suggest = BookSuggestService(graph_instance, book_catalog, graph_analytics)
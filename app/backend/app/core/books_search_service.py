@@ -0,0 +1,211 @@
+# python
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# project
+from app.core.config import ApiBooksSettings
+from app.core.http_clients import HttpClientRegistry, http_clients
+from app.core.logging import get_logger
+from app.schemas.books_search import BookSearchItem
+
+# 3rd party
+import httpx
+
+
+class BooksApiError(Exception):
+    """Error returned by (or while reaching) the books API."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class IBooksSearchService(ABC):
+    """Interface for book search providers"""
+
+    @abstractmethod
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        """Search books.
+
+        Args:
+            query (str): Search query
+            max_results (int): Max number of results
+            start_index (int): Position of the first result
+
+        Raises:
+            BooksApiError: If the upstream API fails
+
+        Returns:
+            List[BookSearchItem]: Found books
+        """
+        raise NotImplementedError
+
+
+class GoogleBooksSearchService(IBooksSearchService):
+    """Book search through Google Books API
+
+    Google Books returns at most `max_page_size` results per request, so
+    larger searches fetch consecutive pages concurrently (at most
+    `max_parallel_pages` at once) and merge them, dropping books repeated
+    across pages.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[ApiBooksSettings] = None,
+        timeout: float = 10.0,
+        clients: Optional[HttpClientRegistry] = None,
+    ) -> None:
+        self._settings = settings or ApiBooksSettings()
+        self._timeout = timeout
+        self._logger = get_logger(__name__)
+        self._clients = clients or http_clients
+        self._clients.register(
+            "google_books",
+            timeout=timeout,
+            prewarm_url=self._settings.API_BOOKS_URL,
+        )
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        page_size = self._settings.max_page_size
+        if max_results <= page_size:
+            return dedupe_items(await self._fetch_page(query, max_results, start_index))
+
+        semaphore = asyncio.Semaphore(self._settings.max_parallel_pages)
+
+        async def fetch(page_start: int) -> List[BookSearchItem]:
+            async with semaphore:
+                return await self._fetch_page(
+                    query, min(page_size, start_index + max_results - page_start), page_start)
+
+        pages = await asyncio.gather(*(
+            fetch(page_start)
+            for page_start in range(start_index, start_index + max_results, page_size)
+        ))
+        items = dedupe_items(item for page in pages for item in page)
+        self._logger.info(
+            "Google Books pages merged",
+            query=query,
+            pages_count=len(pages),
+            items_count=len(items),
+        )
+        return items
+
+    async def _fetch_page(self, query: str, max_results: int, start_index: int) -> List[BookSearchItem]:
+        params = {
+            "q": query,
+            "maxResults": max_results,
+            "startIndex": start_index,
+        }
+
+        try:
+            response = await self._clients.client("google_books").get(
+                self._settings.API_BOOKS_URL,
+                params=params,
+                headers={"X-API-Key": self._settings.API_BOOKS_KEY},
+            )
+        except httpx.RequestError as exc:
+            self._logger.error(
+                "Error connecting to Google Books API",
+                query=query,
+                error=str(exc),
+                exc_info=True,
+            )
+            raise BooksApiError(
+                status_code=502,
+                detail=f"Error Google Books API: {exc}",
+            ) from exc
+
+        if response.status_code != 200:
+            self._logger.warning(
+                "Google Books API returned error",
+                query=query,
+                status_code=response.status_code,
+            )
+            raise BooksApiError(
+                status_code=response.status_code,
+                detail="Google Books API returned an Exception",
+            )
+
+        return parse_volumes(response.json())
+
+
+def dedupe_items(items: Iterable[BookSearchItem]) -> List[BookSearchItem]:
+    """Drop repeated books (same code or ISBN), keeping the first occurrence."""
+    seen_codes: Set[str] = set()
+    seen_isbns: Set[str] = set()
+    unique = []
+    for item in items:
+        if item.code in seen_codes or (item.isbn and item.isbn in seen_isbns):
+            continue
+        seen_codes.add(item.code)
+        if item.isbn:
+            seen_isbns.add(item.isbn)
+        unique.append(item)
+    return unique
+
+
+def parse_volumes(data: Dict[str, Any]) -> List[BookSearchItem]:
+    """Convert a Google Books volumes response into search items.
+
+    Args:
+        data (Dict[str, Any]): Decoded Google Books response
+
+    Returns:
+        List[BookSearchItem]: Items with a title
+    """
+    items = []
+
+    for item in data.get("items", []):
+        volume_info = item.get("volumeInfo", {}) or {}
+        title = volume_info.get("title") or ""
+        authors = volume_info.get("authors") or []
+        code = item.get("id") or ""
+
+        if not title:
+            continue
+
+        author = ", ".join(authors) if authors else ""
+
+        published = volume_info.get("publishedDate")
+
+        isbn = None
+        for identifier in volume_info.get("industryIdentifiers", []) or []:
+            id_type = identifier.get("type")
+            id_val = identifier.get("identifier")
+            if id_type == "ISBN_13" and id_val:
+                isbn = id_val
+                break
+            if id_type == "ISBN_10" and id_val and not isbn:
+                isbn = id_val
+
+        # Subjects / categories
+        subjects = volume_info.get("categories") or []
+
+        # Description
+        description = volume_info.get("description")
+
+        # Cover (thumbnail)
+        image_links = volume_info.get("imageLinks") or {}
+        cover = (
+            image_links.get("thumbnail")
+            or image_links.get("smallThumbnail")
+            or None
+        )
+
+        items.append(
+            BookSearchItem(
+                author=author,
+                title=title,
+                code=code,
+                published=published,
+                isbn=isbn,
+                subjects=subjects,
+                description=description,
+                cover=cover,
+            )
+        )
+
+    return items
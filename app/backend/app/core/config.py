@@ -1,5 +1,6 @@
 # python
 import os
+from typing import Dict, List, Optional
 
 # 3rd party
 from pydantic import BaseModel
@@ -18,6 +19,9 @@ if GOOGLE_BOOKS_API_KEY is None:
 if GOOGLE_BOOKS_API_URL is None:
     raise ValueError("GOOGLE_BOOKS_API_URL is not set")
 
+# Searches larger than one Google Books page fetch this many pages at once
+BOOKS_SEARCH_MAX_PARALLEL_PAGES = int(os.getenv("BOOKS_SEARCH_MAX_PARALLEL_PAGES", "4"))
+
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash")
@@ -29,6 +33,58 @@ GEMINI_API_URL = os.getenv(
 if GEMINI_API_KEY is None:
     raise ValueError("GEMINI_API_KEY is not set")
 
+# --- Recommendations configuration ---
+# "gemini" (remote model), "local" (TF-IDF over the book catalog) or
+# "hybrid" (local results first, Gemini when it answers in time)
+RECOMMENDATIONS_ENGINE = os.getenv("RECOMMENDATIONS_ENGINE", "gemini")
+RECOMMENDATIONS_REMOTE_TIMEOUT = float(os.getenv("RECOMMENDATIONS_REMOTE_TIMEOUT", "10.0"))
+BOOK_CATALOG_MAX_SIZE = int(os.getenv("BOOK_CATALOG_MAX_SIZE", "20000"))
+BOOK_CATALOG_PERSIST = os.getenv("BOOK_CATALOG_PERSIST", "true").lower() in ("1", "true", "yes")
+BOOK_CATALOG_PATH = os.getenv("BOOK_CATALOG_PATH")
+# Answer book searches from the catalog first; upstream fallback: "partial"
+# (fewer local results than requested), "empty" (no local results) or "never"
+BOOK_CATALOG_LOCAL_SEARCH = os.getenv("BOOK_CATALOG_LOCAL_SEARCH", "false").lower() in ("1", "true", "yes")
+BOOK_CATALOG_SEARCH_FALLBACK = os.getenv("BOOK_CATALOG_SEARCH_FALLBACK", "partial")
+BOOK_CATALOG_FALLBACK_TIMEOUT = float(os.getenv("BOOK_CATALOG_FALLBACK_TIMEOUT", "3.0"))
+
+# --- Books search cache configuration ---
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "600"))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+SEARCH_CACHE_DISK = os.getenv("SEARCH_CACHE_DISK", "false").lower() in ("1", "true", "yes")
+SEARCH_CACHE_DISK_PATH = os.getenv("SEARCH_CACHE_DISK_PATH")
+SEARCH_CACHE_PREFETCH = os.getenv("SEARCH_CACHE_PREFETCH", "true").lower() in ("1", "true", "yes")
+
+# --- Outgoing HTTP connections configuration ---
+# HTTP/2 needs the h2 package (pip install httpx[http2])
+HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "false").lower() in ("1", "true", "yes")
+HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "20"))
+HTTP_CLIENT_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY", "30.0"))
+HTTP_CLIENT_PREWARM = os.getenv("HTTP_CLIENT_PREWARM", "true").lower() in ("1", "true", "yes")
+
+# --- Graph persistence configuration ---
+GRAPH_WRITE_BEHIND = os.getenv("GRAPH_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+GRAPH_FLUSH_INTERVAL = float(os.getenv("GRAPH_FLUSH_INTERVAL", "2.0"))
+GRAPH_FLUSH_MAX_DIRTY = int(os.getenv("GRAPH_FLUSH_MAX_DIRTY", "200"))
+GRAPH_STORAGE_BACKEND = os.getenv("GRAPH_STORAGE_BACKEND", "json")
+GRAPH_JOURNAL_COMPACT_THRESHOLD = int(os.getenv("GRAPH_JOURNAL_COMPACT_THRESHOLD", "1000"))
+GRAPH_CHANGE_LOG_SIZE = int(os.getenv("GRAPH_CHANGE_LOG_SIZE", "1000"))
+GRAPH_ASYNC_PERSISTENCE = os.getenv("GRAPH_ASYNC_PERSISTENCE", "true").lower() in ("1", "true", "yes")
+GRAPH_MULTIPROCESS = os.getenv("GRAPH_MULTIPROCESS", "false").lower() in ("1", "true", "yes")
+GRAPH_CHECKPOINT_INTERVAL = int(os.getenv("GRAPH_CHECKPOINT_INTERVAL", "1000"))
+GRAPH_LAZY_LOAD = os.getenv("GRAPH_LAZY_LOAD", "false").lower() in ("1", "true", "yes")
+GRAPH_READY_TIMEOUT = float(os.getenv("GRAPH_READY_TIMEOUT", "10.0"))
+GRAPH_ENGINE = os.getenv("GRAPH_ENGINE", "networkx")
+GRAPH_CSR_MERGE_THRESHOLD = int(os.getenv("GRAPH_CSR_MERGE_THRESHOLD", "4096"))
+GRAPH_ANALYTICS_WORKERS = int(os.getenv("GRAPH_ANALYTICS_WORKERS", "2"))
+GRAPH_ANALYTICS_POOL_MIN_EDGES = int(os.getenv("GRAPH_ANALYTICS_POOL_MIN_EDGES", "5000"))
+GRAPH_BETWEENNESS_SAMPLE = int(os.getenv("GRAPH_BETWEENNESS_SAMPLE", "256"))
+GRAPH_SEARCH_PERSIST = os.getenv("GRAPH_SEARCH_PERSIST", "false").lower() in ("1", "true", "yes")
+GRAPH_SEARCH_INDEX_PATH = os.getenv("GRAPH_SEARCH_INDEX_PATH")
+SIMILARITY_EDGES_ENABLED = os.getenv("SIMILARITY_EDGES_ENABLED", "false").lower() in ("1", "true", "yes")
+SIMILARITY_TOP_K = int(os.getenv("SIMILARITY_TOP_K", "5"))
+SIMILARITY_MIN_SCORE = float(os.getenv("SIMILARITY_MIN_SCORE", "0.3"))
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -40,6 +96,9 @@ class ApiBooksSettings(BaseModel):
     """Google Books API settings."""
     API_BOOKS_URL: str = GOOGLE_BOOKS_API_URL
     API_BOOKS_KEY: str = GOOGLE_BOOKS_API_KEY
+    # Google Books returns at most 40 results per request
+    max_page_size: int = 40
+    max_parallel_pages: int = BOOKS_SEARCH_MAX_PARALLEL_PAGES
 
 
 class GeminiSettings(BaseModel):
@@ -49,6 +108,77 @@ class GeminiSettings(BaseModel):
     api_url: str = GEMINI_API_URL
     timeout: float = 30.0
 
+
+class RecommendationSettings(BaseModel):
+    """Recommendation engine settings."""
+    engine: str = RECOMMENDATIONS_ENGINE
+    # Hybrid engine: wait this long for Gemini before answering locally
+    remote_timeout: float = RECOMMENDATIONS_REMOTE_TIMEOUT
+    # Local engine: features are hashed into 2**hash_bits buckets
+    hash_bits: int = 18
+    # Weight of each book field in the feature vector
+    subject_weight: float = 2.0
+    author_weight: float = 1.5
+    description_weight: float = 1.0
+
+
+class BookCatalogSettings(BaseModel):
+    """Catalog of books seen in search results."""
+    max_size: int = BOOK_CATALOG_MAX_SIZE
+    # SQLite copy surviving restarts (app/data/book_catalog.sqlite3 unless a path is set)
+    persist: bool = BOOK_CATALOG_PERSIST
+    path: Optional[str] = BOOK_CATALOG_PATH
+    local_search: bool = BOOK_CATALOG_LOCAL_SEARCH
+    search_fallback: str = BOOK_CATALOG_SEARCH_FALLBACK
+    # Seconds to wait for the upstream when some local results can answer instead
+    fallback_timeout: float = BOOK_CATALOG_FALLBACK_TIMEOUT
+
+
+class SearchCacheSettings(BaseModel):
+    """Cache of Google Books search results."""
+    enabled: bool = SEARCH_CACHE_ENABLED
+    ttl: float = SEARCH_CACHE_TTL  # seconds
+    max_entries: int = SEARCH_CACHE_MAX_ENTRIES
+    # SQLite tier surviving restarts (app/data/search_cache.sqlite3 unless a path is set)
+    disk_enabled: bool = SEARCH_CACHE_DISK
+    disk_path: Optional[str] = SEARCH_CACHE_DISK_PATH
+    disk_max_entries: int = 10000
+    # Searches may ask to fetch their next page into the cache in the background
+    prefetch_enabled: bool = SEARCH_CACHE_PREFETCH
+    max_prefetches: int = 8  # background fetches at once
+
+
+class HttpClientSettings(BaseModel):
+    """Pooled HTTP clients of the upstream services."""
+    http2: bool = HTTP_CLIENT_HTTP2
+    default_max_connections: int = HTTP_CLIENT_MAX_CONNECTIONS
+    # Per upstream connection limits, overriding the default
+    max_connections: Dict[str, int] = {
+        "google_books": HTTP_CLIENT_MAX_CONNECTIONS,
+        "gemini": 10,
+        "health": 2,
+    }
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = HTTP_CLIENT_KEEPALIVE_EXPIRY  # seconds
+    # Open connections to the upstreams at startup
+    prewarm: bool = HTTP_CLIENT_PREWARM
+    prewarm_connections: int = 2  # per upstream
+    prewarm_timeout: float = 5.0  # seconds
+
+
+class BookSuggestSettings(BaseModel):
+    """Typeahead suggestions of titles and authors."""
+    # Suggestions match prefixes starting at any of their first words
+    max_words: int = 6
+    # Score of a book in the graph, relative to a book seen in search results
+    graph_weight: float = 2.0
+    # Score added by the PageRank of an average graph book
+    centrality_weight: float = 1.0
+    # Suggestions of prefixes up to this length are ranked when the index is built
+    precomputed_prefix_length: int = 2
+    max_limit: int = 50
+
+
 class HealthMonitorSettings(BaseModel):
     """Settings for health monitoring service."""
     enabled: bool = True
@@ -56,3 +186,89 @@ class HealthMonitorSettings(BaseModel):
     base_url: str = "http://localhost:8000"
     health_endpoint: str = "/health/check"
     timeout: float = 5.0
+
+
+class GraphSettings(BaseModel):
+    """Graph manager settings."""
+    # Node properties maintained in secondary indexes for O(1) lookups
+    indexed_properties: List[str] = ["code", "isbn", "title", "author"]
+    # Write-behind: coalesce mutations into one save per interval / dirty threshold
+    write_behind_enabled: bool = GRAPH_WRITE_BEHIND
+    flush_interval: float = GRAPH_FLUSH_INTERVAL  # seconds
+    flush_max_dirty: int = GRAPH_FLUSH_MAX_DIRTY
+    # Serialize and write to storage on a background thread, off the event loop
+    async_persistence: bool = GRAPH_ASYNC_PERSISTENCE
+    # Storage backend: "json" (full rewrite), "journal" (append-only log + snapshot)
+    # "sqlite" (row-level writes) or "binary" (compact snapshot, fast cold start)
+    storage_backend: str = GRAPH_STORAGE_BACKEND
+    journal_compact_threshold: int = GRAPH_JOURNAL_COMPACT_THRESHOLD
+    # Max mutations kept in memory for delta sync (/graph/changes)
+    change_log_size: int = GRAPH_CHANGE_LOG_SIZE
+    # Multi-process mode (uvicorn --workers N): workers share a change feed
+    # and checkpoint the graph to storage every `checkpoint_interval` changes
+    multiprocess: bool = GRAPH_MULTIPROCESS
+    checkpoint_interval: int = GRAPH_CHECKPOINT_INTERVAL
+    # Load the graph in the background after startup; graph endpoints wait
+    # up to `ready_timeout` seconds for it and answer 503 afterwards
+    lazy_load: bool = GRAPH_LAZY_LOAD
+    ready_timeout: float = GRAPH_READY_TIMEOUT
+    # In-memory engine: "networkx" (dict of dicts) or "csr" (NumPy arrays,
+    # compact and vectorized for large graphs)
+    engine: str = GRAPH_ENGINE
+    # Edges buffered by the CSR engine before they are merged into its arrays
+    csr_merge_threshold: int = GRAPH_CSR_MERGE_THRESHOLD
+
+
+class GraphAnalyticsSettings(BaseModel):
+    """Graph analytics settings."""
+    # Processes computing expensive metrics off the API process
+    workers: int = GRAPH_ANALYTICS_WORKERS
+    # Smaller graphs are computed on a thread, not worth a process round trip
+    pool_min_edges: int = GRAPH_ANALYTICS_POOL_MIN_EDGES
+    # Betweenness uses this many sampled source nodes on larger graphs
+    betweenness_sample: int = GRAPH_BETWEENNESS_SAMPLE
+    pagerank_alpha: float = 0.85
+    pagerank_max_iter: int = 100
+    pagerank_tol: float = 1e-6
+
+
+class GraphSearchSettings(BaseModel):
+    """Settings of the full-text index over graph nodes."""
+    # Save the index on shutdown (beside graph.json unless a path is set) and
+    # reuse unchanged documents from it on the next start
+    persist: bool = GRAPH_SEARCH_PERSIST
+    index_path: Optional[str] = GRAPH_SEARCH_INDEX_PATH
+    # BM25 term frequency saturation and document length normalization
+    k1: float = 1.2
+    b: float = 0.75
+    # Term frequency added per occurrence in each field
+    field_weights: Dict[str, float] = {
+        "label": 3.0,
+        "title": 3.0,
+        "author": 2.0,
+        "subjects": 1.5,
+        "description": 1.0,
+    }
+
+
+class SimilarityEdgeSettings(BaseModel):
+    """Settings of the job linking similar books with weighted edges."""
+    enabled: bool = SIMILARITY_EDGES_ENABLED
+    # Each book gets edges to at most `top_k` most similar books
+    top_k: int = SIMILARITY_TOP_K
+    min_score: float = SIMILARITY_MIN_SCORE
+    # Terms shared by more books do not nominate candidates (still scored)
+    max_postings: int = 2000
+    # Seconds to wait for more changes before updating edges
+    debounce: float = 0.5
+    # Multi-process mode: seconds between checks of the shared change feed
+    # (and, in the other workers, attempts to take over the job)
+    feed_poll_interval: float = 5.0
+
+
+class LibraryImportSettings(BaseModel):
+    """Settings for bulk reading list import."""
+    concurrency: int = 8  # parallel Google Books lookups
+    batch_size: int = 100  # books inserted into the graph per batch
+    max_rows: int = 10000
+    max_jobs: int = 50  # finished jobs kept for status queries
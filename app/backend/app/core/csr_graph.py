@@ -0,0 +1,510 @@
+# python
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# project
+from app.core.config import GraphSettings
+from app.core.graph import IGraphEngine, PropertyIndex
+from app.schemas.graph import Edge, Node
+
+# 3rd party
+import numpy as np
+
+
+def _ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate arange(start, end) for every pair without a Python loop."""
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(int(lengths.sum()), dtype=np.int64)
+
+
+class CSRGraph(IGraphEngine):
+    """Array-backed directed graph.
+
+    Node ids are interned to consecutive integers and adjacency is kept in
+    NumPy CSR arrays (row pointers, target indexes and weights, rows sorted
+    by target) plus a reverse view for predecessor lookups. That is about
+    25 bytes per edge instead of the nested dicts of networkx, and lets
+    traversals and analytics work on whole arrays.
+
+    Mutations stay cheap: new edges go to a delta buffer that is merged into
+    the arrays once it holds `merge_threshold` edges, while removed edges
+    and nodes are tombstoned and dropped at the next merge. Edges of a node
+    are always iterated by target insertion order, so iteration order does
+    not change when the buffer is merged.
+    """
+
+    def __init__(
+        self,
+        indexed_properties: Optional[Iterable[str]] = None,
+        merge_threshold: Optional[int] = None,
+    ):
+        settings = GraphSettings()
+        if indexed_properties is None:
+            indexed_properties = settings.indexed_properties
+        self._index = PropertyIndex(indexed_properties)
+        self._merge_threshold = max(1, merge_threshold or settings.csr_merge_threshold)
+        # Interned nodes; removed nodes leave None until the next merge
+        self._ids: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+        self._labels: List[Optional[str]] = []
+        self._properties: List[Optional[Dict[str, Any]]] = []
+        self._dead_nodes = 0
+        # CSR arrays cover the first _n_merged node indexes
+        self._n_merged = 0
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._weights = np.empty(0, dtype=np.float64)
+        self._alive = np.empty(0, dtype=bool)
+        # Reverse view: edge positions and their sources grouped by target
+        self._in_indptr = np.zeros(1, dtype=np.int64)
+        self._in_edges = np.empty(0, dtype=np.int64)
+        self._in_sources = np.empty(0, dtype=np.int32)
+        # Delta buffer of edges added since the last merge
+        self._pending_out: Dict[int, Dict[int, float]] = {}
+        self._pending_in: Dict[int, Dict[int, None]] = {}
+        self._pending_count = 0
+        self._edge_count = 0
+
+    # --- nodes ---
+
+    def add_node(self, node_id: str, label: str, properties: Dict[str, Any]) -> Node:
+        position = self._positions.get(node_id)
+        if position is None:
+            self._positions[node_id] = len(self._ids)
+            self._ids.append(node_id)
+            self._labels.append(label)
+            self._properties.append(properties)
+        else:
+            self._index.remove(node_id, self._properties[position] or {})
+            self._labels[position] = label
+            self._properties[position] = properties
+        self._index.add(node_id, properties)
+        return Node(id=node_id, label=label, properties=properties)
+
+    def remove_node(self, node_id: str) -> bool:
+        position = self._positions.pop(node_id, None)
+        if position is None:
+            return False
+        self._index.remove(node_id, self._properties[position] or {})
+
+        if position < self._n_merged:
+            incident = np.unique(np.concatenate((
+                np.arange(self._indptr[position], self._indptr[position + 1]),
+                self._in_edges[self._in_indptr[position]:self._in_indptr[position + 1]],
+            )))
+            self._edge_count -= int(np.count_nonzero(self._alive[incident]))
+            self._alive[incident] = False
+
+        for target in self._pending_out.pop(position, {}):
+            self._pending_in[target].pop(position, None)
+            self._pending_count -= 1
+            self._edge_count -= 1
+        for source in self._pending_in.pop(position, {}):
+            del self._pending_out[source][position]
+            self._pending_count -= 1
+            self._edge_count -= 1
+
+        self._ids[position] = None
+        self._labels[position] = None
+        self._properties[position] = None
+        self._dead_nodes += 1
+        return True
+
+    def change_node(self, node_id: str, label: str, properties: Dict[str, Any]) -> bool:
+        if node_id not in self._positions:
+            return False
+        self.add_node(node_id, label, properties)
+        return True
+
+    def has_node(self, node_id: str) -> bool:
+        return node_id in self._positions
+
+    def clear(self) -> None:
+        self.__init__(self._index.keys, self._merge_threshold)
+
+    def _node_data(self, position: int) -> Dict[str, Any]:
+        return {
+            "id": self._ids[position],
+            "label": self._labels[position],
+            "properties": self._properties[position],
+        }
+
+    def _node(self, position: int) -> Node:
+        return Node(**self._node_data(position))
+
+    def iter_node_data(self) -> Iterator[Dict[str, Any]]:
+        for position, node_id in enumerate(self._ids):
+            if node_id is not None:
+                yield self._node_data(position)
+
+    def get_node_data(self, node_id: str) -> Optional[Dict[str, Any]]:
+        position = self._positions.get(node_id)
+        return None if position is None else self._node_data(position)
+
+    def node_ids(self) -> List[str]:
+        return [node_id for node_id in self._ids if node_id is not None]
+
+    def number_of_nodes(self) -> int:
+        return len(self._positions)
+
+    # --- edges ---
+
+    def _merged_edge(self, source: int, target: int) -> int:
+        """Position of an edge in the CSR arrays (dead or alive), or -1."""
+        if source >= self._n_merged:
+            return -1
+        start, end = self._indptr[source], self._indptr[source + 1]
+        offset = int(np.searchsorted(self._indices[start:end], target))
+        if start + offset < end and self._indices[start + offset] == target:
+            return int(start + offset)
+        return -1
+
+    def add_edge(self, source: str, target: str, weight: float) -> Edge:
+        u = self._positions.get(source)
+        v = self._positions.get(target)
+        if u is None or v is None:
+            raise ValueError("Both source and target nodes must exist.")
+
+        position = self._merged_edge(u, v)
+        if position >= 0:
+            if not self._alive[position]:
+                self._alive[position] = True
+                self._edge_count += 1
+            self._weights[position] = weight
+        else:
+            targets = self._pending_out.setdefault(u, {})
+            if v not in targets:
+                self._pending_in.setdefault(v, {})[u] = None
+                self._pending_count += 1
+                self._edge_count += 1
+            targets[v] = weight
+            if self._pending_count >= self._merge_threshold:
+                self.merge()
+        return Edge(source=source, target=target, weight=weight)
+
+    def remove_edge(self, source: str, target: str) -> bool:
+        u = self._positions.get(source)
+        v = self._positions.get(target)
+        if u is None or v is None:
+            return False
+
+        position = self._merged_edge(u, v)
+        if position >= 0 and self._alive[position]:
+            self._alive[position] = False
+            self._edge_count -= 1
+            return True
+        targets = self._pending_out.get(u)
+        if targets is not None and v in targets:
+            del targets[v]
+            del self._pending_in[v][u]
+            self._pending_count -= 1
+            self._edge_count -= 1
+            return True
+        return False
+
+    def _successors(self, position: int) -> List[Tuple[int, float]]:
+        """(target, weight) pairs of a node's outgoing edges, ordered by target."""
+        row: List[Tuple[int, float]] = []
+        if position < self._n_merged:
+            start, end = self._indptr[position], self._indptr[position + 1]
+            alive = self._alive[start:end]
+            row = list(zip(self._indices[start:end][alive].tolist(),
+                           self._weights[start:end][alive].tolist()))
+        pending = self._pending_out.get(position)
+        if pending:
+            row.extend(pending.items())
+            row.sort()
+        return row
+
+    def _predecessors(self, position: int) -> List[Tuple[int, float]]:
+        """(source, weight) pairs of a node's incoming edges, ordered by source."""
+        row: List[Tuple[int, float]] = []
+        if position < self._n_merged:
+            start, end = self._in_indptr[position], self._in_indptr[position + 1]
+            edges = self._in_edges[start:end]
+            alive = self._alive[edges]
+            row = list(zip(self._in_sources[start:end][alive].tolist(),
+                           self._weights[edges[alive]].tolist()))
+        pending = self._pending_in.get(position)
+        if pending:
+            row.extend((source, self._pending_out[source][position]) for source in pending)
+            row.sort()
+        return row
+
+    def _edge_data(self, source: int, target: int, weight: float) -> Dict[str, Any]:
+        return {"source": self._ids[source], "target": self._ids[target], "weight": weight}
+
+    def iter_edge_data(self) -> Iterator[Dict[str, Any]]:
+        """Iterate edge dicts grouped by source node."""
+        return (
+            self._edge_data(source, target, weight)
+            for source, node_id in enumerate(self._ids)
+            if node_id is not None
+            for target, weight in self._successors(source)
+        )
+
+    def get_edge_data(self, source: str, target: str) -> Optional[Dict[str, Any]]:
+        u = self._positions.get(source)
+        v = self._positions.get(target)
+        if u is None or v is None:
+            return None
+        position = self._merged_edge(u, v)
+        if position >= 0 and self._alive[position]:
+            return self._edge_data(u, v, float(self._weights[position]))
+        pending = self._pending_out.get(u)
+        if pending is not None and v in pending:
+            return self._edge_data(u, v, pending[v])
+        return None
+
+    def get_incident_edges(self, node_id: str) -> List[Dict[str, Any]]:
+        position = self._positions.get(node_id)
+        if position is None:
+            return []
+        return [
+            self._edge_data(source, position, weight)
+            for source, weight in self._predecessors(position)
+        ] + [
+            self._edge_data(position, target, weight)
+            for target, weight in self._successors(position)
+        ]
+
+    def edge_keys(self) -> List[Tuple[str, str]]:
+        return [(edge["source"], edge["target"]) for edge in self.iter_edge_data()]
+
+    def number_of_edges(self) -> int:
+        return self._edge_count
+
+    # --- traversal ---
+
+    def _expand(self, frontier: np.ndarray, direction: str) -> np.ndarray:
+        """Neighbor indexes of all frontier nodes, possibly with repeats."""
+        parts = []
+        merged = frontier[frontier < self._n_merged]
+        if direction in ("out", "both"):
+            edges = _ranges(self._indptr[merged], self._indptr[merged + 1])
+            parts.append(self._indices[edges[self._alive[edges]]])
+            parts.append(np.fromiter(
+                (target for u in frontier.tolist() for target in self._pending_out.get(u, ())),
+                dtype=np.int32))
+        if direction in ("in", "both"):
+            slots = _ranges(self._in_indptr[merged], self._in_indptr[merged + 1])
+            parts.append(self._in_sources[slots[self._alive[self._in_edges[slots]]]])
+            parts.append(np.fromiter(
+                (source for v in frontier.tolist() for source in self._pending_in.get(v, ())),
+                dtype=np.int32))
+        return np.concatenate(parts).astype(np.int64)
+
+    def neighborhood(
+        self,
+        node_id: str,
+        depth: int,
+        direction: str = "both",
+        max_nodes: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Induced subgraph of nodes within `depth` hops of a node.
+
+        Level-synchronous BFS: every hop expands the whole frontier at once.
+
+        Raises:
+            KeyError: If the node does not exist
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: Subgraph with 'nodes' and 'edges' keys
+                and whether it was truncated by `max_nodes`
+        """
+        center = self._positions.get(node_id)
+        if center is None:
+            raise KeyError(node_id)
+
+        visited = np.zeros(len(self._ids), dtype=bool)
+        visited[center] = True
+        order = [center]
+        frontier = np.array([center], dtype=np.int64)
+        truncated = False
+        for _ in range(depth):
+            if not frontier.size:
+                break
+            candidates = self._expand(frontier, direction)
+            candidates = candidates[~visited[candidates]]
+            _, first = np.unique(candidates, return_index=True)
+            candidates = candidates[np.sort(first)]
+            if max_nodes is not None and len(order) + len(candidates) > max_nodes:
+                candidates = candidates[:max(0, max_nodes - len(order))]
+                truncated = True
+            visited[candidates] = True
+            order.extend(candidates.tolist())
+            frontier = candidates
+            if truncated:
+                break
+
+        nodes = [self._node_data(position) for position in order]
+        edges = [
+            self._edge_data(source, target, weight)
+            for source in order
+            for target, weight in self._successors(source)
+            if visited[target]
+        ]
+        return {"nodes": nodes, "edges": edges}, truncated
+
+    # --- lookups ---
+
+    def find_node_by_property(self, property_key: str, property_value: Any) -> Optional[Node]:
+        if self._index.is_indexed(property_key):
+            candidates: Iterable[int] = (
+                self._positions[node_id]
+                for node_id in self._index.lookup(property_key, property_value)
+            )
+        else:
+            candidates = (
+                position for position, node_id in enumerate(self._ids) if node_id is not None)
+        for position in candidates:
+            if (self._properties[position] or {}).get(property_key) == property_value:
+                return self._node(position)
+        return None
+
+    def find_nodes_by_property(self, property_key: str, property_value: Any) -> List[Node]:
+        if not self._index.is_indexed(property_key):
+            raise KeyError(f"Property '{property_key}' is not indexed")
+        return [
+            self._node(self._positions[node_id])
+            for node_id in self._index.lookup(property_key, property_value)
+        ]
+
+    def rebuild_index(self) -> None:
+        """Rebuild secondary indexes from the current node set."""
+        self._index.clear()
+        for node_id, properties in zip(self._ids, self._properties):
+            if node_id is not None:
+                self._index.add(node_id, properties or {})
+
+    # --- bulk operations ---
+
+    def bulk_load(
+        self,
+        nodes: Iterable[Tuple[str, Dict[str, Any]]],
+        edges: Iterable[Tuple[str, str, float]],
+    ) -> None:
+        """Insert nodes and edges in bulk, then rebuild the indexes.
+
+        Edges are interned into arrays and merged into the CSR arrays in a
+        single pass instead of going through the delta buffer.
+
+        Args:
+            nodes: (node_id, {"label": ..., "properties": ...}) tuples
+            edges: (source, target, weight) tuples; edges with missing
+                endpoints are skipped
+        """
+        for node_id, attributes in nodes:
+            position = self._positions.get(node_id)
+            if position is None:
+                self._positions[node_id] = len(self._ids)
+                self._ids.append(node_id)
+                self._labels.append(attributes.get("label"))
+                self._properties.append(attributes.get("properties", {}))
+            else:
+                self._labels[position] = attributes.get("label")
+                self._properties[position] = attributes.get("properties", {})
+
+        positions = self._positions
+        sources: List[int] = []
+        targets: List[int] = []
+        weights: List[float] = []
+        for source, target, weight in edges:
+            u = positions.get(source)
+            v = positions.get(target)
+            if u is not None and v is not None:
+                sources.append(u)
+                targets.append(v)
+                weights.append(weight)
+
+        self.merge(
+            np.array(sources, dtype=np.int64),
+            np.array(targets, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+        )
+        self.rebuild_index()
+
+    def merge(
+        self,
+        sources: Optional[np.ndarray] = None,
+        targets: Optional[np.ndarray] = None,
+        weights: Optional[np.ndarray] = None,
+    ) -> None:
+        """Fold the delta buffer and tombstones into fresh CSR arrays.
+
+        Removed nodes are compacted away, keeping the relative order of the
+        remaining ones. Extra (sources, targets, weights) arrays of node
+        indexes are merged too; on duplicates the last edge wins.
+        """
+        merged_sources = np.repeat(
+            np.arange(self._n_merged, dtype=np.int64), np.diff(self._indptr))
+        pending_sources = np.fromiter(
+            (u for u, row in self._pending_out.items() for _ in row), dtype=np.int64)
+        pending_targets = np.fromiter(
+            (v for row in self._pending_out.values() for v in row), dtype=np.int64)
+        pending_weights = np.fromiter(
+            (w for row in self._pending_out.values() for w in row.values()), dtype=np.float64)
+        empty_int = np.empty(0, dtype=np.int64)
+        src = np.concatenate((merged_sources[self._alive], pending_sources,
+                              empty_int if sources is None else sources))
+        dst = np.concatenate((self._indices[self._alive].astype(np.int64), pending_targets,
+                              empty_int if targets is None else targets))
+        wgt = np.concatenate((self._weights[self._alive], pending_weights,
+                              np.empty(0) if weights is None else weights))
+
+        if self._dead_nodes:
+            alive_nodes = np.fromiter(
+                (node_id is not None for node_id in self._ids), dtype=bool, count=len(self._ids))
+            remap = np.full(len(self._ids), -1, dtype=np.int64)
+            remap[alive_nodes] = np.arange(int(alive_nodes.sum()))
+            src, dst = remap[src], remap[dst]
+            keep = alive_nodes.nonzero()[0].tolist()
+            self._ids = [self._ids[i] for i in keep]
+            self._labels = [self._labels[i] for i in keep]
+            self._properties = [self._properties[i] for i in keep]
+            self._positions = {node_id: i for i, node_id in enumerate(self._ids)}
+            self._dead_nodes = 0
+
+        # Sort by (source, target); lexsort is stable, so the last duplicate wins
+        order = np.lexsort((dst, src))
+        src, dst, wgt = src[order], dst[order], wgt[order]
+        if len(src):
+            last = np.ones(len(src), dtype=bool)
+            last[:-1] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+            src, dst, wgt = src[last], dst[last], wgt[last]
+
+        n = len(self._ids)
+        self._n_merged = n
+        self._indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self._indptr[1:])
+        self._indices = dst.astype(np.int32)
+        self._weights = wgt
+        self._alive = np.ones(len(dst), dtype=bool)
+        self._in_edges = np.argsort(dst, kind="stable")
+        self._in_sources = src[self._in_edges].astype(np.int32)
+        self._in_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=n), out=self._in_indptr[1:])
+        self._pending_out.clear()
+        self._pending_in.clear()
+        self._pending_count = 0
+        self._edge_count = len(dst)
+
+    def to_csr(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Compacted CSR view for vectorized analytics.
+
+        Pending edges and tombstones are merged first; this does not change
+        the iteration order of nodes or edges.
+
+        Returns:
+            Tuple: (node ids, indptr, indices, weights); row i of the arrays
+                belongs to node ids[i]
+        """
+        if self._pending_count or self._dead_nodes or not self._alive.all():
+            self.merge()
+        return list(self._ids), self._indptr, self._indices, self._weights
+
+    def edge_index(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Edge columns taken from the CSR arrays, without a per-edge loop."""
+        node_ids, indptr, indices, weights = self.to_csr()
+        sources = np.repeat(np.arange(len(node_ids), dtype=np.int64), np.diff(indptr))
+        return node_ids, sources, indices, weights
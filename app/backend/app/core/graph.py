@@ -1,34 +1,299 @@
 # python
-from typing import Dict, Any, Optional
+import asyncio
+import gc
+import json
+import threading
+import time
+import unicodedata
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Hashable, Callable, Sequence, Tuple
 
 # project
 from app.schemas.graph import Node, Edge, Graph
-from app.core.graph_persistence import GraphPersistenceService
+from app.core.config import GraphSettings
+from app.core.graph_persistence import GraphPersistenceService, create_graph_storage
+from app.core.persistence_writer import PersistenceWriter
+from app.core.shared_graph_log import FeedPosition, FeedStat, SharedGraphLog
+from app.core.write_behind import WriteBehindFlusher
 
 # 3rd party
 import networkx as nx
 
 
-class NetworkXGraph:
+def normalize_text(value: Any) -> Optional[str]:
+    """Fold free text (titles, authors) to a case- and whitespace-insensitive form."""
+    if not isinstance(value, str):
+        return None
+    text = " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+    return text or None
+
+
+def normalize_isbn(value: Any) -> Optional[str]:
+    """Strip separators from ISBN so that hyphenated and plain forms match."""
+    if not isinstance(value, str):
+        return None
+    isbn = "".join(ch for ch in value if ch.isalnum()).upper()
+    return isbn or None
+
+
+PROPERTY_NORMALIZERS: Dict[str, Callable[[Any], Optional[Hashable]]] = {
+    "isbn": normalize_isbn,
+    "title": normalize_text,
+    "author": normalize_text,
+}
+
+
+class PropertyIndex:
+    """Secondary index mapping node property values to node ids"""
+
+    def __init__(self, keys: Iterable[str]):
+        self._keys = tuple(dict.fromkeys(keys))
+        # key -> normalized value -> ordered set of node ids (dict keeps insertion order)
+        self._entries: Dict[str, Dict[Hashable, Dict[str, None]]] = {
+            key: {} for key in self._keys
+        }
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def is_indexed(self, key: str) -> bool:
+        return key in self._entries
+
+    def normalize(self, key: str, value: Any) -> Optional[Hashable]:
+        normalizer = PROPERTY_NORMALIZERS.get(key)
+        if normalizer is not None:
+            return normalizer(value)
+        if value is None or not isinstance(value, Hashable):
+            return None
+        return value
+
+    def add(self, node_id: str, properties: Dict[str, Any]) -> None:
+        for key, entries in self._entries.items():
+            value = self.normalize(key, properties.get(key))
+            if value is not None:
+                entries.setdefault(value, {})[node_id] = None
+
+    def remove(self, node_id: str, properties: Dict[str, Any]) -> None:
+        for key, entries in self._entries.items():
+            value = self.normalize(key, properties.get(key))
+            if value is None:
+                continue
+            node_ids = entries.get(value)
+            if node_ids is not None:
+                node_ids.pop(node_id, None)
+                if not node_ids:
+                    del entries[value]
+
+    def lookup(self, key: str, value: Any) -> List[str]:
+        normalized = self.normalize(key, value)
+        if normalized is None:
+            return []
+        return list(self._entries[key].get(normalized, ()))
+
+    def clear(self) -> None:
+        for entries in self._entries.values():
+            entries.clear()
+
+
+class IGraphEngine(ABC):
+    """Interface for in-memory graph engines used by GraphManager.
+
+    Node ids are strings; iteration order of nodes and edges must be stable
+    between mutations, since pagination and streaming rely on it.
+    """
+
+    @abstractmethod
+    def add_node(self, node_id: str, label: str, properties: Dict[str, Any]) -> Node:
+        """Insert a node, replacing label and properties if it exists."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_node(self, node_id: str) -> bool:
+        """Remove a node with its incident edges; False if it does not exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def change_node(self, node_id: str, label: str, properties: Dict[str, Any]) -> bool:
+        """Replace label and properties of a node; False if it does not exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_edge(self, source: str, target: str, weight: float) -> Edge:
+        """Insert or re-weight an edge.
+
+        Raises:
+            ValueError: If source or target node does not exist
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_edge(self, source: str, target: str) -> bool:
+        """Remove an edge; False if it does not exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_node(self, node_id: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all nodes, edges and index entries."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_node_data(self) -> Iterator[Dict[str, Any]]:
+        """Iterate node dicts in insertion order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_edge_data(self) -> Iterator[Dict[str, Any]]:
+        """Iterate edge dicts in a stable order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_node_data(self, node_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_edge_data(self, source: str, target: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_incident_edges(self, node_id: str) -> List[Dict[str, Any]]:
+        """Incoming and outgoing edges of a node."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def node_ids(self) -> List[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def edge_keys(self) -> List[Tuple[str, str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def neighborhood(
+        self,
+        node_id: str,
+        depth: int,
+        direction: str = "both",
+        max_nodes: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Induced subgraph of nodes within `depth` hops of a node.
+
+        Raises:
+            KeyError: If the node does not exist
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: Subgraph with 'nodes' and 'edges' keys
+                and whether it was truncated by `max_nodes`
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def number_of_nodes(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def number_of_edges(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_node_by_property(self, property_key: str, property_value: Any) -> Optional[Node]:
+        """Find the first node whose property equals the value exactly."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_nodes_by_property(self, property_key: str, property_value: Any) -> List[Node]:
+        """Find all nodes matching the value after key normalization.
+
+        Raises:
+            KeyError: If the property is not indexed
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_load(
+        self,
+        nodes: Iterable[Tuple[str, Dict[str, Any]]],
+        edges: Iterable[Tuple[str, str, float]],
+    ) -> None:
+        """Insert nodes and edges in bulk, then rebuild the indexes.
+
+        Args:
+            nodes: (node_id, {"label": ..., "properties": ...}) tuples
+            edges: (source, target, weight) tuples; edges with missing
+                endpoints are skipped
+        """
+        raise NotImplementedError
+
+    def get_structure(self) -> Graph:
+        return Graph(
+            nodes=[Node(**node) for node in self.iter_node_data()],
+            edges=[Edge(**edge) for edge in self.iter_edge_data()],
+        )
+
+    def get_structure_data(self) -> Dict[str, Any]:
+        """Plain-dict graph structure, skipping pydantic model construction."""
+        return {
+            "nodes": list(self.iter_node_data()),
+            "edges": list(self.iter_edge_data()),
+        }
+
+    def edge_index(self) -> Tuple[List[str], Sequence[int], Sequence[int], Sequence[float]]:
+        """Graph as flat edge columns for array-based analytics.
+
+        Returns:
+            Tuple: (node ids, edge sources, edge targets, edge weights) where
+                sources and targets are positions in the node id list
+        """
+        node_ids = self.node_ids()
+        positions = {node_id: position for position, node_id in enumerate(node_ids)}
+        sources: List[int] = []
+        targets: List[int] = []
+        weights: List[float] = []
+        for edge in self.iter_edge_data():
+            sources.append(positions[edge["source"]])
+            targets.append(positions[edge["target"]])
+            weights.append(edge.get("weight", 1.0))
+        return node_ids, sources, targets, weights
+
+
+class NetworkXGraph(IGraphEngine):
     """Wrapper for NetworkX library operations"""
 
-    def __init__(self):
+    def __init__(self, indexed_properties: Optional[Iterable[str]] = None):
         self.graph = nx.DiGraph()
+        if indexed_properties is None:
+            indexed_properties = GraphSettings().indexed_properties
+        self._index = PropertyIndex(indexed_properties)
 
     def add_node(self, node_id: str, label: str, properties: Dict[str, Any]) -> Node:
+        if self.graph.has_node(node_id):
+            self._index.remove(node_id, self.graph.nodes[node_id].get('properties', {}))
         self.graph.add_node(node_id, label=label, properties=properties)
+        self._index.add(node_id, properties)
         return Node(id=node_id, label=label, properties=properties)
 
     def remove_node(self, node_id: str) -> bool:
         if self.graph.has_node(node_id):
+            self._index.remove(node_id, self.graph.nodes[node_id].get('properties', {}))
             self.graph.remove_node(node_id)
             return True
         return False
 
     def change_node(self, node_id: str, label: str, properties: Dict[str, Any]) -> bool:
         if self.graph.has_node(node_id):
+            self._index.remove(node_id, self.graph.nodes[node_id].get('properties', {}))
             self.graph.nodes[node_id]['label'] = label
             self.graph.nodes[node_id]['properties'] = properties
+            self._index.add(node_id, properties)
             return True
         return False
 
@@ -51,8 +316,119 @@ class NetworkXGraph:
             v), weight=self.graph.edges[u, v]['weight']) for u, v in self.graph.edges]
         return Graph(nodes=nodes, edges=edges)
 
+    def iter_node_data(self) -> Iterator[Dict[str, Any]]:
+        """Iterate node dicts in insertion order."""
+        for n, data in self.graph.nodes(data=True):
+            yield {"id": str(n), "label": data['label'], "properties": data['properties']}
+
+    def iter_edge_data(self) -> Iterator[Dict[str, Any]]:
+        """Iterate edge dicts in insertion order."""
+        for u, v, data in self.graph.edges(data=True):
+            yield {"source": str(u), "target": str(v), "weight": data['weight']}
+
+    def get_node_data(self, node_id: str) -> Optional[Dict[str, Any]]:
+        if not self.graph.has_node(node_id):
+            return None
+        data = self.graph.nodes[node_id]
+        return {"id": str(node_id), "label": data['label'], "properties": data['properties']}
+
+    def get_edge_data(self, source: str, target: str) -> Optional[Dict[str, Any]]:
+        if not self.graph.has_edge(source, target):
+            return None
+        return {"source": str(source), "target": str(target),
+                "weight": self.graph.edges[source, target]['weight']}
+
+    def get_incident_edges(self, node_id: str) -> List[Dict[str, Any]]:
+        """Incoming and outgoing edges of a node."""
+        return [
+            {"source": str(u), "target": str(v), "weight": data['weight']}
+            for u, v, data in chain(self.graph.in_edges(node_id, data=True),
+                                    self.graph.out_edges(node_id, data=True))
+        ]
+
+    def node_ids(self) -> List[str]:
+        return list(self.graph.nodes)
+
+    def edge_keys(self) -> List[Tuple[str, str]]:
+        return list(self.graph.edges)
+
+    def neighborhood(
+        self,
+        node_id: str,
+        depth: int,
+        direction: str = "both",
+        max_nodes: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Induced subgraph of nodes within `depth` hops of a node.
+
+        Bounded BFS: stops expanding once `max_nodes` nodes were reached.
+
+        Args:
+            node_id (str): id of the center node
+            depth (int): max number of hops
+            direction (str): "out" follows successors, "in" predecessors, "both" either
+            max_nodes (int, optional): cap on the number of returned nodes
+
+        Raises:
+            KeyError: If the node does not exist
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: Subgraph with 'nodes' and 'edges' keys
+                and whether it was truncated by `max_nodes`
+        """
+        if not self.graph.has_node(node_id):
+            raise KeyError(node_id)
+
+        visited: Dict[str, None] = {node_id: None}
+        frontier = deque([(node_id, 0)])
+        truncated = False
+        while frontier and not truncated:
+            current, distance = frontier.popleft()
+            if distance >= depth:
+                continue
+            neighbors: Iterable[str]
+            if direction == "out":
+                neighbors = self.graph.successors(current)
+            elif direction == "in":
+                neighbors = self.graph.predecessors(current)
+            else:
+                neighbors = chain(self.graph.successors(current),
+                                  self.graph.predecessors(current))
+            for neighbor in neighbors:
+                if neighbor in visited:
+                    continue
+                if max_nodes is not None and len(visited) >= max_nodes:
+                    truncated = True
+                    break
+                visited[neighbor] = None
+                frontier.append((neighbor, distance + 1))
+
+        nodes = [self.get_node_data(n) for n in visited]
+        edges = [
+            {"source": str(u), "target": str(v), "weight": data['weight']}
+            for u in visited
+            for v, data in self.graph.succ[u].items()
+            if v in visited
+        ]
+        return {"nodes": nodes, "edges": edges}, truncated
+
+    def number_of_nodes(self) -> int:
+        return self.graph.number_of_nodes()
+
+    def number_of_edges(self) -> int:
+        return self.graph.number_of_edges()
+
     def find_node_by_property(self, property_key: str, property_value: Any) -> Optional[Node]:
-        for node_id in self.graph.nodes:
+        """Find the first node whose property equals the value exactly.
+
+        Indexed keys are resolved through the secondary index; other keys
+        fall back to a full scan.
+        """
+        if self._index.is_indexed(property_key):
+            candidates: Iterable[str] = self._index.lookup(property_key, property_value)
+        else:
+            candidates = self.graph.nodes
+        for node_id in candidates:
             node_properties = self.graph.nodes[node_id].get('properties', {})
             if node_properties.get(property_key) == property_value:
                 return Node(
@@ -62,9 +438,79 @@ class NetworkXGraph:
                 )
         return None
 
+    def find_nodes_by_property(self, property_key: str, property_value: Any) -> List[Node]:
+        """Find all nodes matching the value after key normalization
+        (e.g. case-insensitive titles, ISBN without hyphens).
+
+        Raises:
+            KeyError: If the property is not indexed
+        """
+        if not self._index.is_indexed(property_key):
+            raise KeyError(f"Property '{property_key}' is not indexed")
+        return [
+            Node(
+                id=node_id,
+                label=self.graph.nodes[node_id]['label'],
+                properties=self.graph.nodes[node_id].get('properties', {}),
+            )
+            for node_id in self._index.lookup(property_key, property_value)
+        ]
+
+    def bulk_load(
+        self,
+        nodes: Iterable[Tuple[str, Dict[str, Any]]],
+        edges: Iterable[Tuple[str, str, float]],
+    ) -> None:
+        """Insert nodes and edges in bulk, then rebuild the indexes.
+
+        Args:
+            nodes: (node_id, {"label": ..., "properties": ...}) tuples
+            edges: (source, target, weight) tuples; edges with missing
+                endpoints are skipped
+        """
+        self.graph.add_nodes_from(nodes)
+        self.graph.add_edges_from(
+            (source, target, {"weight": weight})
+            for source, target, weight in edges
+            if source in self.graph and target in self.graph
+        )
+        self.rebuild_index()
+
+    def rebuild_index(self) -> None:
+        """Rebuild secondary indexes from the current node set."""
+        self._index.clear()
+        for node_id, data in self.graph.nodes(data=True):
+            self._index.add(node_id, data.get('properties', {}))
+
     def has_node(self, node_id: str) -> bool:
         return self.graph.has_node(node_id)
 
+    def clear(self) -> None:
+        self.graph.clear()
+        self._index.clear()
+
+
+def create_graph_engine(settings: Optional[GraphSettings] = None) -> IGraphEngine:
+    """Create the in-memory graph engine configured in GraphSettings.
+
+    Args:
+        settings (GraphSettings, optional): Graph settings
+
+    Raises:
+        ValueError: If the engine is unknown
+
+    Returns:
+        IGraphEngine: Engine implementation
+    """
+    settings = settings or GraphSettings()
+    if settings.engine == "networkx":
+        return NetworkXGraph(settings.indexed_properties)
+    if settings.engine == "csr":
+        # Imported here: csr_graph builds on this module and needs numpy
+        from app.core.csr_graph import CSRGraph
+        return CSRGraph(settings.indexed_properties, merge_threshold=settings.csr_merge_threshold)
+    raise ValueError(f"Unknown graph engine: {settings.engine}")
+
 
 class IdGenerator:
     """Manages unique ID generation"""
@@ -77,8 +523,10 @@ class IdGenerator:
         return str(self._counter)
 
     def sync_with_existing_ids(self, nodes: list[Dict[str, Any]]) -> None:
-        for node in nodes:
-            node_id = node.get("id")
+        self.sync_with_ids(node.get("id") for node in nodes)
+
+    def sync_with_ids(self, node_ids: Iterable[Optional[str]]) -> None:
+        for node_id in node_ids:
             if node_id:
                 try:
                     self._counter = max(self._counter, int(node_id))
@@ -86,101 +534,867 @@ class IdGenerator:
                     pass
 
 
+class GraphBatchError(ValueError):
+    """Raised when an operation of a batch fails; the batch was rolled back."""
+
+    def __init__(self, index: int, message: str):
+        super().__init__(message)
+        self.index = index
+        self.message = message
+
+
+class IGraphListener(ABC):
+    """Observer of committed graph changes.
+
+    Callbacks run synchronously inside the mutation (possibly on a loader
+    thread), so they must be cheap and must not change the graph; defer
+    heavier work to a background task.
+    """
+
+    @abstractmethod
+    def on_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        """Called with the mutation records of every committed change."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def on_reset(self) -> None:
+        """Called after the whole graph was (re)loaded from storage."""
+        raise NotImplementedError
+
+
 class GraphManager:
     """Orchestrates graph operations, persistence and ID generation"""
 
     def __init__(
         self,
-        graph: Optional[NetworkXGraph] = None,
+        graph: Optional[IGraphEngine] = None,
         persistence_service: Optional[GraphPersistenceService] = None,
-        id_generator: Optional[IdGenerator] = None
+        id_generator: Optional[IdGenerator] = None,
+        settings: Optional[GraphSettings] = None,
+        shared_log: Optional[SharedGraphLog] = None,
+        load: bool = True,
     ):
-        self._graph = graph or NetworkXGraph()
-        self._persistence_service = persistence_service or GraphPersistenceService()
+        self._settings = settings or GraphSettings()
+        self._graph = graph or create_graph_engine(self._settings)
+        self._persistence_service = persistence_service or GraphPersistenceService(
+            create_graph_storage(self._settings))
         self._id_generator = id_generator or IdGenerator()
-        self.load_from_storage()
+        self._flusher: Optional[WriteBehindFlusher] = None
+        self._writer: Optional[PersistenceWriter] = None
+        # Version is bumped on every committed change; the instance token keeps
+        # ETags from a previous process from matching after a restart
+        self._version = 0
+        self._instance_token = uuid.uuid4().hex[:12]
+        self._structure_cache: Optional[Tuple[int, bytes]] = None
+        # (version, node ids, edge keys) addressed by pagination offsets
+        self._page_snapshot: Optional[Tuple[int, List[str], List[Tuple[str, str]]]] = None
+        # Bounded log of (version, mutation) for delta sync; deltas can be
+        # served to clients at any version >= _change_log_floor
+        self._change_log: deque[Tuple[int, Dict[str, Any]]] = deque(
+            maxlen=max(1, self._settings.change_log_size))
+        self._change_log_floor = 0
+        # Multi-process mode: changes go through a feed shared by all workers
+        # (which also makes it the write-ahead log) and the storage only
+        # receives periodic checkpoints
+        self._shared = shared_log
+        if self._shared is None and self._settings.multiprocess:
+            self._shared = SharedGraphLog()
+        self._feed_position: FeedPosition = (0, 0)
+        self._feed_stat: FeedStat = (0, 0, 0)
+        self._checkpoint_version = 0
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        if self._shared is None and self._settings.write_behind_enabled:
+            self._flusher = WriteBehindFlusher(
+                self._write_to_storage,
+                interval=self._settings.flush_interval,
+                max_dirty=self._settings.flush_max_dirty,
+            )
+        if self._shared is None and self._settings.async_persistence:
+            self._writer = PersistenceWriter(
+                self._persistence_service, self._graph.get_structure_data)
+        # Set once the graph was loaded from storage (even if loading failed);
+        # with load=False call `load_from_storage` or `hydrate` before serving
+        self._ready = threading.Event()
+        # Per event loop, awaited by `wait_until_ready` without holding a thread
+        self._ready_events: Dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+        self._ready_lock = threading.Lock()
+        self._listeners: List[IGraphListener] = []
+        self._load_timings: Dict[str, float] = {}
+        if load:
+            self.load_from_storage()
 
     def load_from_storage(self) -> None:
-        """Load graph data from storage and populate the in-memory graph."""
+        """Load graph data from storage and populate the in-memory graph.
+
+        The cyclic garbage collector is paused while loading: hydration only
+        allocates long-lived objects, and repeated collections over them
+        otherwise dominate cold-start time of large graphs.
+        """
+        start_time = time.perf_counter()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
         try:
-            graph_data = self._persistence_service.load_graph()
-            nodes = graph_data.get("nodes", [])
-            edges = graph_data.get("edges", [])
+            if self._shared is not None:
+                self._load_checkpoint()
+                return
+
+            nodes, edges = self._persistence_service.load_graph_tuples()
+            self._load_timings["read_time"] = time.perf_counter() - start_time
 
             if not nodes:
                 return
 
-            self._id_generator.sync_with_existing_ids(nodes)
+            build_start = time.perf_counter()
+            # Loading replaces the graph, so calling it again never duplicates it
+            self._graph.clear()
+            self._id_generator.sync_with_ids(node_id for node_id, _ in nodes)
+            self._graph.bulk_load(nodes, edges)
+            self._load_timings["build_time"] = time.perf_counter() - build_start
+            self._version += 1
+            self._change_log.clear()
+            self._change_log_floor = self._version
+            self._notify_reset()
+        except Exception as e:
+            from app.core.logging import get_logger
+            logger = get_logger(__name__)
+            logger.error("Failed to load graph from storage", error=str(e))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            self._load_timings["load_time"] = time.perf_counter() - start_time
+            self._set_ready()
 
-            for node_data in nodes:
-                self._graph.add_node(
-                    node_id=node_data.get("id"),
-                    label=node_data.get("label", ""),
-                    properties=node_data.get("properties", {}),
-                )
+    def _set_ready(self) -> None:
+        """Mark the graph loaded and wake the waiters of every event loop."""
+        with self._ready_lock:
+            self._ready.set()
+            events, self._ready_events = self._ready_events, {}
+        for loop, event in events.items():
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The loop was closed meanwhile, nobody waits there any more
+                pass
+
+    async def hydrate(self) -> None:
+        """Load the graph from storage without blocking the event loop.
+
+        Graph endpoints are gated on `wait_until_ready` meanwhile, so nothing
+        touches the graph while it is being built on the worker thread.
+        """
+        from app.core.logging import get_logger
+        logger = get_logger(__name__)
+        if self._ready.is_set():
+            return
+        await asyncio.to_thread(self.load_from_storage)
+        nodes_count, edges_count = self.count_elements()
+        logger.info(
+            "Graph loaded from storage",
+            nodes_count=nodes_count,
+            edges_count=edges_count,
+            **{key: f"{value:.4f}s" for key, value in self._load_timings.items()},
+        )
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the graph was loaded from storage."""
+        return self._ready.is_set()
+
+    @property
+    def load_timings(self) -> Dict[str, float]:
+        """Durations of the startup load phases in seconds."""
+        return dict(self._load_timings)
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the graph to be loaded.
+
+        Args:
+            timeout (float, optional): Seconds to wait at most
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self._ready_lock:
+            if self._ready.is_set():
+                return True
+            event = self._ready_events.setdefault(asyncio.get_running_loop(), asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _load_checkpoint(self) -> None:
+        """Load the latest checkpoint and replay the shared feed after it."""
+        self._install_checkpoint(*self._read_checkpoint())
+        self._catch_up()
+
+    def _read_checkpoint(self) -> Tuple[Dict[str, Any], List[Any], List[Any]]:
+        """Read the checkpoint stamp and graph; only file I/O, safe off the loop."""
+        with self._shared.checkpoint_lock.acquire(shared=True):
+            stamp = self._shared.read_stamp()
+            nodes, edges = self._persistence_service.load_graph_tuples()
+        return stamp, nodes, edges
+
+    def _install_checkpoint(self, stamp: Dict[str, Any], nodes: List[Any], edges: List[Any]) -> None:
+        """Replace the in-memory graph with a checkpoint read by `_read_checkpoint`."""
+        self._graph.clear()
+        self._id_generator.sync_with_ids(node_id for node_id, _ in nodes)
+        self._graph.bulk_load(nodes, edges)
+        self._instance_token = stamp["cluster"]
+        self._version = self._checkpoint_version = stamp["version"]
+        self._feed_position = (0, 0)
+        self._feed_stat = (0, 0, 0)
+        self._change_log.clear()
+        self._change_log_floor = self._version
+        self._notify_reset()
+
+    def _catch_up(self) -> None:
+        """Apply feed records committed by other workers."""
+        self._feed_stat = self._shared.stat()
+        records, self._feed_position, gap = self._shared.read_since(
+            self._version, self._feed_position)
+        if gap:
+            self._log_feed_gap()
+            self._load_checkpoint()
+            return
+        self._replay(records)
+
+    async def _catch_up_async(self) -> None:
+        """Like `_catch_up`, with the feed and checkpoint reads on a worker thread.
+
+        The graph is only changed on the loop. Reads overtaken by a mutation
+        of this worker (which catches up itself) are dropped.
+        """
+        while True:
+            state = (self._version, self._feed_position)
+            feed_stat = self._shared.stat()
+            records, feed_position, gap = await asyncio.to_thread(self._shared.read_since, *state)
+            if (self._version, self._feed_position) != state:
+                return
+            if not gap:
+                self._feed_stat, self._feed_position = feed_stat, feed_position
+                self._replay(records)
+                return
+            self._log_feed_gap()
+            checkpoint = await asyncio.to_thread(self._read_checkpoint)
+            if (self._version, self._feed_position) != state:
+                return
+            self._install_checkpoint(*checkpoint)
+            # Then read the feed after the checkpoint
+
+    def _log_feed_gap(self) -> None:
+        # Records this worker missed were folded into a newer checkpoint
+        from app.core.logging import get_logger
+        logger = get_logger(__name__)
+        logger.info("Graph change feed moved past this worker, reloading checkpoint",
+                    version=self._version)
+
+    def _replay(self, records: List[Dict[str, Any]]) -> None:
+        for record in records:
+            for mutation in record["mutations"]:
+                self._apply_mutation(mutation)
+                self._log_change(record["v"], mutation)
+            self._version = record["v"]
+            self._notify(record["mutations"])
 
-            for edge_data in edges:
-                source = edge_data.get("source")
-                target = edge_data.get("target")
-                if source and target and self._graph.has_node(source) and self._graph.has_node(target):
-                    self._graph.add_edge(
-                        source,
-                        target,
-                        weight=edge_data.get("weight", 1.0),
-                    )
+    def _apply_mutation(self, mutation: Dict[str, Any]) -> None:
+        """Apply a mutation record to the in-memory graph."""
+        op = mutation.get("op")
+        if op == "upsert_node":
+            node = mutation["node"]
+            self._graph.add_node(node["id"], node.get("label") or "", node.get("properties") or {})
+            self._id_generator.sync_with_ids([node["id"]])
+        elif op == "delete_node":
+            self._graph.remove_node(mutation["id"])
+        elif op == "upsert_edge":
+            edge = mutation["edge"]
+            if self._graph.has_node(edge["source"]) and self._graph.has_node(edge["target"]):
+                self._graph.add_edge(edge["source"], edge["target"], edge.get("weight", 1.0))
+        elif op == "delete_edge":
+            self._graph.remove_edge(mutation["source"], mutation["target"])
+
+    def refresh(self) -> None:
+        """Pick up changes committed by other worker processes.
+
+        Costs a single stat call when nothing changed; a no-op outside
+        multi-process mode. On the event loop use `refresh_async`.
+        """
+        if self._feed_changed():
+            self._catch_up()
+
+    async def refresh_async(self) -> None:
+        """Pick up changes of other workers without blocking the event loop.
+
+        The feed (and, after a feed gap, the checkpoint) is read on a worker
+        thread; concurrent callers share one catch-up.
+        """
+        if not self._feed_changed():
+            return
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if self._feed_changed():
+                await self._catch_up_async()
+
+    def _feed_changed(self) -> bool:
+        return (
+            self._shared is not None
+            and self._ready.is_set()
+            and self._shared.stat() != self._feed_stat
+        )
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Serialize a mutation with other worker processes.
+
+        Holds the feed lock and catches up first, so new node ids and
+        versions never collide with another worker's. Mutations are
+        synchronous, so this runs on the event loop: the lock is only held
+        for the feed append, but a mutation may wait for another worker's
+        and, after a feed gap, reloads the checkpoint in place.
+        """
+        if self._shared is None:
+            yield
+            return
+        with self._shared.feed_lock.acquire():
+            # Always read the feed here: the stat fingerprint is only a hint
+            self._catch_up()
+            yield
+        # Outside the feed lock: the checkpoint takes it again to trim the feed
+        if self._version - self._checkpoint_version >= self._settings.checkpoint_interval:
+            self._schedule_checkpoint()
+
+    def checkpoint(self) -> bool:
+        """Save the full graph to storage and trim the shared feed.
+
+        Returns:
+            bool: True if a checkpoint was written
+        """
+        if self._shared is None:
+            return False
+        return self._write_checkpoint(self._graph.get_structure_data(), self._version)
+
+    def _write_checkpoint(self, graph_data: Dict[str, Any], version: int) -> bool:
+        """Write a checkpoint of graph data taken at `version`.
+
+        Skipped when another worker is checkpointing or already covered it.
+        """
+        from app.core.logging import get_logger
+        logger = get_logger(__name__)
+        try:
+            with self._shared.checkpoint_lock.acquire(blocking=False) as acquired:
+                if not acquired:
+                    return False
+                stamp_version = self._shared.read_stamp()["version"]
+                if stamp_version >= version:
+                    self._checkpoint_version = max(self._checkpoint_version, stamp_version)
+                    return False
+                self._persistence_service.save_graph(graph_data)
+                self._shared.write_stamp(version)
+            # Never wait for the feed lock while holding the checkpoint lock:
+            # a worker reloading under the feed lock waits for the latter
+            with self._shared.feed_lock.acquire():
+                self._shared.rotate(version)
+        except Exception as e:
+            logger.error("Failed to write graph checkpoint", version=version, error=str(e))
+            return False
+        self._checkpoint_version = max(self._checkpoint_version, version)
+        logger.info("Graph checkpoint written", version=version)
+        return True
+
+    def _schedule_checkpoint(self) -> None:
+        """Checkpoint off the event loop if one is running, inline otherwise."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.checkpoint()
+            return
+        if self._checkpoint_task is None or self._checkpoint_task.done():
+            self._checkpoint_task = loop.create_task(self._checkpoint_in_background())
+
+    async def _checkpoint_in_background(self) -> None:
+        graph_data = self._graph.get_structure_data()
+        await asyncio.to_thread(self._write_checkpoint, graph_data, self._version)
+
+    def _publish(self, mutations: List[Dict[str, Any]]) -> None:
+        """Append committed mutations to the shared feed."""
+        try:
+            self._feed_position = self._shared.append(self._version, mutations)
+            self._feed_stat = self._shared.stat()
         except Exception as e:
             from app.core.logging import get_logger
             logger = get_logger(__name__)
-            logger.error("Failed to load graph from storage", error=str(e))
+            logger.error("Failed to append to graph change feed", error=str(e))
+
+    @property
+    def _writer_running(self) -> bool:
+        return self._writer is not None and self._writer.is_running
+
+    def _write_to_storage(self) -> None:
+        """Write current graph state to storage, raising on failure.
+
+        While the background writer runs the save is only requested; the
+        writer takes the snapshot when it is ready to write it.
+        """
+        if self._writer_running:
+            self._writer.request_snapshot()
+            return
+        graph_data = self._graph.get_structure_data()
+        self._persistence_service.save_graph(graph_data)
+
+    def _commit(self, mutations: List[Dict[str, Any]]) -> None:
+        """Record applied in-memory mutations: bump the version and persist."""
+        self._version += 1
+        for mutation in mutations:
+            self._log_change(self._version, mutation)
+        self._notify(mutations)
+        if self._shared is not None:
+            self._publish(mutations)
+            return
+        self._save_to_storage(mutations)
+
+    def add_listener(self, listener: IGraphListener) -> None:
+        """Subscribe to committed changes and reloads."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: IGraphListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
-    def _save_to_storage(self) -> None:
-        """Save current graph state to storage."""
+    def _notify(self, mutations: List[Dict[str, Any]]) -> None:
+        for listener in self._listeners:
+            try:
+                listener.on_mutations(mutations)
+            except Exception as e:
+                from app.core.logging import get_logger
+                logger = get_logger(__name__)
+                logger.error("Graph listener failed", listener=type(listener).__name__, error=str(e))
+
+    def _notify_reset(self) -> None:
+        for listener in self._listeners:
+            try:
+                listener.on_reset()
+            except Exception as e:
+                from app.core.logging import get_logger
+                logger = get_logger(__name__)
+                logger.error("Graph listener failed", listener=type(listener).__name__, error=str(e))
+
+    def _log_change(self, version: int, mutation: Dict[str, Any]) -> None:
+        if len(self._change_log) == self._change_log.maxlen:
+            evicted_version, _ = self._change_log[0]
+            self._change_log_floor = max(self._change_log_floor, evicted_version)
+        self._change_log.append((version, mutation))
+
+    def _save_to_storage(self, mutations: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Save current graph state to storage.
+
+        Incremental storages persist only the given mutation records. For
+        full-document storages in write-behind mode the graph is only marked
+        dirty and the background flusher coalesces the save. While the
+        background writer runs, writes are queued to it instead of blocking
+        the caller.
+
+        Args:
+            mutations (List[Dict[str, Any]], optional): Mutation records
+                describing the change (see IIncrementalGraphStorage)
+        """
+        if mutations is not None and self._persistence_service.supports_incremental:
+            if self._writer_running:
+                self._writer.submit_mutations(mutations)
+                return
+            try:
+                self._persistence_service.apply_mutations(mutations)
+            except Exception as e:
+                from app.core.logging import get_logger
+                logger = get_logger(__name__)
+                logger.error("Failed to persist graph mutations", error=str(e))
+            return
+        if self._flusher is not None:
+            self._flusher.mark_dirty()
+            return
         try:
-            graph_struct = self._graph.get_structure()
-            # Convert to dict for persistence layer
-            graph_data = graph_struct.model_dump()
-            self._persistence_service.save_graph(graph_data)
+            self._write_to_storage()
         except Exception as e:
             from app.core.logging import get_logger
             logger = get_logger(__name__)
             logger.error("Failed to save graph to storage", error=str(e))
 
+    async def start_persistence(self) -> None:
+        """Start the background writer and, in write-behind mode, the flusher."""
+        if self._writer is not None:
+            self._writer.start(asyncio.get_running_loop())
+        if self._flusher is not None:
+            await self._flusher.start()
+
+    async def stop_persistence(self) -> None:
+        """Flush pending mutations and wait until everything is written."""
+        if self._flusher is not None:
+            await self._flusher.stop()
+        if self._writer is not None:
+            await asyncio.to_thread(self._writer.stop)
+        if self._shared is not None:
+            if self._checkpoint_task is not None:
+                await self._checkpoint_task
+            await self.refresh_async()
+            await self._checkpoint_in_background()
+
+    def flush(self) -> bool:
+        """Flush pending write-behind mutations immediately.
+
+        With the background writer running the flush is only queued; see
+        `wait_for_writes`.
+
+        Returns:
+            bool: True if pending mutations were written or queued
+        """
+        if self._flusher is None:
+            return False
+        return self._flusher.flush()
+
+    async def wait_for_writes(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the background writer has processed all queued writes.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        if not self._writer_running:
+            return True
+        return await asyncio.to_thread(self._writer.drain, timeout)
+
+    def persistence_metrics(self) -> Dict[str, Any]:
+        """Persistence mode, write-behind flush and background writer metrics."""
+        if self._shared is not None:
+            return {
+                "mode": "multiprocess",
+                "version": self._version,
+                "checkpoint_version": self._checkpoint_version,
+                "feed_bytes": self._feed_stat[1],
+            }
+        if self._flusher is None:
+            metrics: Dict[str, Any] = {"mode": "write_through"}
+        else:
+            metrics = {
+                "mode": "write_behind",
+                "dirty_mutations": self._flusher.dirty_count,
+                **self._flusher.metrics.to_dict(),
+            }
+        if self._writer is not None:
+            metrics["writer"] = {
+                "running": self._writer.is_running,
+                "queue_depth": self._writer.queue_depth,
+                **self._writer.metrics.to_dict(),
+            }
+        return metrics
+
+    @property
+    def version(self) -> int:
+        """Monotonically increasing version of the in-memory graph."""
+        return self._version
+
+    @property
+    def shared_log(self) -> Optional[SharedGraphLog]:
+        """Feed shared with the other workers; None outside multi-process mode."""
+        return self._shared
+
+    @property
+    def instance_token(self) -> str:
+        """Identifies this in-memory graph; versions are only comparable within it."""
+        return self._instance_token
+
+    @property
+    def etag(self) -> str:
+        return f'"{self._instance_token}-{self._version}"'
+
     def show_graph(self) -> Graph:
         return self._graph.get_structure()
 
+    def changes_since(self, version: int) -> Optional[List[Tuple[int, Dict[str, Any]]]]:
+        """Mutations committed after the given version.
+
+        Args:
+            version (int): Graph version the client has
+
+        Returns:
+            Optional[List[Tuple[int, Dict[str, Any]]]]: (version, mutation) pairs,
+                or None if the change log no longer covers that version
+        """
+        if version < self._change_log_floor or version > self._version:
+            return None
+        return [(v, mutation) for v, mutation in self._change_log if v > version]
+
+    def get_page(self, offset: int, limit: int) -> Tuple[Dict[str, Any], Optional[int]]:
+        """Page over nodes followed by edges.
+
+        Offsets address the sequence of all nodes followed by all edges, so
+        they are only meaningful for the graph version they were issued at.
+        The ids of that sequence are taken once per version, so a page costs
+        O(limit) wherever it starts.
+
+        Args:
+            offset (int): Position in the node+edge sequence
+            limit (int): Max number of nodes and edges in the page
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[int]]: Page with 'nodes' and 'edges'
+                keys and the offset of the next page (None on the last page)
+        """
+        snapshot = self._page_snapshot
+        if snapshot is None or snapshot[0] != self._version:
+            snapshot = (self._version, self._graph.node_ids(), self._graph.edge_keys())
+            self._page_snapshot = snapshot
+        _, node_ids, edge_keys = snapshot
+        nodes_count = len(node_ids)
+        total = nodes_count + len(edge_keys)
+        nodes = [
+            self._graph.get_node_data(node_id) for node_id in node_ids[offset:offset + limit]
+        ]
+        edge_start = max(0, offset - nodes_count)
+        edges = [
+            self._graph.get_edge_data(source, target)
+            for source, target in edge_keys[edge_start:edge_start + limit - len(nodes)]
+        ]
+        next_offset = offset + len(nodes) + len(edges)
+        return {"nodes": nodes, "edges": edges}, next_offset if next_offset < total else None
+
+    def get_node_data(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Data of a node ({"id", "label", "properties"}), or None."""
+        return self._graph.get_node_data(node_id)
+
+    def get_edge_data(self, source: str, target: str) -> Optional[Dict[str, Any]]:
+        """Data of an edge ({"source", "target", "weight"}), or None."""
+        return self._graph.get_edge_data(source, target)
+
+    def iter_node_data(self) -> Iterator[Dict[str, Any]]:
+        """Iterate data of all nodes."""
+        return self._graph.iter_node_data()
+
+    def edge_index(self) -> Tuple[List[str], Sequence[int], Sequence[int], Sequence[float]]:
+        """Graph as flat edge columns for array-based analytics.
+
+        The columns may be arrays shared with the engine; copy them before
+        handing them to another thread.
+
+        Returns:
+            Tuple: (node ids, edge sources, edge targets, edge weights) where
+                sources and targets are positions in the node id list
+        """
+        return self._graph.edge_index()
+
+    def iter_structure_chunks(self, chunk_size: int = 500) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+        """Iterate ("node" | "edge", data) items in chunks for streaming.
+
+        Only node ids and edge keys are captured up front; element data is
+        read chunk by chunk, so mutations between chunks are tolerated and
+        elements removed meanwhile are skipped.
+        """
+        chunk: List[Tuple[str, Dict[str, Any]]] = []
+        for node_id in self._graph.node_ids():
+            node_data = self._graph.get_node_data(node_id)
+            if node_data is not None:
+                chunk.append(("node", node_data))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        for source, target in self._graph.edge_keys():
+            edge_data = self._graph.get_edge_data(source, target)
+            if edge_data is not None:
+                chunk.append(("edge", edge_data))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def neighborhood(
+        self,
+        node_id: str,
+        depth: int = 1,
+        direction: str = "both",
+        max_nodes: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        return self._graph.neighborhood(node_id, depth, direction, max_nodes)
+
+    def count_elements(self) -> Tuple[int, int]:
+        """Number of nodes and edges."""
+        return self._graph.number_of_nodes(), self._graph.number_of_edges()
+
+    def show_graph_json(self) -> Tuple[str, bytes]:
+        """Serialized graph structure, cached per graph version.
+
+        Returns:
+            Tuple[str, bytes]: ETag of the current version and JSON body
+        """
+        cache = self._structure_cache
+        if cache is None or cache[0] != self._version:
+            body = json.dumps(
+                self._graph.get_structure_data(),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            cache = (self._version, body)
+            self._structure_cache = cache
+        return self.etag, cache[1]
+
     def add_node(self, label: str, properties: Dict[str, Any]) -> Node:
-        node_id = self._id_generator.next_id()
-        new_node = self._graph.add_node(node_id, label, properties)
-        self._save_to_storage()
+        with self._exclusive():
+            node_id = self._id_generator.next_id()
+            new_node = self._graph.add_node(node_id, label, properties)
+            self._commit([{"op": "upsert_node", "node": new_node.model_dump()}])
         return new_node
 
     def remove_node(self, node_id: str) -> bool:
-        success = self._graph.remove_node(node_id)
-        if success:
-            self._save_to_storage()
+        with self._exclusive():
+            success = self._graph.remove_node(node_id)
+            if success:
+                self._commit([{"op": "delete_node", "id": node_id}])
         return success
 
     def change_node(self, node_id: str, label: str, properties: Dict[str, Any]) -> bool:
-        success = self._graph.change_node(node_id, label, properties)
-        if success:
-            self._save_to_storage()
+        with self._exclusive():
+            success = self._graph.change_node(node_id, label, properties)
+            if success:
+                self._commit([{
+                    "op": "upsert_node",
+                    "node": {"id": node_id, "label": label, "properties": properties},
+                }])
         return success
 
     def add_edge(self, source: str, target: str, weight: float) -> Edge:
-        new_edge = self._graph.add_edge(source, target, weight)
-        self._save_to_storage()
+        with self._exclusive():
+            new_edge = self._graph.add_edge(source, target, weight)
+            self._commit([{"op": "upsert_edge", "edge": new_edge.model_dump()}])
         return new_edge
 
     def remove_edge(self, source: str, target: str) -> bool:
-        success = self._graph.remove_edge(source, target)
-        if success:
-            self._save_to_storage()
+        with self._exclusive():
+            success = self._graph.remove_edge(source, target)
+            if success:
+                self._commit([{"op": "delete_edge", "source": source, "target": target}])
         return success
 
+    def apply_batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply operations atomically with a single persistence write.
+
+        Each operation is a dict with an 'op' key ("add_node", "change_node",
+        "remove_node", "add_edge", "remove_edge") and the arguments of the
+        matching method. An "add_node" may define a 'ref'; later operations
+        can then use "$<ref>" in place of the new node id.
+
+        Args:
+            operations (List[Dict[str, Any]]): Operations to apply in order
+
+        Raises:
+            GraphBatchError: If an operation fails; all previous operations
+                of the batch are rolled back
+
+        Returns:
+            List[Dict[str, Any]]: Per-operation results with 'node' or 'edge' keys
+        """
+        with self._exclusive():
+            return self._apply_batch(operations)
+
+    def _apply_batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        refs: Dict[str, str] = {}
+        undo: List[Callable[[], Any]] = []
+        mutations: List[Dict[str, Any]] = []
+        results: List[Dict[str, Any]] = []
+
+        def resolve(node_id: Optional[str]) -> str:
+            if not node_id:
+                raise ValueError("Node id is required")
+            if node_id.startswith("$"):
+                if node_id[1:] not in refs:
+                    raise ValueError(f"Unknown node reference: {node_id}")
+                return refs[node_id[1:]]
+            return node_id
+
+        for index, operation in enumerate(operations):
+            op = operation.get("op")
+            try:
+                if op == "add_node":
+                    node_id = self._id_generator.next_id()
+                    node = self._graph.add_node(
+                        node_id, operation.get("label") or "", operation.get("properties") or {})
+                    undo.append(partial(self._graph.remove_node, node_id))
+                    if operation.get("ref"):
+                        refs[operation["ref"]] = node_id
+                    mutations.append({"op": "upsert_node", "node": node.model_dump()})
+                    results.append({"node": node})
+                elif op == "change_node":
+                    node_id = resolve(operation.get("node_id"))
+                    previous = self._graph.get_node_data(node_id)
+                    if previous is None:
+                        raise ValueError("Node not found")
+                    label = operation.get("label") or ""
+                    properties = operation.get("properties") or {}
+                    self._graph.change_node(node_id, label, properties)
+                    undo.append(partial(self._graph.change_node, node_id,
+                                        previous["label"], previous["properties"]))
+                    node_data = {"id": node_id, "label": label, "properties": properties}
+                    mutations.append({"op": "upsert_node", "node": node_data})
+                    results.append({"node": Node(**node_data)})
+                elif op == "remove_node":
+                    node_id = resolve(operation.get("node_id"))
+                    previous = self._graph.get_node_data(node_id)
+                    if previous is None:
+                        raise ValueError("Node not found")
+                    incident_edges = self._graph.get_incident_edges(node_id)
+                    self._graph.remove_node(node_id)
+                    undo.append(partial(self._restore_node, previous, incident_edges))
+                    mutations.append({"op": "delete_node", "id": node_id})
+                    results.append({})
+                elif op == "add_edge":
+                    source = resolve(operation.get("source"))
+                    target = resolve(operation.get("target"))
+                    previous = self._graph.get_edge_data(source, target)
+                    edge = self._graph.add_edge(source, target, operation.get("weight", 1.0))
+                    if previous is None:
+                        undo.append(partial(self._graph.remove_edge, source, target))
+                    else:
+                        undo.append(partial(self._graph.add_edge, source, target,
+                                            previous["weight"]))
+                    mutations.append({"op": "upsert_edge", "edge": edge.model_dump()})
+                    results.append({"edge": edge})
+                elif op == "remove_edge":
+                    source = resolve(operation.get("source"))
+                    target = resolve(operation.get("target"))
+                    previous = self._graph.get_edge_data(source, target)
+                    if previous is None:
+                        raise ValueError("Edge not found")
+                    self._graph.remove_edge(source, target)
+                    undo.append(partial(self._graph.add_edge, source, target,
+                                        previous["weight"]))
+                    mutations.append({"op": "delete_edge", "source": source, "target": target})
+                    results.append({})
+                else:
+                    raise ValueError(f"Unknown operation: {op}")
+            except Exception as e:
+                for rollback in reversed(undo):
+                    rollback()
+                if isinstance(e, ValueError):
+                    raise GraphBatchError(index, str(e)) from e
+                raise
+
+        if mutations:
+            self._commit(mutations)
+        return results
+
+    def _restore_node(self, node_data: Dict[str, Any], edges: List[Dict[str, Any]]) -> None:
+        """Re-add a removed node together with its edges (batch rollback)."""
+        self._graph.add_node(node_data["id"], node_data["label"], node_data["properties"])
+        for edge in edges:
+            self._graph.add_edge(edge["source"], edge["target"], edge["weight"])
+
     def find_node_by_property(self, property_key: str, property_value: Any) -> Optional[Node]:
         return self._graph.find_node_by_property(property_key, property_value)
 
+    def find_nodes_by_property(self, property_key: str, property_value: Any) -> List[Node]:
+        return self._graph.find_nodes_by_property(property_key, property_value)
+
 
 # Initialize the graph orchestrator
-graph_instance = GraphManager()
+graph_instance = GraphManager(load=False)
 
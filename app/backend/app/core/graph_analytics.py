@@ -0,0 +1,178 @@
+# python
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+# project
+from app.core.config import GraphAnalyticsSettings
+from app.core.graph import GraphManager, graph_instance
+from app.core.graph_metrics import METRICS, compute_metric
+from app.core.logging import get_logger
+
+# 3rd party
+import numpy as np
+
+
+logger = get_logger(__name__)
+
+# Settings passed to compute_metric; plain values keep the worker processes
+# from importing the app configuration
+METRIC_PARAMETERS = {"betweenness_sample", "pagerank_alpha", "pagerank_max_iter", "pagerank_tol"}
+
+
+class GraphAnalyticsService:
+    """Computes graph metrics and caches them per graph version.
+
+    A metric is recomputed lazily, on the first request after the graph
+    changed; concurrent requests share one computation. Large graphs are
+    computed in a process pool, so the API process only pays for taking
+    the edge list. Callers that accept a slightly outdated result get the
+    cached one immediately while the new one is computed in the background.
+    """
+
+    def __init__(
+        self,
+        graph_manager: GraphManager,
+        settings: Optional[GraphAnalyticsSettings] = None,
+    ):
+        self._graph_manager = graph_manager
+        self._settings = settings or GraphAnalyticsSettings()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # metric -> result of the latest computation
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        # metric -> (graph version, computation in progress)
+        self._pending: Dict[str, Tuple[int, asyncio.Task]] = {}
+
+    async def get(self, metric: str, allow_stale: bool = False) -> Dict[str, Any]:
+        """Get a metric for the current graph version.
+
+        Args:
+            metric (str): One of METRICS
+            allow_stale (bool): Return a result of an older graph version
+                right away (if any) and refresh it in the background
+
+        Raises:
+            ValueError: If the metric is unknown
+
+        Returns:
+            Dict[str, Any]: metric, version, nodes_count, sample_size and
+                "values" (node id -> score) or "components"
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown graph metric: {metric}")
+        version = self._graph_manager.version
+        cached = self._cache.get(metric)
+        if cached is not None and cached["version"] == version:
+            return {**cached, "stale": False}
+
+        task = self._compute(metric, version)
+        if allow_stale and cached is not None:
+            return {**cached, "stale": True}
+        # Shielded: a disconnecting client must not cancel a shared computation
+        result = await asyncio.shield(task)
+        return {**result, "stale": result["version"] != self._graph_manager.version}
+
+    def peek(self, metric: str) -> Optional[Dict[str, Any]]:
+        """Latest result of a metric, of any graph version, without waiting.
+
+        Starts a computation in the background if the result is missing or
+        outdated, so a later call gets a current one.
+        """
+        version = self._graph_manager.version
+        cached = self._cache.get(metric)
+        if cached is None or cached["version"] != version:
+            self._compute(metric, version)
+        return cached
+
+    def _compute(self, metric: str, version: int) -> asyncio.Task:
+        pending = self._pending.get(metric)
+        if pending is not None and pending[0] == version and not pending[1].done():
+            return pending[1]
+        task = asyncio.create_task(self._run(metric, version))
+        task.add_done_callback(self._log_failure)
+        self._pending[metric] = (version, task)
+        return task
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            logger.error(
+                "Graph metric computation failed",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+
+    async def _run(self, metric: str, version: int) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        node_ids, sources, targets, weights = self._graph_manager.edge_index()
+        # Copies: the columns may be arrays the engine keeps changing on the loop
+        arrays = (
+            np.array(sources, dtype=np.int64),
+            np.array(targets, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+        )
+        call = (
+            compute_metric, metric, len(node_ids), *arrays,
+            self._settings.model_dump(include=METRIC_PARAMETERS),
+        )
+        if len(sources) >= self._settings.pool_min_edges:
+            executor = self._get_executor()
+            try:
+                values, sample_size = await asyncio.get_running_loop().run_in_executor(
+                    executor, *call)
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory); start a new pool next time
+                if self._executor is executor:
+                    self._executor = None
+                raise
+        else:
+            values, sample_size = await asyncio.to_thread(*call)
+
+        result: Dict[str, Any] = {
+            "metric": metric,
+            "version": version,
+            "nodes_count": len(node_ids),
+            "sample_size": sample_size,
+        }
+        if metric == "components":
+            result["components"] = [
+                [node_ids[position] for position in component] for component in values
+            ]
+        else:
+            order = np.argsort(-np.asarray(values), kind="stable")
+            result["values"] = {node_ids[position]: float(values[position]) for position in order}
+
+        cached = self._cache.get(metric)
+        if cached is None or cached["version"] <= version:
+            self._cache[metric] = result
+        logger.info(
+            "Graph metric computed",
+            metric=metric,
+            version=version,
+            nodes_count=len(node_ids),
+            edges_count=len(sources),
+            compute_time=f"{time.perf_counter() - start_time:.4f}s",
+        )
+        return result
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned rather than forked: the API process runs threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._settings.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, abandoning queued computations."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+graph_analytics = GraphAnalyticsService(graph_instance)
@@ -0,0 +1,103 @@
+# python
+from typing import Any, Dict, Optional, Tuple
+
+# 3rd party
+import networkx as nx
+import numpy as np
+
+
+METRICS = ("pagerank", "in_degree", "out_degree", "betweenness", "components")
+
+
+def _pagerank(
+    nodes_count: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    alpha: float,
+    max_iter: int,
+    tol: float,
+) -> np.ndarray:
+    """Weighted PageRank by power iteration, matching nx.pagerank defaults.
+
+    Negative weights count as 0. Rank of dangling nodes (no out-edge of
+    positive weight) is spread uniformly over all nodes.
+    """
+    weights = np.clip(weights, 0.0, None)
+    out_weight = np.bincount(sources, weights=weights, minlength=nodes_count)
+    dangling = out_weight <= 0
+    source_weight = out_weight[sources]
+    transition = np.divide(
+        weights, source_weight, out=np.zeros_like(weights, dtype=float), where=source_weight > 0)
+    rank = np.full(nodes_count, 1.0 / nodes_count)
+    for _ in range(max_iter):
+        previous = rank
+        rank = alpha * np.bincount(
+            targets, weights=previous[sources] * transition, minlength=nodes_count)
+        rank += (alpha * previous[dangling].sum() + 1.0 - alpha) / nodes_count
+        if np.abs(rank - previous).sum() < nodes_count * tol:
+            break
+    return rank
+
+
+def _to_networkx(nodes_count: int, sources: np.ndarray, targets: np.ndarray) -> nx.DiGraph:
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(nodes_count))
+    graph.add_edges_from(zip(sources.tolist(), targets.tolist()))
+    return graph
+
+
+def compute_metric(
+    metric: str,
+    nodes_count: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    parameters: Dict[str, Any],
+) -> Tuple[Any, Optional[int]]:
+    """Compute a metric over nodes addressed by position.
+
+    Runs in analytics worker processes, so it only takes and returns
+    picklable arrays, lists and plain values.
+
+    Args:
+        metric (str): One of METRICS
+        nodes_count (int): Number of nodes
+        sources, targets (np.ndarray): Edge endpoints as node positions
+        weights (np.ndarray): Edge weights
+        parameters (Dict[str, Any]): betweenness_sample and pagerank_alpha,
+            pagerank_max_iter, pagerank_tol
+
+    Returns:
+        Tuple: (score per node position, or component position lists; sample
+            size if the metric was sampled)
+    """
+    if nodes_count == 0:
+        return [], None
+    # Degree centrality is normalized by the max possible degree, like networkx
+    scale = 1.0 / (nodes_count - 1) if nodes_count > 1 else 1.0
+    if metric == "in_degree":
+        return np.bincount(targets, minlength=nodes_count) * scale, None
+    if metric == "out_degree":
+        return np.bincount(sources, minlength=nodes_count) * scale, None
+    if metric == "pagerank":
+        return _pagerank(
+            nodes_count, sources, targets, weights,
+            parameters["pagerank_alpha"],
+            parameters["pagerank_max_iter"],
+            parameters["pagerank_tol"],
+        ), None
+    graph = _to_networkx(nodes_count, sources, targets)
+    if metric == "betweenness":
+        sample = parameters["betweenness_sample"]
+        sample_size = sample if nodes_count > sample else None
+        scores = nx.betweenness_centrality(graph, k=sample_size, seed=0)
+        return np.array([scores[position] for position in range(nodes_count)]), sample_size
+    if metric == "components":
+        components = sorted(
+            (sorted(component) for component in nx.weakly_connected_components(graph)),
+            key=len,
+            reverse=True,
+        )
+        return components, None
+    raise ValueError(f"Unknown graph metric: {metric}")
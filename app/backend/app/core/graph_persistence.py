@@ -1,10 +1,14 @@
 # python
 import json
+import os
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # project
+from app.core.config import GraphSettings
 from app.core.logging import get_logger
 from app.core.base_json_storage import BaseJsonStorage
 
@@ -37,6 +41,119 @@ class IGraphStorage(ABC):
         raise NotImplementedError
 
 
+class IIncrementalGraphStorage(IGraphStorage):
+    """Interface for graph storage that can persist single mutations
+    without rewriting the whole graph.
+
+    Mutation records are dicts with an 'op' key:
+        {"op": "upsert_node", "node": {...}}
+        {"op": "delete_node", "id": "..."}
+        {"op": "upsert_edge", "edge": {...}}
+        {"op": "delete_edge", "source": "...", "target": "..."}
+    """
+
+    @abstractmethod
+    def upsert_node(self, node_data: Dict[str, Any]) -> None:
+        """Insert or replace a node.
+
+        Args:
+            node_data (Dict[str, Any]): Node data with 'id', 'label' and 'properties' keys
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_node(self, node_id: str) -> None:
+        """Delete a node together with its incident edges.
+
+        Args:
+            node_id (str): id of the node to delete
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_edge(self, edge_data: Dict[str, Any]) -> None:
+        """Insert or replace an edge.
+
+        Args:
+            edge_data (Dict[str, Any]): Edge data with 'source', 'target' and 'weight' keys
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_edge(self, source: str, target: str) -> None:
+        """Delete an edge.
+
+        Args:
+            source (str): id of the source node
+            target (str): id of the target node
+        """
+        raise NotImplementedError
+
+    def apply_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        """Persist a sequence of mutation records in order.
+
+        Args:
+            mutations (List[Dict[str, Any]]): Mutation records
+
+        Raises:
+            ValueError: If a record has an unknown 'op'
+        """
+        for mutation in mutations:
+            op = mutation.get("op")
+            if op == "upsert_node":
+                self.upsert_node(mutation["node"])
+            elif op == "delete_node":
+                self.delete_node(mutation["id"])
+            elif op == "upsert_edge":
+                self.upsert_edge(mutation["edge"])
+            elif op == "delete_edge":
+                self.delete_edge(mutation["source"], mutation["target"])
+            else:
+                raise ValueError(f"Unknown graph mutation: {op}")
+
+
+def apply_mutation_to_state(
+    nodes: Dict[str, Dict[str, Any]],
+    edges: Dict[Tuple[str, str], Dict[str, Any]],
+    adjacency: Dict[str, set],
+    mutation: Dict[str, Any],
+) -> None:
+    """Apply a mutation record to an in-memory graph state.
+
+    Args:
+        nodes: Node data by id
+        edges: Edge data by (source, target)
+        adjacency: Edge keys incident to each node id
+        mutation: Mutation record
+    """
+    op = mutation.get("op")
+    if op == "upsert_node":
+        node = mutation["node"]
+        nodes[node["id"]] = node
+        adjacency.setdefault(node["id"], set())
+    elif op == "delete_node":
+        node_id = mutation["id"]
+        nodes.pop(node_id, None)
+        for key in adjacency.pop(node_id, set()):
+            edges.pop(key, None)
+            other = key[1] if key[0] == node_id else key[0]
+            adjacency.get(other, set()).discard(key)
+    elif op == "upsert_edge":
+        edge = mutation["edge"]
+        key = (edge["source"], edge["target"])
+        if key[0] in nodes and key[1] in nodes:
+            edges[key] = edge
+            adjacency[key[0]].add(key)
+            adjacency[key[1]].add(key)
+    elif op == "delete_edge":
+        key = (mutation["source"], mutation["target"])
+        edges.pop(key, None)
+        for node_id in key:
+            adjacency.get(node_id, set()).discard(key)
+    else:
+        raise ValueError(f"Unknown graph mutation: {op}")
+
+
 class JsonGraphStorage(BaseJsonStorage, IGraphStorage):
     """JSON file-based graph storage implementation"""
 
@@ -84,6 +201,385 @@ class JsonGraphStorage(BaseJsonStorage, IGraphStorage):
         self._save_json(graph_data)
 
 
+class JournalGraphStorage(IIncrementalGraphStorage):
+    """Append-only mutation journal on top of a JSON snapshot.
+
+    Every mutation appends one NDJSON record to the journal. Once the journal
+    grows past `compact_threshold` records it is folded into the snapshot and
+    truncated. Loading replays the snapshot plus the journal tail. Replay is
+    idempotent, so a crash between writing the snapshot and truncating the
+    journal is harmless.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Optional[Path] = None,
+        journal_path: Optional[Path] = None,
+        compact_threshold: int = 1000,
+        fsync: bool = False,
+    ) -> None:
+        """Initialize journal storage.
+
+        Args:
+            snapshot_path (Path, optional): Path to snapshot JSON file.
+                Defaults to app/backend/app/data/graph.json
+            journal_path (Path, optional): Path to journal NDJSON file.
+                Defaults to graph.journal.ndjson next to the snapshot
+            compact_threshold (int): Journal records that trigger compaction
+            fsync (bool): Force every appended record to disk
+        """
+        self._snapshot = JsonGraphStorage(snapshot_path)
+        if journal_path is None:
+            journal_path = self._snapshot.file_path.with_name(
+                f"{self._snapshot.file_path.stem}.journal.ndjson")
+        self.journal_path = Path(journal_path)
+        self.compact_threshold = max(1, compact_threshold)
+        self.fsync = fsync
+        self._journal_records = 0
+
+    def load_graph(self) -> Dict[str, Any]:
+        """Load snapshot and replay the journal tail on top of it.
+
+        Returns:
+            Dict[str, Any]: Graph data with 'nodes' and 'edges' keys
+        """
+        graph_data, records, skipped = self._replay()
+        self._journal_records = records
+        logger.info(
+            "Graph journal replayed",
+            path=str(self.journal_path),
+            journal_records=records,
+            skipped_records=skipped,
+        )
+        # Compacting also drops a torn tail so new appends start on a clean line
+        if records >= self.compact_threshold or skipped:
+            self._write_snapshot(graph_data)
+        return graph_data
+
+    def save_graph(self, graph_data: Dict[str, Any]) -> None:
+        """Replace the snapshot with full graph data and reset the journal.
+
+        Args:
+            graph_data (Dict[str, Any]): Graph data with 'nodes' and 'edges' keys
+
+        Raises:
+            IOError: If write operation fails
+        """
+        self._write_snapshot(graph_data)
+
+    def upsert_node(self, node_data: Dict[str, Any]) -> None:
+        self._append({"op": "upsert_node", "node": node_data})
+
+    def delete_node(self, node_id: str) -> None:
+        self._append({"op": "delete_node", "id": node_id})
+
+    def upsert_edge(self, edge_data: Dict[str, Any]) -> None:
+        self._append({"op": "upsert_edge", "edge": edge_data})
+
+    def delete_edge(self, source: str, target: str) -> None:
+        self._append({"op": "delete_edge", "source": source, "target": target})
+
+    def apply_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        """Append all records with a single write."""
+        for mutation in mutations:
+            if mutation.get("op") not in ("upsert_node", "delete_node", "upsert_edge", "delete_edge"):
+                raise ValueError(f"Unknown graph mutation: {mutation.get('op')}")
+        self._append(*mutations)
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot."""
+        graph_data, records, _ = self._replay()
+        self._write_snapshot(graph_data)
+        logger.info(
+            "Graph journal compacted",
+            path=str(self.journal_path),
+            journal_records=records,
+        )
+
+    def _append(self, *records: Dict[str, Any]) -> None:
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        )
+        try:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except IOError as e:
+            logger.error(
+                "Failed to append to graph journal",
+                path=str(self.journal_path),
+                error=str(e),
+            )
+            raise
+
+        self._journal_records += len(records)
+        if self._journal_records >= self.compact_threshold:
+            self.compact()
+
+    def _replay(self) -> Tuple[Dict[str, Any], int, int]:
+        snapshot = self._snapshot.load_graph()
+        nodes: Dict[str, Dict[str, Any]] = {}
+        edges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        adjacency: Dict[str, set] = {}
+        for node in snapshot.get("nodes", []):
+            apply_mutation_to_state(nodes, edges, adjacency, {"op": "upsert_node", "node": node})
+        for edge in snapshot.get("edges", []):
+            apply_mutation_to_state(nodes, edges, adjacency, {"op": "upsert_edge", "edge": edge})
+
+        records = 0
+        skipped = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        mutation = json.loads(line)
+                        apply_mutation_to_state(nodes, edges, adjacency, mutation)
+                    except (json.JSONDecodeError, KeyError, ValueError) as e:
+                        # A torn final write from a crash; skip it
+                        logger.warning(
+                            "Skipping invalid graph journal record",
+                            path=str(self.journal_path),
+                            line_number=line_number,
+                            error=str(e),
+                        )
+                        skipped += 1
+                        continue
+                    records += 1
+
+        return {"nodes": list(nodes.values()), "edges": list(edges.values())}, records, skipped
+
+    def _write_snapshot(self, graph_data: Dict[str, Any]) -> None:
+        self._snapshot.save_graph(graph_data)
+        # Snapshot is durable now; the journal can be dropped
+        open(self.journal_path, "w", encoding="utf-8").close()
+        self._journal_records = 0
+
+
+class SqliteGraphStorage(IIncrementalGraphStorage):
+    """SQLite graph storage with row-level incremental writes.
+
+    Nodes and edges are rows, so a single mutation costs one row write.
+    The database runs in WAL journal mode and every call (including
+    `apply_mutations` batches) is a single transaction.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS nodes (
+            id TEXT PRIMARY KEY,
+            label TEXT NOT NULL,
+            properties TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS edges (
+            source TEXT NOT NULL,
+            target TEXT NOT NULL,
+            weight REAL NOT NULL DEFAULT 1.0,
+            PRIMARY KEY (source, target)
+        );
+        CREATE INDEX IF NOT EXISTS idx_edges_target ON edges (target);
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[Path] = None,
+        legacy_json_path: Optional[Path] = None,
+    ) -> None:
+        """Initialize SQLite storage.
+
+        Args:
+            file_path (Path, optional): Path to the database file.
+                Defaults to app/backend/app/data/graph.sqlite3
+            legacy_json_path (Path, optional): JSON graph file imported when
+                the database is created, so switching backends keeps the data
+        """
+        if file_path is None:
+            file_path = Path(__file__).parent.parent / "data" / "graph.sqlite3"
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.file_path.exists()
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.file_path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.SCHEMA)
+
+        if is_new and legacy_json_path is not None and Path(legacy_json_path).exists():
+            graph_data = JsonGraphStorage(legacy_json_path).load_graph()
+            if graph_data.get("nodes"):
+                self.save_graph(graph_data)
+                logger.info(
+                    "Graph imported into SQLite storage",
+                    path=str(self.file_path),
+                    source=str(legacy_json_path),
+                )
+
+    def load_graph(self) -> Dict[str, Any]:
+        """Load graph data from the database.
+
+        Returns:
+            Dict[str, Any]: Graph data with 'nodes' and 'edges' keys
+        """
+        with self._lock:
+            node_rows = self._connection.execute(
+                "SELECT id, label, properties FROM nodes ORDER BY rowid").fetchall()
+            edge_rows = self._connection.execute(
+                "SELECT source, target, weight FROM edges ORDER BY rowid").fetchall()
+
+        nodes = [
+            {"id": node_id, "label": label, "properties": json.loads(properties)}
+            for node_id, label, properties in node_rows
+        ]
+        edges = [
+            {"source": source, "target": target, "weight": weight}
+            for source, target, weight in edge_rows
+        ]
+        logger.info(
+            "Graph loaded from SQLite storage",
+            path=str(self.file_path),
+            nodes_count=len(nodes),
+            edges_count=len(edges),
+        )
+        return {"nodes": nodes, "edges": edges}
+
+    def save_graph(self, graph_data: Dict[str, Any]) -> None:
+        """Replace all rows with full graph data.
+
+        Args:
+            graph_data (Dict[str, Any]): Graph data with 'nodes' and 'edges' keys
+
+        Raises:
+            IOError: If write operation fails
+        """
+        def write(cursor: sqlite3.Cursor) -> None:
+            cursor.execute("DELETE FROM edges")
+            cursor.execute("DELETE FROM nodes")
+            cursor.executemany(
+                "INSERT INTO nodes (id, label, properties) VALUES (?, ?, ?)",
+                [self._node_row(node) for node in graph_data.get("nodes", [])],
+            )
+            cursor.executemany(
+                "INSERT OR REPLACE INTO edges (source, target, weight) VALUES (?, ?, ?)",
+                [self._edge_row(edge) for edge in graph_data.get("edges", [])],
+            )
+
+        self._transaction(write)
+
+    def upsert_node(self, node_data: Dict[str, Any]) -> None:
+        self.apply_mutations([{"op": "upsert_node", "node": node_data}])
+
+    def delete_node(self, node_id: str) -> None:
+        self.apply_mutations([{"op": "delete_node", "id": node_id}])
+
+    def upsert_edge(self, edge_data: Dict[str, Any]) -> None:
+        self.apply_mutations([{"op": "upsert_edge", "edge": edge_data}])
+
+    def delete_edge(self, source: str, target: str) -> None:
+        self.apply_mutations([{"op": "delete_edge", "source": source, "target": target}])
+
+    def apply_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        """Apply mutation records in a single transaction."""
+        def write(cursor: sqlite3.Cursor) -> None:
+            for mutation in mutations:
+                op = mutation.get("op")
+                if op == "upsert_node":
+                    cursor.execute(
+                        "INSERT INTO nodes (id, label, properties) VALUES (?, ?, ?) "
+                        "ON CONFLICT (id) DO UPDATE SET "
+                        "label = excluded.label, properties = excluded.properties",
+                        self._node_row(mutation["node"]),
+                    )
+                elif op == "delete_node":
+                    node_id = mutation["id"]
+                    cursor.execute(
+                        "DELETE FROM edges WHERE source = ? OR target = ?", (node_id, node_id))
+                    cursor.execute("DELETE FROM nodes WHERE id = ?", (node_id,))
+                elif op == "upsert_edge":
+                    cursor.execute(
+                        "INSERT INTO edges (source, target, weight) VALUES (?, ?, ?) "
+                        "ON CONFLICT (source, target) DO UPDATE SET weight = excluded.weight",
+                        self._edge_row(mutation["edge"]),
+                    )
+                elif op == "delete_edge":
+                    cursor.execute(
+                        "DELETE FROM edges WHERE source = ? AND target = ?",
+                        (mutation["source"], mutation["target"]),
+                    )
+                else:
+                    raise ValueError(f"Unknown graph mutation: {op}")
+
+        self._transaction(write)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _transaction(self, write: Any) -> None:
+        with self._lock:
+            cursor = self._connection.cursor()
+            try:
+                cursor.execute("BEGIN")
+                write(cursor)
+                cursor.execute("COMMIT")
+            except sqlite3.Error as e:
+                cursor.execute("ROLLBACK")
+                logger.error(
+                    "Failed to write graph to SQLite storage",
+                    path=str(self.file_path),
+                    error=str(e),
+                )
+                raise IOError(str(e)) from e
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _node_row(node: Dict[str, Any]) -> Tuple[str, str, str]:
+        return (
+            node["id"],
+            node.get("label", ""),
+            json.dumps(node.get("properties", {}), ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _edge_row(edge: Dict[str, Any]) -> Tuple[str, str, float]:
+        return edge["source"], edge["target"], edge.get("weight", 1.0)
+
+
+def create_graph_storage(settings: Optional[GraphSettings] = None) -> IGraphStorage:
+    """Create graph storage for the configured backend.
+
+    Args:
+        settings (GraphSettings, optional): Graph settings
+
+    Raises:
+        ValueError: If the storage backend is unknown
+
+    Returns:
+        IGraphStorage: Storage implementation
+    """
+    settings = settings or GraphSettings()
+    if settings.storage_backend == "json":
+        return JsonGraphStorage()
+    if settings.storage_backend == "journal":
+        return JournalGraphStorage(compact_threshold=settings.journal_compact_threshold)
+    if settings.storage_backend == "sqlite":
+        return SqliteGraphStorage(legacy_json_path=JsonGraphStorage().file_path)
+    if settings.storage_backend == "binary":
+        # Imported here: binary_snapshot builds on this module
+        from app.core.binary_snapshot import BinaryGraphStorage
+        return BinaryGraphStorage(legacy_json_path=JsonGraphStorage().file_path)
+    raise ValueError(f"Unknown graph storage backend: {settings.storage_backend}")
+
+
 class GraphPersistenceService:
     """Service for managing graph persistence"""
 
@@ -92,9 +588,14 @@ class GraphPersistenceService:
 
         Args:
             storage (IGraphStorage, optional): Graph storage implementation.
-                Defaults to JsonGraphStorage with default path.
+                Defaults to the backend configured in GraphSettings.
         """
-        self.storage = storage or JsonGraphStorage()
+        self.storage = storage or create_graph_storage()
+
+    @property
+    def supports_incremental(self) -> bool:
+        """Whether the storage can persist single mutations."""
+        return isinstance(self.storage, IIncrementalGraphStorage)
 
     def load_graph(self) -> Dict[str, Any]:
         """Load graph from storage.
@@ -104,6 +605,32 @@ class GraphPersistenceService:
         """
         return self.storage.load_graph()
 
+    def load_graph_tuples(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, str, float]]]:
+        """Load graph as networkx-ready tuples for bulk insertion.
+
+        Storages that can produce tuples directly (binary snapshots) skip the
+        intermediate node and edge dicts.
+
+        Returns:
+            Tuple: (node_id, {"label", "properties"}) and (source, target, weight) lists
+        """
+        load_tuples = getattr(self.storage, "load_graph_tuples", None)
+        if load_tuples is not None:
+            return load_tuples()
+
+        graph_data = self.storage.load_graph()
+        nodes = [
+            (node["id"], {"label": node.get("label", ""), "properties": node.get("properties", {})})
+            for node in graph_data.get("nodes", [])
+            if node.get("id")
+        ]
+        edges = [
+            (edge["source"], edge["target"], edge.get("weight", 1.0))
+            for edge in graph_data.get("edges", [])
+            if edge.get("source") and edge.get("target")
+        ]
+        return nodes, edges
+
     def save_graph(self, graph_data: Dict[str, Any]) -> None:
         """Save graph to storage.
 
@@ -112,6 +639,21 @@ class GraphPersistenceService:
         """
         self.storage.save_graph(graph_data)
 
+    def apply_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        """Persist mutation records through incremental storage.
+
+        Args:
+            mutations (List[Dict[str, Any]]): Mutation records
+
+        Raises:
+            TypeError: If the storage is not incremental
+        """
+        if not isinstance(self.storage, IIncrementalGraphStorage):
+            raise TypeError(
+                f"{type(self.storage).__name__} does not support incremental writes")
+        self.storage.apply_mutations(mutations)
+
 
-# Global persistence service instance
-persistence_service = GraphPersistenceService()
+# Global persistence service instance; pinned to JSON so importing this module
+# never opens the configured storage (the graph manager creates its own)
+persistence_service = GraphPersistenceService(JsonGraphStorage())
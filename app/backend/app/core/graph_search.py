@@ -0,0 +1,494 @@
+# python
+import asyncio
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# project
+from app.core.config import GraphSearchSettings
+from app.core.graph import GraphManager, IGraphListener, graph_instance
+from app.core.graph_persistence import JsonGraphStorage
+from app.core.logging import get_logger
+
+# 3rd party
+import numpy as np
+
+
+logger = get_logger(__name__)
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+COMBINING_MARKS_RE = re.compile(r"[\u0300-\u036f]")
+INDEX_FORMAT = 1
+
+# ids, fingerprints, lengths, terms, term offsets, positions, term frequencies:
+# documents and their postings grouped by term, positions index documents
+IndexArrays = Tuple[
+    List[str], np.ndarray, np.ndarray, List[str], np.ndarray, np.ndarray, np.ndarray]
+
+
+def fold_text(value: str) -> str:
+    """Fold text for matching: casefolded, without diacritics ("Émile" -> "emile")."""
+    if not value.isascii():
+        value = COMBINING_MARKS_RE.sub("", unicodedata.normalize("NFKD", value))
+    return value.casefold()
+
+
+def tokenize(value: str) -> List[str]:
+    return TOKEN_RE.findall(fold_text(value))
+
+
+def _field_values(node_data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(field, text) pairs of a node that are indexed."""
+    properties = node_data.get("properties") or {}
+    label = node_data.get("label") or ""
+    fields = [("label", label)]
+    title = properties.get("title")
+    # Book nodes are labeled with their title, count it once
+    if isinstance(title, str) and title != label:
+        fields.append(("title", title))
+    for field in ("author", "subjects", "description"):
+        value = properties.get(field)
+        if isinstance(value, str):
+            fields.append((field, value))
+        elif isinstance(value, list):
+            fields.append((field, " ".join(item for item in value if isinstance(item, str))))
+    return fields
+
+
+def _fingerprint(fields: List[Tuple[str, str]]) -> int:
+    return zlib.crc32("\x1f".join(f"{field}={text}" for field, text in fields).encode("utf-8"))
+
+
+class _InvertedIndex:
+    """Postings of documents per term, in NumPy arrays.
+
+    Every document gets a position; postings of a term are arrays of
+    positions and term frequencies, so a term is scored for all of its
+    documents in a few vectorized operations. Added documents are appended
+    to per-term tails, merged into the arrays on the next read. Removed
+    documents only get a zero length and are dropped from postings lazily;
+    once they outnumber live ones the whole index is compacted.
+    """
+
+    def __init__(self, field_weights: Dict[str, float], arrays: Optional[IndexArrays] = None):
+        self._field_weights = field_weights
+        ids, fingerprints, lengths, terms, term_offsets, positions, frequencies = (
+            arrays or ([], np.empty(0, np.uint32), np.empty(0), [], np.zeros(1, np.int64),
+                       np.empty(0, np.int32), np.empty(0, np.float32)))
+        self.ids: List[Optional[str]] = list(ids)
+        self.positions: Dict[str, int] = {node_id: position for position, node_id in enumerate(ids)}
+        capacity = max(1024, 2 * len(ids))
+        self.lengths = np.zeros(capacity)
+        self.lengths[:len(ids)] = lengths
+        self.fingerprints = np.zeros(capacity, np.uint32)
+        self.fingerprints[:len(ids)] = fingerprints
+        self.live_count = len(ids)
+        self.total_length = float(lengths.sum())
+
+        self.terms = list(terms)
+        self.term_ids: Dict[str, int] = {term: term_id for term_id, term in enumerate(terms)}
+        counts = np.diff(term_offsets)
+        self.df: List[int] = counts.tolist()
+        self._postings: List[Tuple[np.ndarray, np.ndarray]] = [
+            (positions[start:end], frequencies[start:end])
+            for start, end in zip(term_offsets[:-1].tolist(), term_offsets[1:].tolist())
+        ]
+        self._tails: Dict[int, Tuple[List[int], List[float]]] = {}
+        # Terms of each document, to keep document frequencies on removal:
+        # one array for the initial documents, lists for later ones
+        entry_terms = np.repeat(np.arange(len(terms), dtype=np.int32), counts)
+        order = np.argsort(positions, kind="stable")
+        self._initial_count = len(ids)
+        self._initial_terms = entry_terms[order]
+        self._initial_offsets = np.searchsorted(positions[order], np.arange(len(ids) + 1))
+        self._added_terms: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def document_terms(self, fields: List[Tuple[str, str]]) -> Dict[str, float]:
+        """Term frequencies of a document, weighted per field."""
+        terms: Dict[str, float] = {}
+        for field, text in fields:
+            weight = self._field_weights.get(field, 1.0)
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+        return terms
+
+    def add(self, node_id: str, fields: List[Tuple[str, str]]) -> None:
+        """Add or re-index a document."""
+        self.remove(node_id)
+        terms = self.document_terms(fields)
+        if not terms:
+            return
+        position = len(self.ids)
+        if position == len(self.lengths):
+            self.lengths = np.concatenate([self.lengths, np.zeros(position)])
+            self.fingerprints = np.concatenate([self.fingerprints, np.zeros(position, np.uint32)])
+        self.ids.append(node_id)
+        self.positions[node_id] = position
+        length = sum(terms.values())
+        self.lengths[position] = length
+        self.fingerprints[position] = _fingerprint(fields)
+        self.live_count += 1
+        self.total_length += length
+
+        term_ids = []
+        for term, frequency in terms.items():
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                term_id = self.term_ids[term] = len(self.terms)
+                self.terms.append(term)
+                self.df.append(0)
+                self._postings.append((np.empty(0, np.int32), np.empty(0, np.float32)))
+            self.df[term_id] += 1
+            tail = self._tails.get(term_id)
+            if tail is None:
+                tail = self._tails[term_id] = ([], [])
+            tail[0].append(position)
+            tail[1].append(frequency)
+            term_ids.append(term_id)
+        self._added_terms[position] = term_ids
+
+    def remove(self, node_id: str) -> None:
+        position = self.positions.pop(node_id, None)
+        if position is None:
+            return
+        if position < self._initial_count:
+            term_ids = self._initial_terms[
+                self._initial_offsets[position]:self._initial_offsets[position + 1]].tolist()
+        else:
+            term_ids = self._added_terms.pop(position)
+        for term_id in term_ids:
+            self.df[term_id] -= 1
+        self.ids[position] = None
+        self.live_count -= 1
+        self.total_length -= self.lengths[position]
+        self.lengths[position] = 0.0
+
+    def postings(self, term_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and frequencies of the live documents containing a term."""
+        positions, frequencies = self._postings[term_id]
+        tail = self._tails.pop(term_id, None)
+        if tail is not None:
+            positions = np.concatenate([positions, np.array(tail[0], np.int32)])
+            frequencies = np.concatenate([frequencies, np.array(tail[1], np.float32)])
+        if len(positions) != self.df[term_id]:
+            alive = self.lengths[positions] > 0
+            positions, frequencies = positions[alive], frequencies[alive]
+        self._postings[term_id] = (positions, frequencies)
+        return positions, frequencies
+
+    @property
+    def garbage_count(self) -> int:
+        """Positions of removed documents."""
+        return len(self.ids) - self.live_count
+
+    def to_arrays(self) -> IndexArrays:
+        """Compact form of the live documents, positions renumbered."""
+        size = len(self.ids)
+        alive = self.lengths[:size] > 0
+        renumber = np.cumsum(alive, dtype=np.int64) - 1
+        terms: List[str] = []
+        positions: List[np.ndarray] = []
+        frequencies: List[np.ndarray] = []
+        for term_id, term in enumerate(self.terms):
+            if self.df[term_id]:
+                term_positions, term_frequencies = self.postings(term_id)
+                terms.append(term)
+                positions.append(renumber[term_positions].astype(np.int32))
+                frequencies.append(term_frequencies)
+        term_offsets = np.zeros(len(terms) + 1, np.int64)
+        np.cumsum([len(p) for p in positions], out=term_offsets[1:])
+        return (
+            [node_id for node_id in self.ids if node_id is not None],
+            self.fingerprints[:size][alive],
+            self.lengths[:size][alive],
+            terms,
+            term_offsets,
+            np.concatenate(positions) if positions else np.empty(0, np.int32),
+            np.concatenate(frequencies) if frequencies else np.empty(0, np.float32),
+        )
+
+
+class GraphSearchIndex(IGraphListener):
+    """BM25 full-text index over graph nodes.
+
+    Indexes labels, titles, authors, subjects and descriptions, case- and
+    diacritic-folded, with per-field weights added to term frequencies.
+    Graph changes are applied as they are committed. After the graph is
+    (re)loaded the index is rebuilt on a worker thread, starting from the
+    persisted snapshot when there is one, so only documents whose text
+    changed since are tokenized again.
+    """
+
+    def __init__(
+        self,
+        graph_manager: GraphManager,
+        settings: Optional[GraphSearchSettings] = None,
+    ):
+        self._graph_manager = graph_manager
+        self._settings = settings or GraphSearchSettings()
+        self._index_path = Path(
+            self._settings.index_path
+            or JsonGraphStorage().file_path.with_name("graph.search.npz"))
+        self._lock = threading.RLock()
+        self._index = _InvertedIndex(self._settings.field_weights)
+        # Built lazily: on the first search after the graph was loaded
+        self._stale = True
+        self._building = False
+        self._backlog: List[Dict[str, Any]] = []
+        self._build_lock: Optional[asyncio.Lock] = None
+        graph_manager.add_listener(self)
+
+    # --- IGraphListener ---
+
+    def on_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            if self._building:
+                self._backlog.extend(mutations)
+            elif not self._stale:
+                for mutation in mutations:
+                    self._apply(self._index, mutation)
+                self._compact_if_due()
+
+    def on_reset(self) -> None:
+        with self._lock:
+            self._stale = True
+
+    @staticmethod
+    def _apply(index: _InvertedIndex, mutation: Dict[str, Any]) -> None:
+        op = mutation.get("op")
+        if op == "upsert_node":
+            index.add(mutation["node"]["id"], _field_values(mutation["node"]))
+        elif op == "delete_node":
+            index.remove(mutation["id"])
+
+    def _compact_if_due(self) -> None:
+        index = self._index
+        if index.garbage_count > max(index.live_count, 10000):
+            self._index = _InvertedIndex(self._settings.field_weights, index.to_arrays())
+
+    # --- building ---
+
+    @property
+    def is_built(self) -> bool:
+        return not self._stale and not self._building
+
+    async def ensure_built(self) -> None:
+        """Build the index if the graph was (re)loaded since the last build."""
+        if self.is_built:
+            return
+        if self._build_lock is None:
+            self._build_lock = asyncio.Lock()
+        async with self._build_lock:
+            await self._graph_manager.wait_until_ready()
+            while self._stale:
+                start_time = time.perf_counter()
+                # Node data is taken on the loop, where the graph is mutated;
+                # changes committed while the worker thread indexes it are
+                # replayed afterwards
+                nodes = list(self._graph_manager.iter_node_data())
+                with self._lock:
+                    self._stale = False
+                    self._building = True
+                    self._backlog = []
+                try:
+                    index, reused_count = await asyncio.to_thread(self._build, nodes)
+                except BaseException:
+                    with self._lock:
+                        self._building = False
+                        self._stale = True
+                    raise
+                with self._lock:
+                    for mutation in self._backlog:
+                        self._apply(index, mutation)
+                    self._index = index
+                    self._backlog = []
+                    self._building = False
+                logger.info(
+                    "Graph search index built",
+                    documents_count=len(index),
+                    reused_count=reused_count,
+                    terms_count=len(index.terms),
+                    build_time=f"{time.perf_counter() - start_time:.4f}s",
+                )
+
+    def _build(self, nodes: List[Dict[str, Any]]) -> Tuple[_InvertedIndex, int]:
+        """Index of all nodes, updated from the persisted snapshot if possible."""
+        arrays = self._read_persisted() if self._settings.persist else None
+        if arrays is None:
+            return _InvertedIndex(self._settings.field_weights, self._index_arrays(nodes)), 0
+
+        index = _InvertedIndex(self._settings.field_weights, arrays)
+        node_ids = set()
+        reused_count = 0
+        for node in nodes:
+            node_ids.add(node["id"])
+            fields = _field_values(node)
+            position = index.positions.get(node["id"])
+            if position is not None and index.fingerprints[position] == _fingerprint(fields):
+                reused_count += 1
+            else:
+                index.add(node["id"], fields)
+        for node_id in [node_id for node_id in index.positions if node_id not in node_ids]:
+            index.remove(node_id)
+        return index, reused_count
+
+    def _index_arrays(self, nodes: List[Dict[str, Any]]) -> IndexArrays:
+        """Tokenize all nodes into compact arrays in one pass."""
+        weigher = _InvertedIndex(self._settings.field_weights)
+        term_ids: Dict[str, int] = {}
+        ids: List[str] = []
+        fingerprints: List[int] = []
+        lengths: List[float] = []
+        terms_counts: List[int] = []
+        entry_terms: List[int] = []
+        entry_frequencies: List[float] = []
+        for node in nodes:
+            fields = _field_values(node)
+            terms = weigher.document_terms(fields)
+            if not terms:
+                continue
+            ids.append(node["id"])
+            fingerprints.append(_fingerprint(fields))
+            lengths.append(sum(terms.values()))
+            terms_counts.append(len(terms))
+            for term in terms:
+                if term not in term_ids:
+                    term_ids[term] = len(term_ids)
+            entry_terms.extend([term_ids[term] for term in terms])
+            entry_frequencies.extend(terms.values())
+
+        entry_terms_array = np.array(entry_terms, np.int32)
+        entry_positions = np.repeat(np.arange(len(ids), dtype=np.int32), terms_counts)
+        order = np.argsort(entry_terms_array, kind="stable")
+        term_offsets = np.zeros(len(term_ids) + 1, np.int64)
+        np.cumsum(np.bincount(entry_terms_array, minlength=len(term_ids)), out=term_offsets[1:])
+        return (
+            ids,
+            np.array(fingerprints, np.uint32),
+            np.array(lengths),
+            list(term_ids),
+            term_offsets,
+            entry_positions[order],
+            np.array(entry_frequencies, np.float32)[order],
+        )
+
+    # --- persistence ---
+
+    def _read_persisted(self) -> Optional[IndexArrays]:
+        if not self._index_path.exists():
+            return None
+        try:
+            with np.load(self._index_path, allow_pickle=False) as data:
+                if int(data["format"]) != INDEX_FORMAT:
+                    return None
+                return (
+                    data["ids"].tolist(), data["fingerprints"], data["lengths"],
+                    data["terms"].tolist(), data["term_offsets"], data["positions"],
+                    data["frequencies"],
+                )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Failed to read graph search index", path=str(self._index_path), error=str(e))
+            return None
+
+    def save(self) -> bool:
+        """Write the index beside the graph, for a faster rebuild on next start.
+
+        Returns:
+            bool: False if persistence is disabled, the index is not built or writing failed
+        """
+        if not self._settings.persist or not self.is_built:
+            return False
+        with self._lock:
+            ids, fingerprints, lengths, terms, term_offsets, positions, frequencies = (
+                self._index.to_arrays())
+        temp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                np.savez(
+                    f,
+                    format=np.array(INDEX_FORMAT),
+                    ids=np.array(ids, dtype=str),
+                    fingerprints=fingerprints,
+                    lengths=lengths,
+                    terms=np.array(terms, dtype=str),
+                    term_offsets=term_offsets,
+                    positions=positions,
+                    frequencies=frequencies,
+                )
+            temp_path.replace(self._index_path)
+        except OSError as e:
+            logger.error("Failed to save graph search index", path=str(self._index_path), error=str(e))
+            return False
+        logger.info("Graph search index saved", path=str(self._index_path), documents_count=len(ids))
+        return True
+
+    # --- search ---
+
+    def search(self, query: str, limit: int) -> Tuple[int, List[Tuple[str, float]]]:
+        """Rank nodes by BM25 relevance to a query.
+
+        Nodes matching any query term are ranked; nodes matching more and
+        rarer terms, in shorter or more heavily weighted fields, rank higher.
+
+        Args:
+            query (str): Free text query
+            limit (int): Max number of results
+
+        Returns:
+            Tuple[int, List[Tuple[str, float]]]: Number of matching nodes and
+                (node id, score) of the best ones, highest score first
+        """
+        k1, b = self._settings.k1, self._settings.b
+        with self._lock:
+            index = self._index
+            count = index.live_count
+            term_ids = {index.term_ids.get(term) for term in tokenize(query)}
+            term_ids = [term_id for term_id in term_ids if term_id is not None and index.df[term_id]]
+            if not term_ids or not count:
+                return 0, []
+            average_length = index.total_length / count
+            matches: List[Tuple[np.ndarray, np.ndarray]] = []
+            for term_id in term_ids:
+                positions, frequencies = index.postings(term_id)
+                df = len(positions)
+                idf = np.log(1.0 + (count - df + 0.5) / (df + 0.5))
+                norms = k1 * (1.0 - b + b * index.lengths[positions] / average_length)
+                matches.append((positions, idf * frequencies * (k1 + 1.0) / (frequencies + norms)))
+
+            if sum(len(positions) for positions, _ in matches) * 16 < len(index.ids):
+                # Selective query: sum the few scores without touching every document
+                matched, inverse = np.unique(
+                    np.concatenate([positions for positions, _ in matches]), return_inverse=True)
+                scores = np.bincount(inverse, weights=np.concatenate([s for _, s in matches]))
+            else:
+                all_scores = np.zeros(len(index.ids))
+                for positions, term_scores in matches:
+                    # Positions are unique within a term, no need for np.add.at
+                    all_scores[positions] += term_scores
+                matched = np.flatnonzero(all_scores)
+                scores = all_scores[matched]
+
+            top = np.arange(len(matched))
+            if len(matched) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return len(matched), [
+                (index.ids[matched[rank]], float(scores[rank])) for rank in top.tolist()]
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "built": self.is_built,
+            "documents_count": len(self._index),
+            "terms_count": len(self._index.terms),
+        }
+
+
+graph_search = GraphSearchIndex(graph_instance)
@@ -4,6 +4,7 @@ from typing import Dict, Optional
 from datetime import datetime
 
 # project
+from app.core.http_clients import HttpClientRegistry, http_clients
 from app.core.logging import get_logger
 
 # 3rd party
@@ -72,6 +73,7 @@ class HealthMonitorService(IHealthMonitor):
         base_url: str = "http://localhost:8000",
         health_endpoint: str = "/health/check",
         timeout: float = 5.0,
+        clients: Optional[HttpClientRegistry] = None,
     ):
         """Initialize health monitor service.
 
@@ -79,11 +81,15 @@ class HealthMonitorService(IHealthMonitor):
             base_url: Base URL of the backend service
             health_endpoint: Health check endpoint path
             timeout: Request timeout in seconds
+            clients: Registry of the pooled HTTP clients
         """
         self.base_url = base_url.rstrip("/")
         self.health_endpoint = health_endpoint
         self.timeout = timeout
         self.logger = get_logger(__name__)
+        # No prewarm: the checked server is not listening yet at startup
+        self._clients = clients or http_clients
+        self._clients.register("health", timeout=timeout)
 
     async def check_health(self) -> HealthCheckResult:
         """Perform health check by calling the health endpoint.
@@ -95,34 +101,33 @@ class HealthMonitorService(IHealthMonitor):
         start_time = datetime.now()
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response_time = (datetime.now() - start_time).total_seconds()
+            response = await self._clients.client("health").get(url)
+            response_time = (datetime.now() - start_time).total_seconds()
+
+            is_healthy = response.status_code == 200
 
-                is_healthy = response.status_code == 200
+            result = HealthCheckResult(
+                is_healthy=is_healthy,
+                status_code=response.status_code,
+                response_time=response_time,
+            )
 
-                result = HealthCheckResult(
-                    is_healthy=is_healthy,
+            if is_healthy:
+                self.logger.info(
+                    "Health check successful",
+                    url=url,
+                    status_code=response.status_code,
+                    response_time=f"{response_time:.4f}s",
+                )
+            else:
+                self.logger.warning(
+                    "Health check returned non-200 status",
+                    url=url,
                     status_code=response.status_code,
-                    response_time=response_time,
+                    response_time=f"{response_time:.4f}s",
                 )
 
-                if is_healthy:
-                    self.logger.info(
-                        "Health check successful",
-                        url=url,
-                        status_code=response.status_code,
-                        response_time=f"{response_time:.4f}s",
-                    )
-                else:
-                    self.logger.warning(
-                        "Health check returned non-200 status",
-                        url=url,
-                        status_code=response.status_code,
-                        response_time=f"{response_time:.4f}s",
-                    )
-
-                return result
+            return result
 
         except httpx.TimeoutException:
             response_time = (datetime.now() - start_time).total_seconds()
@@ -0,0 +1,168 @@
+# python
+import asyncio
+import importlib.util
+from typing import Any, Dict, Optional
+
+# project
+from app.core.config import HttpClientSettings
+from app.core.logging import get_logger
+
+# 3rd party
+import httpx
+
+
+logger = get_logger(__name__)
+
+# HTTP/2 needs the optional "h2" package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """Shared, pooled HTTP clients, one per upstream service.
+
+    Services register their upstream once and then reuse its client for
+    every call, so connections (and TLS sessions) are kept alive between
+    requests instead of being set up per call. Each upstream has its own
+    connection limits. `start` opens connections to the upstreams ahead of
+    the first request; `close` shuts all pools down. A client requested
+    before `start` or after `close` is created on demand.
+    """
+
+    def __init__(self, settings: Optional[HttpClientSettings] = None):
+        self._settings = settings or HttpClientSettings()
+        # upstream -> timeout, prewarm URL and connection limit
+        self._upstreams: Dict[str, Dict[str, Any]] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._requests: Dict[str, int] = {}
+        self._prewarm_task: Optional[asyncio.Task] = None
+
+    def register(
+        self,
+        name: str,
+        *,
+        timeout: float,
+        prewarm_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+    ) -> None:
+        """Declare an upstream service.
+
+        Args:
+            name (str): Upstream name
+            timeout (float): Request timeout in seconds
+            prewarm_url (str, optional): URL requested at startup to open
+                connections; only its origin is used
+            max_connections (int, optional): Connection limit, defaults to
+                the configured limit of this upstream
+        """
+        if max_connections is None:
+            max_connections = self._settings.max_connections.get(
+                name, self._settings.default_max_connections)
+        self._upstreams[name] = {
+            "timeout": timeout,
+            "prewarm_url": prewarm_url,
+            "max_connections": max_connections,
+        }
+
+    def client(self, name: str) -> httpx.AsyncClient:
+        """Pooled client of a registered upstream.
+
+        Raises:
+            KeyError: If the upstream was not registered
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._clients[name] = self._create_client(name)
+        return client
+
+    def _create_client(self, name: str) -> httpx.AsyncClient:
+        upstream = self._upstreams[name]
+        max_connections = upstream["max_connections"]
+        self._requests.setdefault(name, 0)
+
+        async def count_request(request: httpx.Request) -> None:
+            self._requests[name] += 1
+
+        return httpx.AsyncClient(
+            timeout=upstream["timeout"],
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(max_connections, self._settings.max_keepalive_connections),
+                keepalive_expiry=self._settings.keepalive_expiry,
+            ),
+            http2=self._settings.http2 and HTTP2_AVAILABLE,
+            event_hooks={"request": [count_request]},
+        )
+
+    async def start(self) -> None:
+        """Create the clients of all upstreams and prewarm their connections.
+
+        Prewarming runs in the background and never delays startup.
+        """
+        if self._settings.http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+        for name in self._upstreams:
+            self.client(name)
+        if self._settings.prewarm:
+            self._prewarm_task = asyncio.create_task(self._prewarm())
+        logger.info(
+            "HTTP clients started",
+            upstreams=list(self._upstreams),
+            http2=self._settings.http2 and HTTP2_AVAILABLE,
+        )
+
+    async def _prewarm(self) -> None:
+        requests = []
+        for name, upstream in self._upstreams.items():
+            if upstream["prewarm_url"]:
+                origin = httpx.URL(upstream["prewarm_url"]).copy_with(path="/", query=None)
+                connections = min(self._settings.prewarm_connections, upstream["max_connections"])
+                requests += [self._prewarm_one(name, origin) for _ in range(connections)]
+        await asyncio.gather(*requests)
+
+    async def _prewarm_one(self, name: str, origin: httpx.URL) -> None:
+        # Any response will do: the connection stays in the pool
+        try:
+            await self.client(name).head(origin, timeout=self._settings.prewarm_timeout)
+        except httpx.HTTPError as e:
+            logger.info("HTTP connection prewarm failed", upstream=name, error=str(e))
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            try:
+                await self._prewarm_task
+            except asyncio.CancelledError:
+                pass
+            self._prewarm_task = None
+        clients, self._clients = self._clients, {}
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
+        logger.info("HTTP clients closed", upstreams=list(clients))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool utilization per upstream."""
+        metrics: Dict[str, Any] = {}
+        for name, upstream in self._upstreams.items():
+            client = self._clients.get(name)
+            # The pool of the default transport, not part of the public httpx API
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+            idle = sum(1 for connection in connections if connection.is_idle())
+            active = len(connections) - idle
+            metrics[name] = {
+                "open": client is not None and not client.is_closed,
+                "requests": self._requests.get(name, 0),
+                "connections": len(connections),
+                "active_connections": active,
+                "idle_connections": idle,
+                "http2_connections": sum(
+                    1 for connection in connections
+                    if getattr(connection, "_connection", None).__class__.__name__ == "AsyncHTTP2Connection"),
+                "queued_requests": max(0, len(getattr(pool, "_requests", [])) - active),
+                "max_connections": upstream["max_connections"],
+                "utilization": round(active / upstream["max_connections"], 4),
+            }
+        return metrics
+
+
+http_clients = HttpClientRegistry()
@@ -0,0 +1,377 @@
+# python
+import asyncio
+import codecs
+import csv
+import json
+import re
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+# project
+from app.core.books_search_service import BooksApiError, IBooksSearchService
+from app.core.config import LibraryImportSettings
+from app.core.graph import GraphBatchError, GraphManager, normalize_isbn
+from app.core.logging import get_logger
+from app.schemas.books_search import BookSearchItem
+
+CODE_PROPERTY_KEY = "code"
+ISBN_PATTERN = re.compile(r"^(\d{9}[\dX]|\d{13})$")
+HEADER_COLUMNS = {"isbn", "title", "author"}
+
+
+class ImportFormatError(ValueError):
+    """Raised when the uploaded reading list cannot be parsed."""
+
+
+class ImportRow:
+    """Single entry of an uploaded reading list."""
+
+    def __init__(
+        self,
+        line: int,
+        raw: str,
+        isbn: Optional[str] = None,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+    ):
+        self.line = line
+        self.raw = raw
+        self.isbn = normalize_isbn(isbn) if isbn else None
+        self.title = (title or "").strip() or None
+        self.author = (author or "").strip() or None
+
+    @property
+    def query(self) -> Optional[str]:
+        """Google Books query resolving this row."""
+        if self.isbn:
+            return f"isbn:{self.isbn}"
+        if self.title:
+            query = f"intitle:{self.title}"
+            if self.author:
+                query += f" inauthor:{self.author}"
+            return query
+        return None
+
+
+class ImportJob:
+    """Progress and final report of a library import."""
+
+    def __init__(self) -> None:
+        self.job_id = uuid.uuid4().hex
+        self.status = "resolving"
+        self.total_rows = 0
+        self.processed_rows = 0
+        self.resolved = 0
+        self.duplicates = 0
+        self.truncated = False
+        self.added_node_ids: List[str] = []
+        self.unresolved: List[Dict[str, Any]] = []
+        self.error: Optional[str] = None
+        self.started_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        # Internal pipeline state
+        self.seen_queries: Set[str] = set()
+        self.seen_codes: Set[str] = set()
+        self.pending: List[Tuple[ImportRow, BookSearchItem]] = []
+        self.task: Optional[asyncio.Task] = None
+
+    def add_unresolved(self, row: ImportRow, reason: str) -> None:
+        self.unresolved.append({"line": row.line, "input": row.raw, "reason": reason})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert job to dictionary for logging and API responses.
+
+        Returns:
+            Dict[str, Any]: Dictionary representation of the job
+        """
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total_rows": self.total_rows,
+            "processed_rows": self.processed_rows,
+            "resolved": self.resolved,
+            "added": len(self.added_node_ids),
+            "duplicates": self.duplicates,
+            "unresolved_count": len(self.unresolved),
+            "truncated": self.truncated,
+            "added_node_ids": list(self.added_node_ids),
+            "unresolved": sorted(self.unresolved, key=lambda row: row["line"]),
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode an async stream of UTF-8 byte chunks into lines."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _row_from_value(line: int, raw: str, value: str, author: Optional[str] = None) -> ImportRow:
+    """Build a row from a single value that is either an ISBN or a title."""
+    isbn = normalize_isbn(value)
+    if isbn and ISBN_PATTERN.match(isbn):
+        return ImportRow(line, raw, isbn=isbn)
+    return ImportRow(line, raw, title=value, author=author)
+
+
+async def parse_rows(chunks: AsyncIterator[bytes], file_format: str) -> AsyncIterator[ImportRow]:
+    """Parse an uploaded reading list row by row.
+
+    CSV files may have a header with 'isbn', 'title' and 'author' columns;
+    without a header the first column is an ISBN or title and the optional
+    second column an author. NDJSON lines are objects with the same keys
+    or plain JSON strings.
+
+    Raises:
+        ImportFormatError: If an NDJSON line is not valid JSON
+    """
+    header: Optional[List[str]] = None
+    first_line = True
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if file_format == "ndjson":
+            try:
+                value = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ImportFormatError(f"Invalid JSON on line {line_number}: {e}") from e
+            if isinstance(value, str):
+                yield _row_from_value(line_number, line, value)
+            elif isinstance(value, dict):
+                yield ImportRow(
+                    line_number, line,
+                    isbn=value.get("isbn"),
+                    title=value.get("title"),
+                    author=value.get("author"),
+                )
+            else:
+                raise ImportFormatError(f"Unsupported value on line {line_number}")
+            continue
+
+        cells = [cell.strip() for cell in next(csv.reader([line]))]
+        if first_line:
+            first_line = False
+            if HEADER_COLUMNS & {cell.lower() for cell in cells}:
+                header = [cell.lower() for cell in cells]
+                continue
+        if header is not None:
+            values = dict(zip(header, cells))
+            yield ImportRow(
+                line_number, line,
+                isbn=values.get("isbn"),
+                title=values.get("title"),
+                author=values.get("author"),
+            )
+        else:
+            yield _row_from_value(
+                line_number, line, cells[0], cells[1] if len(cells) > 1 else None)
+
+
+class LibraryImportService:
+    """Imports reading lists into the graph.
+
+    The upload is parsed within the request; its rows are then resolved
+    against the books API by a bounded pool of background workers.
+    Resolved books are deduplicated by code and inserted into the graph in
+    batches.
+    """
+
+    def __init__(
+        self,
+        search_service: IBooksSearchService,
+        graph_manager: GraphManager,
+        settings: Optional[LibraryImportSettings] = None,
+    ) -> None:
+        self._search_service = search_service
+        self._graph_manager = graph_manager
+        self._settings = settings or LibraryImportSettings()
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+        self._logger = get_logger(__name__)
+
+    def get_job(self, job_id: str) -> Optional[ImportJob]:
+        return self._jobs.get(job_id)
+
+    async def start_import(self, chunks: AsyncIterator[bytes], file_format: str) -> ImportJob:
+        """Parse the upload and start resolving its rows.
+
+        Returns once the upload is parsed (up to `max_rows` rows, no lookups
+        yet); resolution runs in the background and can be followed through
+        the returned job.
+
+        Args:
+            chunks (AsyncIterator[bytes]): Uploaded file content
+            file_format (str): "csv" or "ndjson"
+
+        Raises:
+            ImportFormatError: If the upload cannot be parsed
+
+        Returns:
+            ImportJob: The started job
+        """
+        job = ImportJob()
+        rows: List[ImportRow] = []
+        async for row in parse_rows(chunks, file_format):
+            if len(rows) >= self._settings.max_rows:
+                job.truncated = True
+                break
+            rows.append(row)
+        job.total_rows = len(rows)
+
+        self._register(job)
+        job.task = asyncio.create_task(self._run(job, rows))
+        self._logger.info(
+            "Library import started",
+            job_id=job.job_id,
+            total_rows=job.total_rows,
+            truncated=job.truncated,
+        )
+        return job
+
+    def _register(self, job: ImportJob) -> None:
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self._settings.max_jobs:
+            self._jobs.popitem(last=False)
+
+    async def _run(self, job: ImportJob, rows: List[ImportRow]) -> None:
+        try:
+            # Filled up front: feeding never waits for the workers
+            queue: asyncio.Queue = asyncio.Queue()
+            for row in rows:
+                queue.put_nowait(row)
+            workers = [
+                asyncio.create_task(self._worker(job, queue))
+                for _ in range(self._settings.concurrency)
+            ]
+            for _ in workers:
+                queue.put_nowait(None)
+            # Ends the job only once every worker stopped, even after a failure
+            results = await asyncio.gather(*workers, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            self._insert_pending(job)
+            job.status = "completed"
+        except Exception as exc:
+            job.status = "failed"
+            job.error = str(exc)
+            self._logger.error(
+                "Library import failed",
+                job_id=job.job_id,
+                error=str(exc),
+                error_type=type(exc).__name__,
+                exc_info=True,
+            )
+        finally:
+            job.finished_at = datetime.now()
+            self._logger.info(
+                "Library import finished",
+                job_id=job.job_id,
+                status=job.status,
+                total_rows=job.total_rows,
+                added=len(job.added_node_ids),
+                duplicates=job.duplicates,
+                unresolved_count=len(job.unresolved),
+            )
+
+    async def _worker(self, job: ImportJob, queue: asyncio.Queue) -> None:
+        while True:
+            row = await queue.get()
+            if row is None:
+                return
+            try:
+                await self._process_row(job, row)
+            finally:
+                job.processed_rows += 1
+
+    async def _process_row(self, job: ImportJob, row: ImportRow) -> None:
+        query = row.query
+        if query is None:
+            job.add_unresolved(row, "Row has neither ISBN nor title")
+            return
+        if query in job.seen_queries:
+            job.duplicates += 1
+            return
+        job.seen_queries.add(query)
+
+        # Known ISBNs are resolved locally, without an upstream call
+        if row.isbn and self._graph_manager.find_nodes_by_property("isbn", row.isbn):
+            job.duplicates += 1
+            return
+
+        try:
+            items = await self._search_service.search(query, 1)
+        except BooksApiError as exc:
+            job.add_unresolved(row, f"Books API error {exc.status_code}: {exc.detail}")
+            return
+        except Exception as exc:
+            job.add_unresolved(row, f"Lookup failed: {exc}")
+            return
+
+        if not items or not items[0].code:
+            job.add_unresolved(row, "No matching book found")
+            return
+
+        book = items[0]
+        job.resolved += 1
+        if book.code in job.seen_codes:
+            job.duplicates += 1
+            return
+        job.seen_codes.add(book.code)
+        job.pending.append((row, book))
+        if len(job.pending) >= self._settings.batch_size:
+            self._insert_pending(job)
+
+    def _insert_pending(self, job: ImportJob) -> None:
+        """Insert resolved books that are not yet in the graph as one batch.
+
+        A failed batch is reported as unresolved rows; the import goes on.
+        """
+        pending, job.pending = job.pending, []
+        rows = []
+        operations = []
+        for row, book in pending:
+            if self._graph_manager.find_node_by_property(CODE_PROPERTY_KEY, book.code):
+                job.duplicates += 1
+                continue
+            rows.append(row)
+            operations.append({
+                "op": "add_node",
+                "label": book.title,
+                "properties": book.to_node_properties(),
+            })
+        if not operations:
+            return
+
+        try:
+            results = self._graph_manager.apply_batch(operations)
+        except GraphBatchError as exc:
+            self._logger.error(
+                "Failed to insert imported books",
+                job_id=job.job_id,
+                error=exc.message,
+                books_count=len(operations),
+            )
+            for row in rows:
+                job.add_unresolved(row, f"Graph insert failed: {exc.message}")
+            return
+        job.added_node_ids.extend(result["node"].id for result in results)
+        self._logger.info(
+            "Imported books inserted",
+            job_id=job.job_id,
+            books_count=len(operations),
+        )
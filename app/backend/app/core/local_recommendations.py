@@ -0,0 +1,258 @@
+# python
+import asyncio
+import math
+import re
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+
+# project
+from app.core.book_catalog import BookCatalog
+from app.core.config import RecommendationSettings
+from app.core.graph import normalize_isbn, normalize_text
+from app.core.recommendation_service import PersistedRecommendationService
+from app.core.recommendations_persistence import RecommendationsPersistenceService
+from app.schemas.books_search import BookSearchItem
+from app.schemas.graph import Graph
+from app.schemas.recommendations import BookRecommendation, RecommendationsResponse
+
+# 3rd party
+import numpy as np
+
+
+WORD_RE = re.compile(r"[^\W\d_]{3,}")
+STOPWORDS = frozenset(
+    "the and for with that this from are was were his her their they them into about "
+    "which when where who whom what will would there been have has had not but its "
+    "one all can more most other some such than then these those through over also "
+    "book books novel story new".split()
+)
+
+# (title, author, subjects, description) of a book
+BookText = Tuple[str, str, Tuple[str, ...], str]
+# Sparse feature vector: (sorted unique bucket indexes, weights)
+Features = Tuple[np.ndarray, np.ndarray]
+
+
+class HashedFeaturizer:
+    """Turns book fields into sparse term-frequency vectors.
+
+    Terms are hashed into 2**hash_bits buckets, so no vocabulary has to be
+    kept: subjects and authors are whole-phrase terms, title and description
+    contribute words. Term counts are dampened (1 + log tf) and scaled by
+    the weight of their field.
+    """
+
+    def __init__(self, settings: RecommendationSettings):
+        self.dimensions = 1 << settings.hash_bits
+        self._mask = self.dimensions - 1
+        self._weights = {
+            "s": settings.subject_weight,
+            "a": settings.author_weight,
+            "w": settings.description_weight,
+        }
+        self.features = lru_cache(maxsize=65536)(self._features)
+
+    def _features(self, text: BookText) -> Features:
+        title, author, subjects, description = text
+        terms: Counter = Counter()
+        for subject in subjects:
+            terms["s:" + subject] += 1
+        for name in author.split(","):
+            name = name.strip()
+            if name:
+                terms["a:" + name] += 1
+        for word in WORD_RE.findall(f"{title} {description}"):
+            if word not in STOPWORDS:
+                terms["w:" + word] += 1
+        if not terms:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        buckets = np.fromiter(
+            (zlib.crc32(term.encode("utf-8")) & self._mask for term in terms),
+            dtype=np.int64, count=len(terms))
+        weights = np.fromiter(
+            ((1.0 + math.log(count)) * self._weights[term[0]] for term, count in terms.items()),
+            dtype=np.float64, count=len(terms))
+        indices, inverse = np.unique(buckets, return_inverse=True)
+        return indices, np.bincount(inverse, weights=weights)
+
+
+def book_text(
+    title: Any,
+    author: Any,
+    subjects: Any,
+    description: Any,
+) -> BookText:
+    """Normalized, hashable text fields of a book."""
+    if isinstance(subjects, str):
+        subjects = [subjects]
+    normalized_subjects = (normalize_text(subject) for subject in subjects or ())
+    return (
+        normalize_text(title) or "",
+        normalize_text(author) or "",
+        tuple(sorted({subject for subject in normalized_subjects if subject})),
+        normalize_text(description) or "",
+    )
+
+
+class CatalogMatrix:
+    """TF-IDF matrix over catalog books in CSR form, rows L2-normalized."""
+
+    def __init__(self, items: Sequence[BookSearchItem], featurizer: HashedFeaturizer):
+        self.items = list(items)
+        rows = [
+            featurizer.features(book_text(item.title, item.author, item.subjects, item.description))
+            for item in self.items
+        ]
+        lengths = np.fromiter((len(indices) for indices, _ in rows), dtype=np.int64, count=len(rows))
+        self.row_ids = np.repeat(np.arange(len(rows)), lengths)
+        self.indices = np.concatenate([indices for indices, _ in rows]) if rows else np.empty(0, np.int64)
+        tf = np.concatenate([weights for _, weights in rows]) if rows else np.empty(0)
+
+        # Smoothed IDF, as in scikit-learn; buckets are unique per row
+        df = np.bincount(self.indices, minlength=featurizer.dimensions)
+        self.idf = np.log((1.0 + len(rows)) / (1.0 + df)) + 1.0
+        data = tf * self.idf[self.indices]
+        norms = np.sqrt(np.bincount(self.row_ids, weights=data * data, minlength=len(rows)))
+        norms[norms == 0] = 1.0
+        self.data = data / norms[self.row_ids]
+
+    def scores(self, profile: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row to a dense, normalized profile."""
+        return np.bincount(
+            self.row_ids, weights=self.data * profile[self.indices], minlength=len(self.items))
+
+
+class LocalRecommendationService(PersistedRecommendationService):
+    """
+    Content-based recommendations computed in process
+
+    Books of the user's graph are averaged into a TF-IDF profile over
+    subjects, authors and descriptions; catalog books not in the graph are
+    ranked by cosine similarity to it. The catalog matrix is rebuilt only
+    when the catalog changes.
+    """
+
+    def __init__(
+        self,
+        catalog: BookCatalog,
+        settings: Optional[RecommendationSettings] = None,
+        persistence_service: Optional[RecommendationsPersistenceService] = None,
+        persist: bool = True,
+    ) -> None:
+        super().__init__(persistence_service, persist)
+        self._catalog = catalog
+        self._settings = settings or RecommendationSettings()
+        self._featurizer = HashedFeaturizer(self._settings)
+        self._matrix: Optional[CatalogMatrix] = None
+        self._matrix_version = -1
+        self._matrix_lock = asyncio.Lock()
+
+    async def get_recommendations(
+        self,
+        *,
+        user_id: str,
+        graph: Graph,
+        limit: int,
+    ) -> RecommendationsResponse:
+        start_time = time.perf_counter()
+        matrix = await self._get_matrix()
+        recommendations = self._recommend(graph, matrix, limit)
+        response = RecommendationsResponse(user_id=user_id, recommendations=recommendations)
+        self._logger.info(
+            "Local recommendations computed",
+            user_id=user_id,
+            candidates_count=len(matrix.items),
+            recommendations_count=len(recommendations),
+            compute_time=f"{time.perf_counter() - start_time:.4f}s",
+        )
+        self._save_recommendations(response)
+        return response
+
+    async def _get_matrix(self) -> CatalogMatrix:
+        async with self._matrix_lock:
+            version = self._catalog.version
+            if self._matrix is None or self._matrix_version != version:
+                self._matrix = await asyncio.to_thread(
+                    CatalogMatrix, self._catalog.items(), self._featurizer)
+                self._matrix_version = version
+            return self._matrix
+
+    def _recommend(self, graph: Graph, matrix: CatalogMatrix, limit: int) -> List[BookRecommendation]:
+        profile = np.zeros(self._featurizer.dimensions)
+        codes, isbns, titles = set(), set(), set()
+        subjects: Counter = Counter()
+        authors: Counter = Counter()
+        for node in graph.nodes:
+            properties = node.properties
+            text = book_text(
+                properties.get("title") or node.label,
+                properties.get("author"),
+                properties.get("subjects"),
+                properties.get("description"),
+            )
+            codes.add(properties.get("code"))
+            isbns.add(normalize_isbn(properties.get("isbn")))
+            titles.add((text[0], text[1]))
+            subjects.update(text[2])
+            authors.update(name.strip() for name in text[1].split(",") if name.strip())
+
+            indices, tf = self._featurizer.features(text)
+            weights = tf * matrix.idf[indices]
+            norm = np.linalg.norm(weights)
+            if norm:
+                profile[indices] += weights / norm
+
+        norm = np.linalg.norm(profile)
+        if not norm or not matrix.items:
+            return []
+        scores = matrix.scores(profile / norm)
+
+        # Best candidates first; a few extra in case some are already in the graph
+        count = min(len(scores), limit + len(codes))
+        top = np.argpartition(-scores, count - 1)[:count]
+        recommendations: List[BookRecommendation] = []
+        for position in top[np.argsort(-scores[top], kind="stable")]:
+            score = float(scores[position])
+            if score <= 0 or len(recommendations) >= limit:
+                break
+            item = matrix.items[position]
+            if (
+                item.code in codes
+                or (item.isbn and normalize_isbn(item.isbn) in isbns)
+                or (normalize_text(item.title), normalize_text(item.author) or "") in titles
+            ):
+                continue
+            recommendations.append(BookRecommendation(
+                title=item.title,
+                author=item.author,
+                reason=self._reason(item, subjects, authors),
+                score=min(score, 1.0),
+                metadata={
+                    "code": item.code,
+                    "isbn": item.isbn,
+                    "subjects": item.subjects,
+                    "cover": item.cover,
+                    "source": "local",
+                },
+            ))
+        return recommendations
+
+    @staticmethod
+    def _reason(item: BookSearchItem, subjects: Counter, authors: Counter) -> str:
+        shared_authors = [
+            name for name in (normalize_text(a.strip()) for a in item.author.split(","))
+            if name and name in authors
+        ]
+        if shared_authors:
+            return f"By {item.author}, an author already in your graph"
+        shared_subjects = sorted(
+            (subject for subject in item.subjects if normalize_text(subject) in subjects),
+            key=lambda subject: -subjects[normalize_text(subject)],
+        )
+        if shared_subjects:
+            return "Shares subjects with your books: " + ", ".join(shared_subjects[:3])
+        return "Description is similar to books in your graph"
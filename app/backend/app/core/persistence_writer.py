@@ -0,0 +1,226 @@
+# python
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# project
+from app.core.graph_persistence import GraphPersistenceService
+from app.core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+SNAPSHOT_JOB = "snapshot"
+MUTATIONS_JOB = "mutations"
+
+
+class PersistenceWriterMetrics:
+    """Counters of the background persistence writer."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.written = 0
+        self.superseded = 0
+        self.failed = 0
+        self.total_write_time = 0.0
+        self.last_write_latency: Optional[float] = None
+        self.max_write_time = 0.0
+
+    def record_write(self, latency: float) -> None:
+        self.written += 1
+        self.total_write_time += latency
+        self.last_write_latency = latency
+        self.max_write_time = max(self.max_write_time, latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to dictionary for logging and API responses.
+
+        Returns:
+            Dict[str, Any]: Dictionary representation of the metrics
+        """
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            # Snapshot requests folded into an already pending one
+            "superseded": self.superseded,
+            "failed": self.failed,
+            "avg_write_latency": (
+                self.total_write_time / self.written if self.written else 0.0
+            ),
+            "last_write_latency": self.last_write_latency,
+            "max_write_latency": self.max_write_time,
+        }
+
+
+class PersistenceWriter:
+    """Performs storage writes on a single background thread.
+
+    Jobs are processed strictly in submission order. Full snapshots are
+    requested rather than submitted: the snapshot (plain dicts sharing the
+    node property objects) is taken on the event loop only when the writer
+    is ready to write it, so a burst of mutations costs one snapshot and
+    one save, while serialization and file I/O happen on the writer thread.
+    A failed mutation write is replaced by a snapshot, and a failed snapshot
+    is retried, so storage always converges to the graph.
+    """
+
+    def __init__(
+        self,
+        persistence_service: GraphPersistenceService,
+        take_snapshot: Callable[[], Dict[str, Any]],
+        retry_interval: float = 1.0,
+    ) -> None:
+        """Initialize persistence writer.
+
+        Args:
+            persistence_service: Service the jobs are written through
+            take_snapshot: Returns graph data to save; called on the event loop
+            retry_interval: Seconds to wait before retrying a failed snapshot
+        """
+        self._persistence_service = persistence_service
+        self._take_snapshot = take_snapshot
+        self._retry_interval = retry_interval
+        self._jobs: Deque[Tuple[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.metrics = PersistenceWriterMetrics()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._jobs)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the writer thread.
+
+        Args:
+            loop: Event loop that owns the graph; snapshots are taken on it
+        """
+        if self.is_running:
+            return
+        self._loop = loop
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="graph-persistence-writer", daemon=True)
+        self._thread.start()
+        logger.info("Persistence writer started")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Write all queued jobs, then stop the writer thread.
+
+        Blocks, so call it from a worker thread while the event loop keeps
+        running: pending snapshots are still taken on the loop.
+        """
+        if self._thread is None:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("Persistence writer stopped", **self.metrics.to_dict())
+
+    def request_snapshot(self) -> None:
+        """Queue a save of the full graph, unless one is already pending."""
+        with self._condition:
+            self.metrics.submitted += 1
+            if any(kind == SNAPSHOT_JOB for kind, _ in self._jobs):
+                self.metrics.superseded += 1
+                return
+            self._jobs.append((SNAPSHOT_JOB, None))
+            self._condition.notify_all()
+
+    def submit_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        """Queue mutation records for an incremental storage."""
+        with self._condition:
+            self.metrics.submitted += 1
+            self._jobs.append((MUTATIONS_JOB, mutations))
+            self._condition.notify_all()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued job was processed.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._jobs and not self._busy, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._jobs or self._stopping)
+                if not self._jobs:
+                    return
+                job = self._jobs.popleft()
+                self._busy = True
+
+            failed = not self._write(job)
+            with self._condition:
+                self._busy = False
+                # Storage may now miss these mutations: a snapshot, which
+                # covers them, makes it match the graph again
+                if (
+                    failed
+                    and job[0] == MUTATIONS_JOB
+                    and not any(kind == SNAPSHOT_JOB for kind, _ in self._jobs)
+                ):
+                    self._jobs.appendleft((SNAPSHOT_JOB, None))
+                # A failed snapshot is retried unless another one is pending
+                retry = (
+                    failed
+                    and job[0] == SNAPSHOT_JOB
+                    and not self._stopping
+                    and not any(kind == SNAPSHOT_JOB for kind, _ in self._jobs)
+                )
+                if retry:
+                    self._jobs.appendleft(job)
+                self._condition.notify_all()
+                if retry:
+                    self._condition.wait(self._retry_interval)
+
+    def _snapshot_from_loop(self) -> Dict[str, Any]:
+        """Take a snapshot on the event loop and wait for it."""
+        future: Future = Future()
+
+        def take() -> None:
+            try:
+                future.set_result(self._take_snapshot())
+            except Exception as exc:
+                future.set_exception(exc)
+
+        assert self._loop is not None
+        self._loop.call_soon_threadsafe(take)
+        return future.result()
+
+    def _write(self, job: Tuple[str, Any]) -> bool:
+        kind, payload = job
+        try:
+            if kind == SNAPSHOT_JOB:
+                graph_data = self._snapshot_from_loop()
+                start_time = time.perf_counter()
+                self._persistence_service.save_graph(graph_data)
+            else:
+                start_time = time.perf_counter()
+                self._persistence_service.apply_mutations(payload)
+        except Exception as exc:
+            self.metrics.failed += 1
+            logger.error(
+                "Background graph write failed",
+                job=kind,
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            return False
+        self.metrics.record_write(time.perf_counter() - start_time)
+        return True
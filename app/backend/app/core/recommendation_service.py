@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-import httpx
-
-from app.core.config import GeminiSettings
+from app.core.book_catalog import BookCatalog, book_catalog
+from app.core.config import GeminiSettings, RecommendationSettings
+from app.core.graph import normalize_text
+from app.core.http_clients import HttpClientRegistry, http_clients
 from app.core.logging import get_logger
 from app.core.recommendations_persistence import RecommendationsPersistenceService
 from app.schemas.graph import Graph
@@ -29,7 +31,63 @@ class IRecommendationService(ABC):
         raise NotImplementedError
 
 
-class GeminiRecommendationService(IRecommendationService):
+class PersistedRecommendationService(IRecommendationService):
+    """
+    Base of recommendation services that keep the last result in storage
+
+    A service wrapped by another one is created with `persist=False`, so
+    each request is saved once, by the outermost service.
+    """
+
+    def __init__(
+        self,
+        persistence_service: Optional[RecommendationsPersistenceService] = None,
+        persist: bool = True,
+    ) -> None:
+        self._logger = get_logger(self.__class__.__name__)
+        self._persistence_service = persistence_service or RecommendationsPersistenceService()
+        self._persist = persist
+
+    def _save_recommendations(self, recommendations: RecommendationsResponse) -> None:
+        """Save recommendations to storage
+
+        Args:
+            recommendations (RecommendationsResponse): Recommendations to save
+        """
+        if not self._persist:
+            return
+        try:
+            recommendations_data = recommendations.model_dump()
+            self._persistence_service.save_recommendations(
+                recommendations_data)
+        except Exception as e:
+            # Log error but don't fail - recommendations are still in memory
+            self._logger.error(
+                "Failed to save recommendations to storage",
+                error=str(e),
+            )
+
+    def load_saved_recommendations(self) -> RecommendationsResponse:
+        """Load previously saved recommendations from storage.
+
+        Returns:
+            RecommendationsResponse: Loaded recommendations or empty response if none exist
+        """
+        try:
+            data = self._persistence_service.load_recommendations()
+            if not data or not data.get("recommendations"):
+                return RecommendationsResponse(user_id=data.get("user_id", "") or "", recommendations=[])
+
+            return RecommendationsResponse.model_validate(data)
+        except Exception as e:
+            self._logger.error(
+                "Failed to load recommendations from storage",
+                error=str(e),
+            )
+            return RecommendationsResponse(user_id="", recommendations=[])
+
+
+class GeminiRecommendationService(PersistedRecommendationService):
     """
     Recommendation service with persistence
     """
@@ -38,10 +96,19 @@ class GeminiRecommendationService(IRecommendationService):
         self,
         settings: Optional[GeminiSettings] = None,
         persistence_service: Optional[RecommendationsPersistenceService] = None,
+        clients: Optional[HttpClientRegistry] = None,
+        catalog: Optional[BookCatalog] = None,
+        persist: bool = True,
     ) -> None:
+        super().__init__(persistence_service, persist)
         self._settings = settings or GeminiSettings()
-        self._logger = get_logger(self.__class__.__name__)
-        self._persistence_service = persistence_service or RecommendationsPersistenceService()
+        self._catalog = catalog
+        self._clients = clients or http_clients
+        self._clients.register(
+            "gemini",
+            timeout=self._settings.timeout,
+            prewarm_url=self._settings.api_url,
+        )
 
     async def get_recommendations(
         self,
@@ -76,15 +143,15 @@ class GeminiRecommendationService(IRecommendationService):
             ]
         }
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout) as client:
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._clients.client("gemini").post(url, json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         recommendations = self._parse_response(
             data=data,
             user_id=user_id,
         )
+        self._enrich(recommendations)
 
         self._logger.info(
             "Recommendations received from Gemini",
@@ -97,6 +164,30 @@ class GeminiRecommendationService(IRecommendationService):
 
         return recommendations
 
+    def _enrich(self, recommendations: RecommendationsResponse) -> None:
+        """
+        Fill code, ISBN, cover and subjects of recommended books found in the catalog.
+        """
+        if self._catalog is None:
+            return
+        for rec in recommendations.recommendations:
+            item = self._catalog.find(
+                code=rec.metadata.get("code"),
+                isbn=rec.metadata.get("isbn"),
+                title=rec.title,
+                author=rec.author,
+            )
+            if item is None:
+                continue
+            for key, value in (
+                ("code", item.code),
+                ("isbn", item.isbn),
+                ("cover", item.cover),
+                ("subjects", item.subjects),
+            ):
+                if value and not rec.metadata.get(key):
+                    rec.metadata[key] = value
+
     def _build_prompt(self, *, user_id: str, graph: Graph, limit: int) -> str:
         """
         Prompt for model.
@@ -259,38 +350,87 @@ class GeminiRecommendationService(IRecommendationService):
         }
         return self._parse_response(data=mock_data, user_id=user_id)
 
-    def _save_recommendations(self, recommendations: RecommendationsResponse) -> None:
-        """Save recommendations to storage
 
-        Args:
-            recommendations (RecommendationsResponse): Recommendations to save
-        """
+class HybridRecommendationService(PersistedRecommendationService):
+    """
+    Local recommendations as a fast first pass, Gemini when it answers in time
+    """
+
+    def __init__(
+        self,
+        local: IRecommendationService,
+        remote: IRecommendationService,
+        settings: Optional[RecommendationSettings] = None,
+        persistence_service: Optional[RecommendationsPersistenceService] = None,
+    ) -> None:
+        super().__init__(persistence_service)
+        self._local = local
+        self._remote = remote
+        self._settings = settings or RecommendationSettings()
+
+    async def get_recommendations(
+        self,
+        *,
+        user_id: str,
+        graph: Graph,
+        limit: int,
+    ) -> RecommendationsResponse:
+        local = await self._local.get_recommendations(
+            user_id=user_id, graph=graph, limit=limit)
         try:
-            recommendations_data = recommendations.model_dump()
-            self._persistence_service.save_recommendations(
-                recommendations_data)
-        except Exception as e:
-            # Log error but don't fail - recommendations are still in memory
-            self._logger.error(
-                "Failed to save recommendations to storage",
-                error=str(e),
+            remote = await asyncio.wait_for(
+                self._remote.get_recommendations(user_id=user_id, graph=graph, limit=limit),
+                timeout=self._settings.remote_timeout,
             )
+        except Exception as exc:
+            self._logger.warning(
+                "Remote recommendations unavailable, answering locally",
+                user_id=user_id,
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            self._save_recommendations(local)
+            return local
+
+        # Remote picks first, local ones fill up to the limit
+        seen = {normalize_text(rec.title) for rec in remote.recommendations}
+        merged = list(remote.recommendations)
+        for rec in local.recommendations:
+            if len(merged) >= limit:
+                break
+            if normalize_text(rec.title) not in seen:
+                merged.append(rec)
+        recommendations = RecommendationsResponse(user_id=user_id, recommendations=merged)
+        self._save_recommendations(recommendations)
+        return recommendations
 
-    def load_saved_recommendations(self) -> RecommendationsResponse:
-        """Load previously saved recommendations from storage.
 
-        Returns:
-            RecommendationsResponse: Loaded recommendations or empty response if none exist
-        """
-        try:
-            data = self._persistence_service.load_recommendations()
-            if not data or not data.get("recommendations"):
-                return RecommendationsResponse(user_id=data.get("user_id", "") or "", recommendations=[])
+def create_recommendation_service(
+    settings: Optional[RecommendationSettings] = None,
+) -> IRecommendationService:
+    """Create the recommendation service selected by settings.
 
-            return RecommendationsResponse.model_validate(data)
-        except Exception as e:
-            self._logger.error(
-                "Failed to load recommendations from storage",
-                error=str(e),
-            )
-            return RecommendationsResponse(user_id="", recommendations=[])
+    Args:
+        settings (RecommendationSettings, optional): "gemini", "local" or "hybrid" engine
+
+    Raises:
+        ValueError: If the engine is unknown
+
+    Returns:
+        IRecommendationService: Recommendation service
+    """
+    settings = settings or RecommendationSettings()
+    if settings.engine == "gemini":
+        return GeminiRecommendationService(catalog=book_catalog)
+
+    from app.core.local_recommendations import LocalRecommendationService
+    if settings.engine == "local":
+        return LocalRecommendationService(book_catalog, settings)
+    if settings.engine == "hybrid":
+        # Only the hybrid service saves what it answers
+        return HybridRecommendationService(
+            LocalRecommendationService(book_catalog, settings, persist=False),
+            GeminiRecommendationService(catalog=book_catalog, persist=False),
+            settings,
+        )
+    raise ValueError(f"Unknown recommendations engine: {settings.engine}")
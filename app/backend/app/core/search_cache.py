@@ -0,0 +1,291 @@
+# python
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# project
+from app.core.books_search_service import IBooksSearchService
+from app.core.config import SearchCacheSettings
+from app.core.graph import normalize_text
+from app.core.logging import get_logger
+from app.schemas.books_search import BookSearchItem
+
+
+logger = get_logger(__name__)
+
+
+def search_cache_key(query: str, max_results: int, start_index: int = 0) -> str:
+    """Cache key of a search: queries differing only in case or spacing share it."""
+    return f"{max_results}:{start_index}:{normalize_text(query) or ''}"
+
+
+class SqliteSearchCacheStore:
+    """On-disk tier of the search cache, one row per search.
+
+    Rows keep their absolute expiry time, so entries survive restarts until
+    they expire. The oldest rows are pruned once `max_entries` is exceeded.
+    The database is only opened (and created) on first use.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS search_results (
+            key TEXT PRIMARY KEY,
+            expires_at REAL NOT NULL,
+            items TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_search_results_expires ON search_results (expires_at);
+    """
+
+    def __init__(self, file_path: Optional[Path] = None, max_entries: int = 10000) -> None:
+        """Initialize the store.
+
+        Args:
+            file_path (Path, optional): Path to the database file.
+                Defaults to app/backend/app/data/search_cache.sqlite3
+            max_entries (int): Max number of rows kept
+        """
+        if file_path is None:
+            file_path = Path(__file__).parent.parent / "data" / "search_cache.sqlite3"
+        self.file_path = Path(file_path)
+        self._max_entries = max_entries
+        self._writes_since_prune = 0
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (lock must be held)."""
+        if self._connection is None:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.file_path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self.SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[Tuple[float, List[Dict[str, Any]]]]:
+        """Expiry time and items of an unexpired row."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT expires_at, items FROM search_results WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, key: str, expires_at: float, items: List[Dict[str, Any]]) -> None:
+        payload = json.dumps(items, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO search_results (key, expires_at, items) VALUES (?, ?, ?)",
+                (key, expires_at, payload),
+            )
+            self._writes_since_prune += 1
+            # Pruning scans the table, amortize it over many writes
+            if self._writes_since_prune >= max(1, self._max_entries // 10):
+                self._writes_since_prune = 0
+                self._prune()
+
+    def _prune(self) -> None:
+        self._connection.execute("DELETE FROM search_results WHERE expires_at <= ?", (time.time(),))
+        self._connection.execute(
+            "DELETE FROM search_results WHERE key NOT IN ("
+            "SELECT key FROM search_results ORDER BY expires_at DESC LIMIT ?)",
+            (self._max_entries,),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM search_results")
+
+    def close(self) -> None:
+        """Close the database; a later call opens it again."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class SearchResultCache:
+    """Bounded TTL cache of parsed search results.
+
+    Entries are kept in memory in least recently used order and evicted
+    when `max_entries` is exceeded or their TTL elapsed. With a disk store,
+    every entry is also written there and memory misses fall back to it, so
+    popular searches stay cached across restarts.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[SearchCacheSettings] = None,
+        store: Optional[SqliteSearchCacheStore] = None,
+    ):
+        self._settings = settings or SearchCacheSettings()
+        self._store = store
+        if self._store is None and self._settings.disk_enabled:
+            self._store = SqliteSearchCacheStore(
+                Path(self._settings.disk_path) if self._settings.disk_path else None,
+                max_entries=self._settings.disk_max_entries,
+            )
+        # key -> (expiry on the monotonic clock, items)
+        self._entries: "OrderedDict[str, Tuple[float, List[BookSearchItem]]]" = OrderedDict()
+        self._metrics = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    async def get(self, query: str, max_results: int, start_index: int = 0) -> Optional[List[BookSearchItem]]:
+        """Cached results of a search, or None."""
+        key = search_cache_key(query, max_results, start_index)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._metrics["hits"] += 1
+                return list(entry[1])
+            del self._entries[key]
+            self._metrics["expirations"] += 1
+
+        if self._store is not None:
+            try:
+                row = await asyncio.to_thread(self._store.get, key)
+            except sqlite3.Error as e:
+                logger.warning("Failed to read search cache", error=str(e))
+                row = None
+            if row is not None:
+                expires_at, data = row
+                items = [BookSearchItem.model_validate(item) for item in data]
+                self._remember(key, time.monotonic() + expires_at - time.time(), items)
+                self._metrics["disk_hits"] += 1
+                return list(items)
+
+        self._metrics["misses"] += 1
+        return None
+
+    async def put(
+        self,
+        query: str,
+        max_results: int,
+        items: List[BookSearchItem],
+        start_index: int = 0,
+    ) -> None:
+        key = search_cache_key(query, max_results, start_index)
+        ttl = self._settings.ttl
+        self._remember(key, time.monotonic() + ttl, list(items))
+        if self._store is not None:
+            data = [item.model_dump() for item in items]
+            try:
+                await asyncio.to_thread(self._store.put, key, time.time() + ttl, data)
+            except sqlite3.Error as e:
+                logger.warning("Failed to write search cache", error=str(e))
+
+    def _remember(self, key: str, expires_at: float, items: List[BookSearchItem]) -> None:
+        self._entries[key] = (expires_at, items)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._settings.max_entries:
+            self._entries.popitem(last=False)
+            self._metrics["evictions"] += 1
+
+    def contains(self, query: str, max_results: int, start_index: int = 0) -> bool:
+        """Whether an unexpired search is cached in memory (not counted as a lookup)."""
+        entry = self._entries.get(search_cache_key(query, max_results, start_index))
+        return entry is not None and entry[0] > time.monotonic()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def close(self) -> None:
+        """Close the disk store (if any); the memory tier is kept."""
+        if self._store is not None:
+            self._store.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self._metrics["hits"] + self._metrics["disk_hits"] + self._metrics["misses"]
+        hits = self._metrics["hits"] + self._metrics["disk_hits"]
+        return {
+            **self._metrics,
+            "entries": len(self._entries),
+            "max_entries": self._settings.max_entries,
+            "ttl": self._settings.ttl,
+            "disk_enabled": self._store is not None,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+class CachingBooksSearchService(IBooksSearchService):
+    """Search service decorator answering repeated searches from a cache."""
+
+    def __init__(self, search_service: IBooksSearchService, cache: SearchResultCache):
+        self._search_service = search_service
+        self._cache = cache
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        items = await self._cache.get(query, max_results, start_index)
+        if items is not None:
+            return items
+        items = await self._search_service.search(query, max_results, start_index)
+        await self._cache.put(query, max_results, items, start_index)
+        return items
+
+
+class SearchPrefetcher:
+    """Fetches pages of searches into the cache in the background.
+
+    Used for the page after the one a client is reading, so it is cached
+    (or at least in flight) when the client scrolls to it. Pages already
+    cached are skipped and at most `max_prefetches` fetches run at once;
+    failures are only logged.
+    """
+
+    def __init__(self, search_service: IBooksSearchService, cache: SearchResultCache, max_prefetches: int):
+        self._search_service = search_service
+        self._cache = cache
+        self._max_prefetches = max_prefetches
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._metrics = {"scheduled": 0, "skipped": 0, "failed": 0}
+
+    def schedule(self, query: str, max_results: int, start_index: int) -> None:
+        key = search_cache_key(query, max_results, start_index)
+        if (
+            key in self._tasks
+            or len(self._tasks) >= self._max_prefetches
+            or self._cache.contains(query, max_results, start_index)
+        ):
+            self._metrics["skipped"] += 1
+            return
+        task = asyncio.create_task(self._search_service.search(query, max_results, start_index))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._finish(key, task))
+        self._metrics["scheduled"] += 1
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        del self._tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            self._metrics["failed"] += 1
+            logger.warning("Search prefetch failed", key=key, error=str(task.exception()))
+
+    async def close(self) -> None:
+        """Cancel the fetches in progress."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {**self._metrics, "in_flight": len(self._tasks)}
+
+
+search_cache = SearchResultCache()
@@ -0,0 +1,286 @@
+# python
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# project
+from app.core.logging import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+logger = get_logger(__name__)
+
+# Read position in the change feed: (base version of the feed file, byte offset)
+FeedPosition = Tuple[int, int]
+# Cheap fingerprint of the feed file: (inode, size, mtime)
+FeedStat = Tuple[int, int, int]
+
+
+class InterProcessLock:
+    """Advisory file lock shared by all worker processes.
+
+    Uses flock on POSIX (shared or exclusive) and msvcrt on Windows, where
+    every lock is exclusive. Threads of one process are serialized by a
+    regular lock first.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, shared: bool = False, blocking: bool = True) -> Iterator[bool]:
+        """Hold the lock for the duration of the block.
+
+        Args:
+            shared (bool): Allow other shared holders (POSIX only)
+            blocking (bool): Wait for the lock instead of giving up
+
+        Yields:
+            bool: Whether the lock was acquired; only False if not blocking
+        """
+        if not self._thread_lock.acquire(blocking):
+            yield False
+            return
+        try:
+            with open(self.path, "a+b") as f:
+                if not self._lock_file(f, shared, blocking):
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    self._unlock_file(f)
+        finally:
+            self._thread_lock.release()
+
+    @staticmethod
+    def _lock_file(f: Any, shared: bool, blocking: bool) -> bool:
+        if fcntl is not None:
+            mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            try:
+                fcntl.flock(f.fileno(), mode if blocking else mode | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            return True
+        f.seek(0)
+        mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), mode, 1)
+                return True
+            except OSError:
+                # LK_LOCK gives up after 10 attempts, so keep retrying
+                if not blocking:
+                    return False
+
+    @staticmethod
+    def _unlock_file(f: Any) -> None:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SharedGraphLog:
+    """Change feed and checkpoint stamp shared by worker processes.
+
+    Every committed change is appended to an NDJSON feed as
+    {"v": version, "mutations": [...]} while the feed lock is held, so
+    versions are global and gapless. Workers notice new records with a
+    single stat of the feed and replay only those. Periodically a worker
+    saves the full graph to the configured storage (a checkpoint), records
+    its version in the stamp file and drops the covered records from the
+    feed. A trimmed feed starts with a {"base": version} header, so readers
+    can tell it apart from the file their offset points into. The stamp also holds a cluster token shared by all workers, so
+    ETags and cursors stay valid whichever worker serves a request.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, fsync: bool = False):
+        """Initialize shared log.
+
+        Args:
+            directory (Path, optional): Directory of the feed, stamp and lock
+                files. Defaults to app/backend/app/data
+            fsync (bool): Force every appended record to disk
+        """
+        if directory is None:
+            directory = Path(__file__).parent.parent / "data"
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.feed_path = self.directory / "graph.feed.ndjson"
+        self.stamp_path = self.directory / "graph.stamp.json"
+        self.fsync = fsync
+        self.feed_lock = InterProcessLock(self.directory / "graph.feed.lock")
+        # Held while a checkpoint is written and while storage is loaded,
+        # so a loading worker never pairs a storage file with a stale stamp
+        self.checkpoint_lock = InterProcessLock(self.directory / "graph.checkpoint.lock")
+        # Held for as long as it runs by the one worker running background
+        # jobs that change the graph, such as the similarity edge job
+        self.job_lock = InterProcessLock(self.directory / "graph.jobs.lock")
+
+    def read_stamp(self) -> Dict[str, Any]:
+        """Read the checkpoint stamp, creating it on first use.
+
+        Returns:
+            Dict[str, Any]: {"cluster": token, "version": checkpoint version}
+        """
+        stamp = self._load_stamp()
+        if stamp is not None:
+            return stamp
+        with self.feed_lock.acquire():
+            stamp = self._load_stamp()
+            if stamp is None:
+                stamp = {"cluster": uuid.uuid4().hex[:12], "version": 0}
+                self._write_stamp(stamp)
+            return stamp
+
+    def write_stamp(self, version: int) -> None:
+        """Record the version of the latest checkpoint (checkpoint lock must be held)."""
+        stamp = self._load_stamp() or {"cluster": uuid.uuid4().hex[:12]}
+        stamp["version"] = version
+        self._write_stamp(stamp)
+
+    def _load_stamp(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.stamp_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _stamp_version(self) -> int:
+        return (self._load_stamp() or {}).get("version", 0)
+
+    def _write_stamp(self, stamp: Dict[str, Any]) -> None:
+        tmp_path = self.stamp_path.with_name(self.stamp_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stamp, f)
+        os.replace(tmp_path, self.stamp_path)
+
+    def stat(self) -> FeedStat:
+        """Fingerprint of the feed that changes with every write; a single stat call."""
+        try:
+            stat = os.stat(self.feed_path)
+        except FileNotFoundError:
+            return (0, 0, 0)
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _read_base(f: Any) -> Tuple[int, int]:
+        """Read the header of an open feed: (base version, header length)."""
+        f.seek(0)
+        line = f.readline()
+        if line.startswith(b'{"base":') and line.endswith(b"\n"):
+            return json.loads(line)["base"], len(line)
+        return 0, 0
+
+    def append(self, version: int, mutations: List[Dict[str, Any]]) -> FeedPosition:
+        """Append a record (feed lock must be held).
+
+        Returns:
+            FeedPosition: Position right after the record
+        """
+        line = json.dumps(
+            {"v": version, "mutations": mutations},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ) + "\n"
+        with open(self.feed_path, "a+b") as f:
+            # Terminate a torn line left by a crashed writer first
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(line.encode("utf-8"))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            end = f.tell()
+            return (self._read_base(f)[0], end)
+
+    def read_since(
+        self,
+        version: int,
+        position: FeedPosition,
+    ) -> Tuple[List[Dict[str, Any]], FeedPosition, bool]:
+        """Read records newer than a version.
+
+        Reading continues at `position` while the feed was not trimmed
+        since; only complete lines are consumed.
+
+        Args:
+            version (int): Version the reader is at
+            position (FeedPosition): Where the reader stopped last time
+
+        Returns:
+            Tuple: (records, new position, gap) where gap means records
+                between `version` and the feed were already dropped, so
+                the reader must reload from the checkpoint
+        """
+        try:
+            f = open(self.feed_path, "rb")
+        except FileNotFoundError:
+            return [], (0, 0), self._stamp_version() > version
+        with f:
+            base, header_length = self._read_base(f)
+            offset = position[1] if base == position[0] else header_length
+            f.seek(offset)
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        records = []
+        expected = version + 1
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if line.strip():
+                    logger.warning("Skipping torn graph change feed record", path=str(self.feed_path))
+                continue
+            if record["v"] < expected:
+                continue
+            if record["v"] > expected:
+                return [], (base, offset + end), True
+            records.append(record)
+            expected += 1
+        if not records and base > version:
+            return [], (base, offset + end), True
+        return records, (base, offset + end), False
+
+    def rotate(self, version: int) -> None:
+        """Drop records covered by a checkpoint (feed lock must be held)."""
+        if not self.feed_path.exists():
+            return
+        with open(self.feed_path, "rb") as f:
+            base, header_length = self._read_base(f)
+            if version <= base:
+                return
+            f.seek(header_length)
+            lines = f.read().splitlines(keepends=True)
+        kept = [json.dumps({"base": version}).encode("utf-8") + b"\n"]
+        for line in lines:
+            try:
+                if line.endswith(b"\n") and json.loads(line)["v"] > version:
+                    kept.append(line)
+            except json.JSONDecodeError:
+                continue
+        tmp_path = self.feed_path.with_name(self.feed_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.writelines(kept)
+        os.replace(tmp_path, self.feed_path)
+        logger.info(
+            "Graph change feed rotated",
+            path=str(self.feed_path),
+            checkpoint_version=version,
+            dropped_records=len(lines) - len(kept) + 1,
+        )
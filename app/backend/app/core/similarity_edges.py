@@ -0,0 +1,516 @@
+# python
+import asyncio
+import bisect
+import time
+from contextlib import ExitStack
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# project
+from app.core.config import RecommendationSettings, SimilarityEdgeSettings
+from app.core.graph import GraphBatchError, GraphManager, IGraphListener, graph_instance
+from app.core.local_recommendations import BookText, Features, HashedFeaturizer, book_text
+from app.core.logging import get_logger
+
+# 3rd party
+import numpy as np
+
+
+logger = get_logger(__name__)
+
+# (similarity, node id), lists are kept sorted by descending similarity
+Neighbor = Tuple[float, str]
+
+
+def node_text(node_data: Dict[str, Any]) -> BookText:
+    """Text fields of a graph node used for similarity."""
+    properties = node_data.get("properties") or {}
+    return book_text(
+        properties.get("title") or node_data.get("label"),
+        properties.get("author"),
+        properties.get("subjects"),
+        properties.get("description"),
+    )
+
+
+class SimilarityIndex:
+    """Incremental top-k nearest-neighbor index over book feature vectors.
+
+    Vectors are the hashed term frequencies of local recommendations,
+    weighted by IDF at query time and compared by cosine. Candidates of a
+    query are the books sharing a term with it, found through posting
+    lists; terms shared by more than `max_postings` books (say "fiction")
+    are too common to nominate candidates. Adding a book therefore costs
+    its posting lists, not a pass over all books, and updates only the
+    neighbor lists it enters.
+    """
+
+    def __init__(
+        self,
+        featurizer: HashedFeaturizer,
+        top_k: int,
+        min_score: float,
+        max_postings: int,
+    ):
+        self._featurizer = featurizer
+        self._top_k = top_k
+        self._min_score = min_score
+        self._max_postings = max_postings
+        self.clear()
+
+    def clear(self) -> None:
+        self._vectors: Dict[str, Features] = {}
+        self._postings: Dict[int, Set[str]] = {}
+        self._df = np.zeros(self._featurizer.dimensions, dtype=np.int64)
+        # node -> its nearest neighbors; node -> nodes listing it as neighbor
+        self._neighbors: Dict[str, List[Neighbor]] = {}
+        self._listed_by: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._vectors
+
+    def neighbors(self, node_id: str) -> List[Neighbor]:
+        return list(self._neighbors.get(node_id, ()))
+
+    def _insert(self, node_id: str, features: Features) -> None:
+        indices, _ = features
+        self._vectors[node_id] = features
+        self._df[indices] += 1
+        for bucket in indices.tolist():
+            self._postings.setdefault(bucket, set()).add(node_id)
+        self._neighbors[node_id] = []
+        self._listed_by.setdefault(node_id, set())
+
+    def remove(self, node_id: str) -> Set[str]:
+        """Remove a book.
+
+        Returns:
+            Set[str]: Books that lost it as a neighbor; their lists are
+                short by one until they are queried again
+        """
+        features = self._vectors.pop(node_id, None)
+        if features is None:
+            return set()
+        indices, _ = features
+        self._df[indices] -= 1
+        for bucket in indices.tolist():
+            postings = self._postings[bucket]
+            postings.discard(node_id)
+            if not postings:
+                del self._postings[bucket]
+        for _, neighbor in self._neighbors.pop(node_id, ()):
+            self._listed_by[neighbor].discard(node_id)
+        affected = self._listed_by.pop(node_id, set())
+        for other in affected:
+            self._neighbors[other] = [n for n in self._neighbors[other] if n[1] != node_id]
+        return affected
+
+    def add(self, node_id: str, text: BookText) -> Set[str]:
+        """Add or re-index a book and update neighbor lists.
+
+        Returns:
+            Set[str]: Books whose neighbor lists changed
+        """
+        changed = self.remove(node_id)
+        features = self._featurizer.features(text)
+        if not len(features[0]):
+            return changed
+        self._insert(node_id, features)
+        changed.add(node_id)
+
+        matches = self._query(node_id)
+        self._set_neighbors(node_id, matches[:self._top_k])
+        for score, other in matches:
+            neighbors = self._neighbors[other]
+            if len(neighbors) >= self._top_k and score <= neighbors[-1][0]:
+                continue
+            bisect.insort(neighbors, (score, node_id), key=lambda n: -n[0])
+            self._listed_by[node_id].add(other)
+            if len(neighbors) > self._top_k:
+                _, evicted = neighbors.pop()
+                self._listed_by[evicted].discard(other)
+            changed.add(other)
+        return changed
+
+    def requery(self, node_id: str) -> bool:
+        """Recompute the neighbor list of a book; True if it changed."""
+        if node_id not in self._vectors:
+            return False
+        previous = self._neighbors[node_id]
+        self._set_neighbors(node_id, self._query(node_id)[:self._top_k])
+        return [n[1] for n in previous] != [n[1] for n in self._neighbors[node_id]]
+
+    def rebuild(self, texts: Iterable[Tuple[str, BookText]]) -> None:
+        """Index all books at once and compute every neighbor list.
+
+        IDF is fixed during a rebuild, so rows are normalized once and
+        scores are accumulated term at a time over column-sorted postings
+        instead of gathering candidate vectors per book.
+        """
+        self.clear()
+        for node_id, text in texts:
+            features = self._featurizer.features(text)
+            if len(features[0]):
+                self._insert(node_id, features)
+        ids = list(self._vectors)
+        if len(ids) < 2:
+            return
+
+        vectors = [self._vectors[node_id] for node_id in ids]
+        lengths = np.fromiter((len(v[0]) for v in vectors), dtype=np.int64, count=len(ids))
+        rows = np.repeat(np.arange(len(ids)), lengths)
+        columns = np.concatenate([v[0] for v in vectors])
+        data = np.concatenate([v[1] for v in vectors]) * self._idf(columns)
+        data /= np.sqrt(np.bincount(rows, weights=data * data))[rows]
+
+        order = np.argsort(columns, kind="stable")
+        posting_rows, posting_data = rows[order], data[order]
+        starts = np.searchsorted(columns[order], columns, side="left")
+        ends = starts + self._df[columns]
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+        for row, node_id in enumerate(ids):
+            terms = [
+                t for t in range(offsets[row], offsets[row + 1])
+                if ends[t] - starts[t] <= self._max_postings
+            ]
+            if not terms:
+                continue
+            positions = np.concatenate([np.arange(starts[t], ends[t]) for t in terms])
+            weights = np.repeat(data[terms], ends[terms] - starts[terms])
+            candidates, inverse = np.unique(posting_rows[positions], return_inverse=True)
+            scores = np.bincount(inverse, weights=weights * posting_data[positions])
+            selected = np.flatnonzero((scores >= self._min_score) & (candidates != row))
+            if len(selected) > self._top_k:
+                top = np.argpartition(-scores[selected], self._top_k - 1)[:self._top_k]
+                selected = selected[top]
+            selected = selected[np.argsort(-scores[selected], kind="stable")]
+            self._set_neighbors(
+                node_id, [(float(scores[p]), ids[candidates[p]]) for p in selected])
+
+    def _set_neighbors(self, node_id: str, neighbors: List[Neighbor]) -> None:
+        for _, other in self._neighbors.get(node_id, ()):
+            self._listed_by[other].discard(node_id)
+        self._neighbors[node_id] = neighbors
+        for _, other in neighbors:
+            self._listed_by[other].add(node_id)
+
+    def _idf(self, indices: np.ndarray) -> np.ndarray:
+        # Smoothed, as for the recommendation catalog
+        return np.log((1.0 + len(self._vectors)) / (1.0 + self._df[indices])) + 1.0
+
+    def _query(self, node_id: str) -> List[Neighbor]:
+        """Books similar to an indexed one, most similar first."""
+        indices, tf = self._vectors[node_id]
+        candidates: Set[str] = set()
+        for bucket in indices.tolist():
+            postings = self._postings[bucket]
+            if len(postings) <= self._max_postings:
+                candidates.update(postings)
+        candidates.discard(node_id)
+        if not candidates:
+            return []
+
+        query = tf * self._idf(indices)
+        ids = list(candidates)
+        vectors = [self._vectors[other] for other in ids]
+        lengths = np.fromiter((len(v[0]) for v in vectors), dtype=np.int64, count=len(ids))
+        rows = np.repeat(np.arange(len(ids)), lengths)
+        columns = np.concatenate([v[0] for v in vectors])
+        weights = np.concatenate([v[1] for v in vectors]) * self._idf(columns)
+
+        # Sparse dot products: match candidate terms against the sorted query terms
+        positions = np.minimum(np.searchsorted(indices, columns), len(indices) - 1)
+        matched = indices[positions] == columns
+        dots = np.bincount(rows, weights=np.where(matched, weights * query[positions], 0.0),
+                           minlength=len(ids))
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=len(ids)))
+        scores = dots / (norms * np.linalg.norm(query))
+
+        selected = np.flatnonzero(scores >= self._min_score)
+        selected = selected[np.argsort(-scores[selected], kind="stable")]
+        return [(float(scores[position]), ids[position]) for position in selected]
+
+
+class SimilarityEdgeJob(IGraphListener):
+    """Background job linking similar books with weighted edges.
+
+    Every book gets an edge to each of its `top_k` most similar books, with
+    the similarity as weight. The job listens to graph changes: a new or
+    changed book is indexed incrementally and only edges of books whose
+    neighbor lists changed are updated; the whole index is rebuilt when the
+    graph is (re)loaded. Index work runs on a worker thread, edge updates
+    are applied as one batch per round.
+
+    Only edges created by the job are re-weighted or removed; an edge that
+    already existed is left as the user drew it.
+
+    In multi-process mode only the worker holding the shared job lock runs
+    the job; it polls the change feed for books added by the others, and
+    another worker takes over once it exits.
+    """
+
+    def __init__(
+        self,
+        graph_manager: GraphManager,
+        settings: Optional[SimilarityEdgeSettings] = None,
+        featurizer: Optional[HashedFeaturizer] = None,
+    ):
+        self._graph_manager = graph_manager
+        self._settings = settings or SimilarityEdgeSettings()
+        self._index = SimilarityIndex(
+            featurizer or HashedFeaturizer(RecommendationSettings()),
+            top_k=self._settings.top_k,
+            min_score=self._settings.min_score,
+            max_postings=self._settings.max_postings,
+        )
+        # source -> target -> weight of the edges created by the job, and
+        # target -> their sources
+        self._inferred: Dict[str, Dict[str, float]] = {}
+        self._inferred_by: Dict[str, Set[str]] = {}
+        self._dirty: Dict[str, None] = {}
+        self._removed: Set[str] = set()
+        self._rebuild = True
+        self._applying = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        # Holds the shared job lock while this worker runs the job
+        self._lease: Optional[ExitStack] = None
+
+    @property
+    def _active(self) -> bool:
+        return self._lease is not None or self._graph_manager.shared_log is None
+
+    # --- IGraphListener ---
+
+    def on_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        if not self._active:
+            return
+        for mutation in mutations:
+            op = mutation.get("op")
+            if op == "upsert_node":
+                node_id = mutation["node"]["id"]
+                self._removed.discard(node_id)
+                self._dirty[node_id] = None
+            elif op == "delete_node":
+                self._dirty.pop(mutation["id"], None)
+                self._removed.add(mutation["id"])
+                self._forget_edges(mutation["id"])
+            elif op in ("upsert_edge", "delete_edge") and not self._applying:
+                # The user changed an edge of the job, it is theirs from now on
+                edge = mutation.get("edge", mutation)
+                self._drop_inferred(edge["source"], edge["target"])
+            else:
+                continue
+            self._wake()
+
+    def on_reset(self) -> None:
+        if not self._active:
+            return
+        self._rebuild = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # --- lifecycle ---
+
+    def start(self) -> None:
+        """Subscribe to the graph and start the job on the running loop."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._rebuild = True
+        self._graph_manager.add_listener(self)
+        self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        logger.info("Similarity edge job started", top_k=self._settings.top_k)
+
+    async def stop(self) -> None:
+        """Stop the job; edges of a round in progress may be skipped."""
+        if self._task is None:
+            return
+        self._graph_manager.remove_listener(self)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._lease is not None:
+            self._lease.close()
+            self._lease = None
+        logger.info("Similarity edge job stopped")
+
+    def _claim(self) -> bool:
+        """Whether this worker runs the job, taking the shared job lock if free."""
+        shared = self._graph_manager.shared_log
+        if self._active:
+            return True
+        lease = ExitStack()
+        if not lease.enter_context(shared.job_lock.acquire(blocking=False)):
+            lease.close()
+            return False
+        self._lease = lease
+        self._rebuild = True
+        self._inferred.clear()
+        self._inferred_by.clear()
+        self._wakeup.set()
+        logger.info("Similarity edge job runs in this worker")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            if self._graph_manager.shared_log is None:
+                await self._wakeup.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._settings.feed_poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                if not self._claim():
+                    self._wakeup.clear()
+                    continue
+                # Books of the other workers arrive through the feed, which
+                # is otherwise only read when this worker serves a request
+                await self._graph_manager.refresh_async()
+                if not self._wakeup.is_set():
+                    continue
+            # Let a burst of changes (e.g. an import) accumulate
+            await asyncio.sleep(self._settings.debounce)
+            self._wakeup.clear()
+            try:
+                await self._update()
+            except Exception as exc:
+                logger.error(
+                    "Similarity edge update failed",
+                    error=str(exc),
+                    error_type=type(exc).__name__,
+                    exc_info=True,
+                )
+
+    # --- updates ---
+
+    async def _update(self) -> None:
+        start_time = time.perf_counter()
+        await self._graph_manager.wait_until_ready()
+        if self._rebuild:
+            self._rebuild = False
+            self._dirty.clear()
+            self._removed.clear()
+            texts = [(node["id"], node_text(node)) for node in self._graph_manager.iter_node_data()]
+            await asyncio.to_thread(self._index.rebuild, texts)
+            changed = set(self._inferred) | {node_id for node_id, _ in texts}
+        else:
+            removed, self._removed = self._removed, set()
+            texts = []
+            for node_id in self._dirty:
+                node_data = self._graph_manager.get_node_data(node_id)
+                if node_data is not None:
+                    texts.append((node_id, node_text(node_data)))
+            self._dirty.clear()
+            if not removed and not texts:
+                return
+            changed = await asyncio.to_thread(self._apply_changes, removed, texts)
+
+        operations = self._edge_operations(changed)
+        if operations:
+            self._applying = True
+            try:
+                self._graph_manager.apply_batch(operations)
+            except GraphBatchError as exc:
+                logger.warning("Similarity edges not applied", error=exc.message)
+                self._rebuild = True
+                return
+            finally:
+                self._applying = False
+            self._record(operations)
+        logger.info(
+            "Similarity edges updated",
+            indexed_count=len(self._index),
+            changed_count=len(changed),
+            operations_count=len(operations),
+            update_time=f"{time.perf_counter() - start_time:.4f}s",
+        )
+
+    def _apply_changes(self, removed: Set[str], texts: List[Tuple[str, BookText]]) -> Set[str]:
+        """Update the index (worker thread); returns books whose edges may change."""
+        changed: Set[str] = set()
+        refill: Set[str] = set()
+        for node_id in removed:
+            refill |= self._index.remove(node_id)
+        for node_id, text in texts:
+            changed |= self._index.add(node_id, text)
+        # Books that lost a neighbor get a full list again
+        for node_id in refill - changed:
+            if self._index.requery(node_id):
+                changed.add(node_id)
+        return changed
+
+    def _edge_operations(self, sources: Iterable[str]) -> List[Dict[str, Any]]:
+        """Batch operations bringing edges of `sources` in line with the index."""
+        operations: List[Dict[str, Any]] = []
+        for source in sources:
+            desired = {
+                target: round(score, 4)
+                for score, target in self._index.neighbors(source)
+                if self._graph_manager.get_node_data(target) is not None
+            }
+            if self._graph_manager.get_node_data(source) is None:
+                continue
+            inferred = self._inferred.get(source, {})
+            for target, weight in desired.items():
+                if inferred.get(target) == weight:
+                    continue
+                if target not in inferred and self._graph_manager.get_edge_data(source, target):
+                    continue  # drawn by the user
+                operations.append({"op": "add_edge", "source": source, "target": target, "weight": weight})
+            for target in inferred.keys() - desired.keys():
+                if self._graph_manager.get_edge_data(source, target) is not None:
+                    operations.append({"op": "remove_edge", "source": source, "target": target})
+                else:
+                    self._drop_inferred(source, target)
+        return operations
+
+    def _record(self, operations: List[Dict[str, Any]]) -> None:
+        for operation in operations:
+            source, target = operation["source"], operation["target"]
+            if operation["op"] == "add_edge":
+                self._inferred.setdefault(source, {})[target] = operation["weight"]
+                self._inferred_by.setdefault(target, set()).add(source)
+            else:
+                self._drop_inferred(source, target)
+
+    def _drop_inferred(self, source: str, target: str) -> None:
+        targets = self._inferred.get(source)
+        if targets is None or targets.pop(target, None) is None:
+            return
+        if not targets:
+            del self._inferred[source]
+        sources = self._inferred_by[target]
+        sources.discard(source)
+        if not sources:
+            del self._inferred_by[target]
+
+    def _forget_edges(self, node_id: str) -> None:
+        """Forget the job's edges from and to a deleted book."""
+        for target in list(self._inferred.get(node_id, ())):
+            self._drop_inferred(node_id, target)
+        for source in list(self._inferred_by.get(node_id, ())):
+            self._drop_inferred(source, node_id)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "active": self._active,
+            "indexed_count": len(self._index),
+            "inferred_edges": sum(len(targets) for targets in self._inferred.values()),
+        }
+
+
+similarity_edge_job = SimilarityEdgeJob(graph_instance)
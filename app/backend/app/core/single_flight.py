@@ -0,0 +1,91 @@
+# python
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+# project
+from app.core.books_search_service import IBooksSearchService
+from app.core.logging import get_logger
+from app.core.search_cache import search_cache_key
+from app.schemas.books_search import BookSearchItem
+
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls into one.
+
+    The first caller of a key runs the call; callers arriving with the same
+    key while it is in flight await its result (or exception) instead of
+    running their own. Nothing is kept once the call finished, so a later
+    caller runs it again.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._metrics = {
+            "calls": 0,
+            "executions": 0,
+            "coalesced": 0,
+        }
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `call`, or join the call of the same key already in flight.
+
+        Args:
+            key (Hashable): Identity of the call
+            call (Callable[[], Awaitable[Any]]): Starts the call
+
+        Returns:
+            Any: Result of the shared call
+        """
+        self._metrics["calls"] += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self._metrics["executions"] += 1
+            task = asyncio.create_task(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self._metrics["coalesced"] += 1
+            logger.debug("Call coalesced", flight=self.name, key=str(key))
+        # Shielded: a disconnecting caller must not cancel the call of the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieved here so that a failure nobody awaited any more is not reported
+        if not task.cancelled():
+            task.exception()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self._metrics,
+            "in_flight": len(self._in_flight),
+            "coalesced_ratio": (
+                round(self._metrics["coalesced"] / self._metrics["calls"], 4)
+                if self._metrics["calls"] else None
+            ),
+        }
+
+
+class CoalescingBooksSearchService(IBooksSearchService):
+    """Search service decorator sharing one search among identical concurrent ones."""
+
+    def __init__(self, search_service: IBooksSearchService, flight: SingleFlight):
+        self._search_service = search_service
+        self._flight = flight
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        items = await self._flight.do(
+            search_cache_key(query, max_results, start_index),
+            lambda: self._search_service.search(query, max_results, start_index),
+        )
+        # Callers get their own list
+        return list(items)
+
+
+books_search_flight = SingleFlight("books_search")
+recommendations_flight = SingleFlight("recommendations")
@@ -0,0 +1,171 @@
+# python
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+# project
+from app.core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class WriteBehindMetrics:
+    """Counters describing how well mutations are coalesced into saves."""
+
+    def __init__(self) -> None:
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.coalesced_mutations = 0
+        self.total_flush_time = 0.0
+        self.last_flush_latency: Optional[float] = None
+        self.max_flush_latency = 0.0
+
+    def record_flush(self, mutations: int, latency: float) -> None:
+        self.flushes += 1
+        self.coalesced_mutations += mutations
+        self.total_flush_time += latency
+        self.last_flush_latency = latency
+        self.max_flush_latency = max(self.max_flush_latency, latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to dictionary for logging and API responses.
+
+        Returns:
+            Dict[str, Any]: Dictionary representation of the metrics
+        """
+        return {
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "coalesced_mutations": self.coalesced_mutations,
+            # Average number of mutations persisted by a single save
+            "coalescing_ratio": (
+                self.coalesced_mutations / self.flushes if self.flushes else 0.0
+            ),
+            "avg_flush_latency": (
+                self.total_flush_time / self.flushes if self.flushes else 0.0
+            ),
+            "last_flush_latency": self.last_flush_latency,
+            "max_flush_latency": self.max_flush_latency,
+        }
+
+
+class WriteBehindFlusher:
+    """Coalesces dirty marks into periodic calls of a flush callback.
+
+    Until `start` is called (e.g. in scripts without an event loop) every
+    mark is flushed immediately, so no mutation is ever left unsaved.
+    """
+
+    def __init__(
+        self,
+        flush_callback: Callable[[], None],
+        interval: float = 2.0,
+        max_dirty: int = 200,
+    ) -> None:
+        """Initialize write-behind flusher.
+
+        Args:
+            flush_callback: Persists the current state, raises on failure
+            interval: Max seconds between a mutation and its flush
+            max_dirty: Number of pending mutations that triggers an early flush
+        """
+        self._flush_callback = flush_callback
+        self._interval = interval
+        self._max_dirty = max(1, max_dirty)
+        self._dirty = 0
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self.metrics = WriteBehindMetrics()
+
+    @property
+    def dirty_count(self) -> int:
+        return self._dirty
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def mark_dirty(self, mutations: int = 1) -> None:
+        """Register pending mutations, flushing now if the flusher is not running."""
+        self._dirty += mutations
+        if not self.is_running:
+            self.flush()
+        elif self._dirty >= self._max_dirty and self._wakeup is not None:
+            self._wakeup.set()
+
+    def flush(self) -> bool:
+        """Flush pending mutations.
+
+        Returns:
+            bool: True if something was flushed successfully
+        """
+        if not self._dirty:
+            return False
+
+        pending = self._dirty
+        self._dirty = 0
+        start_time = time.perf_counter()
+        try:
+            self._flush_callback()
+        except Exception as exc:
+            # Keep the state dirty so the next flush retries
+            self._dirty += pending
+            self.metrics.failed_flushes += 1
+            logger.error(
+                "Write-behind flush failed",
+                pending_mutations=pending,
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            return False
+
+        latency = time.perf_counter() - start_time
+        self.metrics.record_flush(pending, latency)
+        logger.info(
+            "Write-behind flush completed",
+            mutations=pending,
+            flush_latency=f"{latency:.4f}s",
+        )
+        return True
+
+    async def start(self) -> None:
+        """Start the background flush loop on the running event loop."""
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "Write-behind flusher started",
+            interval=self._interval,
+            max_dirty=self._max_dirty,
+        )
+
+    async def stop(self) -> None:
+        """Stop the background loop and flush whatever is still pending."""
+        if self._task is not None:
+            # Wake the loop and let it exit instead of cancelling it: a
+            # cancel racing with a set wakeup event can be swallowed by
+            # asyncio.wait_for, leaving the loop running forever
+            self._stopping = True
+            if self._wakeup is not None:
+                self._wakeup.set()
+            await self._task
+            self._task = None
+            self._wakeup = None
+        self.flush()
+        logger.info("Write-behind flusher stopped", **self.metrics.to_dict())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping:
+                return
+            self._wakeup.clear()
+            self.flush()
@@ -6,16 +6,24 @@ from contextlib import asynccontextmanager
 # project
 from app.api.health_check import router as health_router
 from app.api.graph_endpoints import router as graph_router
-from app.api.search_endpoints import router as search_router
+from app.api.search_endpoints import router as search_router, search_prefetcher
 from app.api.book_graph_endpoints import router as book_graph_router
+from app.api.library_import_endpoints import router as library_import_router
 from app.api.recommendations_endpoints import router as recommendations_router
+from app.api.dependencies import require_graph_ready
 from app.core.logging import setup_logging, get_logger
-from app.core.config import HealthMonitorSettings
+from app.core.config import GraphSettings, HealthMonitorSettings, SimilarityEdgeSettings
+from app.core.book_catalog import book_catalog
 from app.core.health_monitor import HealthMonitorService, IHealthMonitor
+from app.core.http_clients import http_clients
+from app.core.search_cache import search_cache
 from app.core.graph import graph_instance
+from app.core.graph_analytics import graph_analytics
+from app.core.graph_search import graph_search
+from app.core.similarity_edges import similarity_edge_job
 
 # 3rd party
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
@@ -24,6 +32,9 @@ setup_logging()
 
 logger = get_logger(__name__)
 
+graph_settings = GraphSettings()
+similarity_edge_settings = SimilarityEdgeSettings()
+
 # Health monitor settings
 health_monitor_settings = HealthMonitorSettings()
 health_monitor: IHealthMonitor = HealthMonitorService(
@@ -68,23 +79,29 @@ async def health_check_task():
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     # Startup
+    start_time = time.perf_counter()
     logger.info("Application starting")
 
-    # Load graph from storage
-    try:
-        graph_instance.load_from_storage()
-        graph = graph_instance.show_graph()
-        logger.info(
-            "Graph loaded from storage",
-            nodes_count=len(graph.nodes),
-            edges_count=len(graph.edges),
-        )
-    except Exception as e:
-        logger.error(
-            "Failed to load graph from storage during startup",
-            error=str(e),
-            exc_info=True,
-        )
+    # Load graph from storage, in the background in lazy mode: graph
+    # endpoints wait for it and /health/ready reports when it is done
+    hydration_task = asyncio.create_task(graph_instance.hydrate())
+    if not graph_settings.lazy_load:
+        await hydration_task
+
+    await graph_instance.start_persistence()
+
+    # Restore the books seen before the restart
+    await book_catalog.load()
+
+    # Open the pooled upstream connections before the first request needs them
+    await http_clients.start()
+
+    # Build the graph search index in the background once the graph is loaded
+    search_index_task = asyncio.create_task(graph_search.ensure_built())
+
+    # Link similar books; the job waits for the graph to be loaded
+    if similarity_edge_settings.enabled:
+        similarity_edge_job.start()
 
     # Start health monitoring background task
     task = None
@@ -92,6 +109,12 @@ async def lifespan(app: FastAPI):
         task = asyncio.create_task(health_check_task())
         logger.info("Health monitoring background task started")
 
+    logger.info(
+        "Application started",
+        startup_time=f"{time.perf_counter() - start_time:.4f}s",
+        graph_ready=graph_instance.is_ready,
+    )
+
     yield
 
     # Shutdown
@@ -103,6 +126,27 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("Health monitoring background task cancelled")
 
+    if similarity_edge_settings.enabled:
+        await similarity_edge_job.stop()
+
+    # Loading runs on a worker thread and cannot be cancelled
+    await hydration_task
+    try:
+        await search_index_task
+    except Exception as exc:
+        logger.error("Graph search index build failed", error=str(exc))
+    await asyncio.to_thread(graph_search.save)
+
+    # Flush pending graph mutations before exit
+    await graph_instance.stop_persistence()
+    graph_analytics.shutdown()
+    if search_prefetcher is not None:
+        await search_prefetcher.close()
+    await book_catalog.persist()
+    book_catalog.close()
+    search_cache.close()
+    await http_clients.close()
+
 
 app = FastAPI(lifespan=lifespan)
 logger.info("Application initialized")
@@ -114,6 +158,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Graph-Version", "X-Graph-Instance"],
 )
 
 # Setup middleware for request logging
@@ -176,14 +221,28 @@ async def log_requests(request: Request, call_next):
         )
         raise
 
+
+@app.middleware("http")
+async def refresh_graph(request: Request, call_next):
+    """Middleware to apply graph changes made by other worker processes."""
+    await graph_instance.refresh_async()
+    return await call_next(request)
+
+# Routers that read or change the graph wait until it is loaded
+graph_ready = [Depends(require_graph_ready)]
+
 app.include_router(health_router, tags=["health-check"])
-app.include_router(graph_router, prefix="/graph", tags=["graph"])
+app.include_router(graph_router, prefix="/graph", tags=["graph"], dependencies=graph_ready)
 app.include_router(search_router, prefix="/books", tags=["books-search"])
-app.include_router(book_graph_router, prefix="/books", tags=["books-graph"])
+app.include_router(
+    book_graph_router, prefix="/books", tags=["books-graph"], dependencies=graph_ready)
+app.include_router(
+    library_import_router, prefix="/books", tags=["books-import"], dependencies=graph_ready)
 app.include_router(
     recommendations_router,
     prefix="/analytics",
     tags=["books-recommendations"],
+    dependencies=graph_ready,
 )
 
 if __name__ == "__main__":
@@ -1,14 +1,29 @@
 # python
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 # 3rd party
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+# Largest page a search may request; bigger than one Google Books page
+MAX_SEARCH_RESULTS = 200
 
 
 class BookSearchRequest(BaseModel):
     """Schema of the incoming request for searching books."""
 
     query: str
-    max_results: int = 10
+    max_results: int = Field(default=10, ge=1, le=MAX_SEARCH_RESULTS)
+    start_index: int = Field(default=0, ge=0, description="Position of the first result")
+    page_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=MAX_SEARCH_RESULTS,
+        description="Number of results of the page, overrides max_results",
+    )
+    prefetch_next: bool = Field(
+        default=False,
+        description="Fetch the next page in the background",
+    )
 
 
 class BookSearchItem(BaseModel):
@@ -34,8 +49,57 @@ class BookSearchItem(BaseModel):
     description: Optional[str] = None
     cover: Optional[str] = None
 
+    def to_node_properties(self) -> Dict[str, Any]:
+        """Properties of the graph node representing this book."""
+        return {
+            "code": self.code,
+            "title": self.title,
+            "author": self.author,
+            "published": self.published,
+            "isbn": self.isbn,
+            "subjects": self.subjects,
+            "description": self.description,
+            "cover": self.cover,
+        }
+
+
+class BookReference(BaseModel):
+    """Book to add to the graph: data of a search result, or only its code or
+    ISBN, the rest being resolved from the local book catalog.
+
+    Fields that are sent take precedence over the catalog.
+    """
+
+    author: Optional[str] = None
+    title: Optional[str] = None
+    code: Optional[str] = None
+    published: Optional[str] = None
+    isbn: Optional[str] = None
+    subjects: Optional[List[str]] = None
+    description: Optional[str] = None
+    cover: Optional[str] = None
+
 
 class BookSearchResponse(BaseModel):
     """List of found books (simplified response from Google Books API)."""
 
     items: List[BookSearchItem]
+    start_index: int = 0
+    # Start of the next page, None once a page came back empty
+    next_start_index: Optional[int] = None
+
+
+class BookSuggestion(BaseModel):
+    """Typeahead suggestion: a title (with its Google Books code) or an author."""
+
+    kind: Literal["title", "author"]
+    text: str
+    score: float
+    code: Optional[str] = None
+
+
+class BookSuggestResponse(BaseModel):
+    """Suggestions for a typed prefix, best first."""
+
+    prefix: str
+    suggestions: List[BookSuggestion]
@@ -1,8 +1,8 @@
 # python
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Literal, Optional
 
 # 3rd party
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Node(BaseModel):
@@ -25,6 +25,82 @@ class Graph(BaseModel):
     edges: List[Edge]
 
 
+class GraphPage(Graph):
+    """Graph structure, or one page of it when paginated.
+
+    Pages list nodes first, then edges. `next_cursor` is absent on the last page.
+    """
+    version: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class GraphNeighborhood(Graph):
+    """Subgraph around a node."""
+    center: str
+    depth: int
+    direction: Literal["in", "out", "both"]
+    truncated: bool = False
+
+
+class GraphChange(BaseModel):
+    """Single graph mutation.
+
+    Removing a node implicitly removes all of its edges.
+    """
+    version: int
+    op: Literal["upsert_node", "delete_node", "upsert_edge", "delete_edge"]
+    node: Optional[Node] = None
+    node_id: Optional[str] = None
+    edge: Optional[Edge] = None
+    source: Optional[str] = None
+    target: Optional[str] = None
+
+
+class GraphChangesResponse(BaseModel):
+    """Graph changes since a version.
+
+    If the requested version is no longer covered by the change log,
+    `full_snapshot` is true and `graph` holds the whole graph instead.
+    """
+    version: int
+    instance: str
+    full_snapshot: bool = False
+    changes: List[GraphChange] = []
+    graph: Optional[Graph] = None
+
+
+class GraphAnalyticsResponse(BaseModel):
+    """Graph metric computed at a graph version.
+
+    Node metrics fill `values` (node id -> score, highest first);
+    "components" fills `components` (node ids per weakly connected
+    component, largest first). `stale` means the graph changed since.
+    """
+    metric: Literal["pagerank", "in_degree", "out_degree", "betweenness", "components"]
+    version: int
+    stale: bool = False
+    nodes_count: int
+    sample_size: Optional[int] = None
+    values: Optional[Dict[str, float]] = None
+    components: Optional[List[List[str]]] = None
+
+
+class GraphSearchHit(BaseModel):
+    """Node matching a graph search, with its BM25 relevance score."""
+    node: Node
+    score: float
+
+
+class GraphSearchResponse(BaseModel):
+    """Graph search results, most relevant first.
+
+    `total` counts all matching nodes, not only the returned ones.
+    """
+    query: str
+    total: int
+    results: List[GraphSearchHit]
+
+
 class AddNodeRequest(BaseModel):
     """Add node request."""
     label: str
@@ -42,3 +118,43 @@ class AddEdgeRequest(BaseModel):
     source: str
     target: str
     weight: float = 1.0
+
+
+class GraphOperation(BaseModel):
+    """Single operation of a batch request.
+
+    `add_node` may set `ref`; later operations of the same batch can then
+    pass "$<ref>" as `node_id`, `source` or `target`.
+    """
+    op: Literal["add_node", "change_node", "remove_node", "add_edge", "remove_edge"]
+    ref: Optional[str] = None
+    node_id: Optional[str] = None
+    label: Optional[str] = None
+    properties: Optional[Dict[str, Any]] = None
+    source: Optional[str] = None
+    target: Optional[str] = None
+    weight: float = 1.0
+
+
+class GraphBatchRequest(BaseModel):
+    """Batch of graph operations applied atomically."""
+    operations: List[GraphOperation] = Field(..., min_length=1, max_length=5000)
+
+
+class GraphOperationResult(BaseModel):
+    """Result of a single batch operation."""
+    index: int
+    op: str
+    # Whether the operation itself succeeded; it is still rolled back
+    # if a later operation of the batch fails
+    success: bool
+    node: Optional[Node] = None
+    edge: Optional[Edge] = None
+    error: Optional[str] = None
+
+
+class GraphBatchResponse(BaseModel):
+    """Result of a batch request. If `applied` is false nothing was changed."""
+    applied: bool
+    version: int
+    results: List[GraphOperationResult]
@@ -0,0 +1,33 @@
+# python
+from datetime import datetime
+from typing import List, Literal, Optional
+
+# 3rd party
+from pydantic import BaseModel
+
+
+class UnresolvedImportRow(BaseModel):
+    """Row of a reading list that could not be resolved to a book."""
+
+    line: int
+    input: str
+    reason: str
+
+
+class LibraryImportStatus(BaseModel):
+    """Progress of a library import; the final report once completed."""
+
+    job_id: str
+    status: Literal["resolving", "completed", "failed"]
+    total_rows: int
+    processed_rows: int
+    resolved: int
+    added: int
+    duplicates: int
+    unresolved_count: int
+    truncated: bool = False
+    added_node_ids: List[str] = []
+    unresolved: List[UnresolvedImportRow] = []
+    error: Optional[str] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,10 @@
+# python
+import os
+
+
+# app.core.config refuses to load without the API settings; tests never call the APIs
+os.environ.setdefault("GOOGLE_BOOKS_API_KEY", "test")
+os.environ.setdefault("GOOGLE_BOOKS_API_ENDPOINT", "http://localhost:9/books/v1/volumes")
+os.environ.setdefault("GEMINI_API_KEY", "test")
+# Keep the book catalog in memory instead of app/data
+os.environ.setdefault("BOOK_CATALOG_PERSIST", "false")
@@ -0,0 +1,87 @@
+# python
+import json
+
+# 3rd party
+import pytest
+
+# project
+from app.core.binary_snapshot import (
+    HEADER,
+    NUL_SEPARATED_VERSION,
+    BinaryGraphStorage,
+    decode_graph,
+    encode_graph,
+)
+from app.core.graph_persistence import JsonGraphStorage
+
+
+GRAPH = {
+    "nodes": [
+        {"id": "1", "label": "Dune", "properties": {
+            "author": "Frank Herbert", "subjects": ["Fiction", "Sci-Fi"], "isbn": None,
+        }},
+        {"id": "2", "label": "Emma", "properties": {
+            "author": "Jane Austen", "subjects": ["Fiction"], "isbn": "9780141439587",
+        }},
+        {"id": "3", "label": "Ulysses — édition", "properties": {
+            "description": "Contains\0a NUL", "rating": 4.5, "read": True,
+            "tags": ["a", None, 3], "meta": {"pages": 730},
+        }},
+        {"id": "4", "label": "", "properties": {}},
+    ],
+    "edges": [
+        {"source": "1", "target": "2", "weight": 0.5},
+        {"source": "3", "target": "1", "weight": 1.0},
+    ],
+}
+
+
+def test_round_trip_keeps_every_value():
+    nodes, edges = decode_graph(encode_graph(GRAPH))
+
+    assert [{"id": node_id, **attributes} for node_id, attributes in nodes] == GRAPH["nodes"]
+    assert edges == [(edge["source"], edge["target"], edge["weight"]) for edge in GRAPH["edges"]]
+
+
+def test_nul_separated_snapshots_are_still_read():
+    graph_data = {
+        "nodes": [{"id": "1", "label": "Dune", "properties": {"subjects": ["Fiction"]}}],
+        "edges": [{"source": "1", "target": "1", "weight": 2.0}],
+    }
+    content = encode_graph(graph_data)
+    magic, _, reserved, n_strings, blob_len, *counts = HEADER.unpack_from(content, 0)
+    # Rewrite as version 1: no ends table, strings separated by NUL
+    blob_start = HEADER.size + n_strings * 4
+    ends = list(memoryview(content)[HEADER.size:blob_start].cast("I"))
+    text = content[blob_start:blob_start + blob_len].decode("utf-8")
+    legacy_blob = "\0".join(map(text.__getitem__, map(slice, [0, *ends[:-1]], ends))).encode("utf-8")
+    legacy = b"".join((
+        HEADER.pack(magic, NUL_SEPARATED_VERSION, reserved, n_strings, len(legacy_blob), *counts),
+        legacy_blob,
+        content[blob_start + blob_len:],
+    ))
+
+    nodes, edges = decode_graph(legacy)
+
+    assert nodes == [("1", {"label": "Dune", "properties": {"subjects": ["Fiction"]}})]
+    assert edges == [("1", "1", 2.0)]
+
+
+def test_storage_round_trip(tmp_path):
+    storage = BinaryGraphStorage(tmp_path / "graph.blgs")
+    storage.save_graph(GRAPH)
+
+    assert BinaryGraphStorage(tmp_path / "graph.blgs").load_graph() == GRAPH
+
+
+@pytest.mark.parametrize("snapshot_exists", [False, True])
+def test_legacy_json_is_imported_into_a_new_snapshot(tmp_path, snapshot_exists):
+    json_path = tmp_path / "graph.json"
+    json_path.write_text(json.dumps(GRAPH), encoding="utf-8")
+    if snapshot_exists:
+        BinaryGraphStorage(tmp_path / "graph.blgs").save_graph({"nodes": [], "edges": []})
+
+    storage = BinaryGraphStorage(tmp_path / "graph.blgs", legacy_json_path=json_path)
+
+    assert storage.load_graph() == (
+        {"nodes": [], "edges": []} if snapshot_exists else JsonGraphStorage(json_path).load_graph())
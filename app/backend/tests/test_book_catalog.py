@@ -0,0 +1,55 @@
+# python
+import asyncio
+import sqlite3
+
+# project
+from app.core.book_catalog import BookCatalog, SqliteBookCatalogStore
+from app.schemas.books_search import BookSearchItem
+
+
+def book(code: str) -> BookSearchItem:
+    return BookSearchItem(author="Frank Herbert", title=f"Dune {code}", code=code)
+
+
+def test_persisted_catalog_is_restored_in_eviction_order(tmp_path):
+    catalog = BookCatalog(max_size=2, store=SqliteBookCatalogStore(tmp_path / "catalog.sqlite3"))
+    catalog.add_many([book("a"), book("b")])
+    asyncio.run(catalog.persist())
+    catalog.add_many([book("c"), book("a")])
+    asyncio.run(catalog.persist())
+    catalog.close()
+
+    restored = BookCatalog(max_size=2, store=SqliteBookCatalogStore(tmp_path / "catalog.sqlite3"))
+    asyncio.run(restored.load())
+
+    assert [item.code for item in restored.items()] == ["c", "a"]
+
+
+def test_failed_write_is_retried_by_the_next_persist(tmp_path):
+    store = SqliteBookCatalogStore(tmp_path / "catalog.sqlite3")
+    write = store.write
+    calls = []
+
+    def locked_once(upserts, deletes):
+        calls.append(upserts)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        write(upserts, deletes)
+
+    store.write = locked_once
+    catalog = BookCatalog(max_size=10, store=store)
+    catalog.add_many([book("a"), book("b")])
+    asyncio.run(catalog.persist())
+    asyncio.run(catalog.persist())
+
+    assert sorted(code for code, _, _ in calls[1]) == ["a", "b"]
+    assert sorted(data["code"] for _, data in store.load()) == ["a", "b"]
+
+
+def test_store_opens_the_database_on_first_use(tmp_path):
+    store = SqliteBookCatalogStore(tmp_path / "data" / "catalog.sqlite3")
+
+    assert not store.file_path.exists()
+    assert store.load() == []
+    assert store.file_path.exists()
+    store.close()
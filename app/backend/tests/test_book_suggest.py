@@ -0,0 +1,33 @@
+# project
+from app.core.book_suggest import PrefixIndex
+
+# 3rd party
+import pytest
+
+
+def build_index(titles, precomputed_length=2):
+    suggestions = [("title", title, float(len(titles) - position), None) for position, title in enumerate(titles)]
+    return PrefixIndex(suggestions, max_words=6, precomputed_length=precomputed_length, max_limit=50)
+
+
+def titles_of(index, positions):
+    return [index.suggestions[position][1] for position in positions]
+
+
+def test_short_prefixes_next_to_single_character_keys():
+    # "Volume 1" and "Malcolm X" are also indexed under the one-character keys "1" and "x"
+    index = build_index(["1984", "Volume 1", "Xavier", "Malcolm X"])
+
+    assert titles_of(index, index.lookup("19", 10)) == ["1984"]
+    assert titles_of(index, index.lookup("xa", 10)) == ["Xavier"]
+    assert titles_of(index, index.lookup("1", 10)) == ["1984", "Volume 1"]
+    assert titles_of(index, index.lookup("x", 10)) == ["Xavier", "Malcolm X"]
+
+
+@pytest.mark.parametrize("prefix", ["1", "19", "v", "vo", "x", "xa", "m", "ma", "a", "zz"])
+def test_precomputed_prefixes_match_ranking_the_key_range(prefix):
+    titles = ["1984", "Volume 1", "Xavier", "Malcolm X", "Mao", "M", "Ma", "Anna"]
+    index = build_index(titles)
+    dynamic = build_index(titles, precomputed_length=0)
+
+    assert index.lookup(prefix, 10) == dynamic.lookup(prefix, 10)
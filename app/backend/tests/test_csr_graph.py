@@ -0,0 +1,38 @@
+# python
+from typing import Tuple
+
+# project
+from app.core.csr_graph import CSRGraph
+from app.core.graph import IGraphEngine, NetworkXGraph
+
+# 3rd party
+import numpy as np
+
+
+def build(engine: IGraphEngine) -> IGraphEngine:
+    for number in range(6):
+        engine.add_node(str(number), f"Book {number}", {})
+    for source, target, weight in [(0, 1, 1.0), (0, 2, 0.5), (3, 0, 2.0), (4, 5, 1.0), (2, 4, 0.25)]:
+        engine.add_edge(str(source), str(target), weight)
+    engine.remove_edge("0", "2")
+    engine.remove_node("5")
+    engine.add_edge("1", "3", 3.0)
+    return engine
+
+
+def edge_set(index: Tuple) -> set:
+    node_ids, sources, targets, weights = index
+    return {
+        (node_ids[source], node_ids[target], weight)
+        for source, target, weight in zip(list(sources), list(targets), list(weights))
+    }
+
+
+def test_csr_edge_index_matches_the_generic_one():
+    csr = build(CSRGraph())
+    index = csr.edge_index()
+
+    assert isinstance(index[1], np.ndarray)
+    assert index[0] == csr.node_ids()
+    assert edge_set(index) == edge_set(IGraphEngine.edge_index(csr))
+    assert edge_set(index) == edge_set(build(NetworkXGraph()).edge_index())
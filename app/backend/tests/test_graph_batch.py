@@ -0,0 +1,62 @@
+# python
+import json
+
+# 3rd party
+import pytest
+
+# project
+from app.core.config import GraphSettings
+from app.core.graph import GraphBatchError, GraphManager
+from app.core.graph_persistence import GraphPersistenceService, JsonGraphStorage
+
+
+def create_manager(tmp_path, engine: str) -> GraphManager:
+    manager = GraphManager(
+        persistence_service=GraphPersistenceService(JsonGraphStorage(tmp_path / "graph.json")),
+        settings=GraphSettings(engine=engine, async_persistence=False, write_behind_enabled=False),
+        load=False,
+    )
+    manager.load_from_storage()
+    return manager
+
+
+@pytest.mark.parametrize("engine", ["networkx", "csr"])
+def test_batch_resolves_references_and_persists_once(tmp_path, engine):
+    manager = create_manager(tmp_path, engine)
+
+    results = manager.apply_batch([
+        {"op": "add_node", "label": "Dune", "ref": "dune"},
+        {"op": "add_node", "label": "Emma", "ref": "emma"},
+        {"op": "add_edge", "source": "$dune", "target": "$emma", "weight": 0.5},
+    ])
+
+    dune, emma = results[0]["node"].id, results[1]["node"].id
+    assert manager.version == 1
+    assert manager.get_edge_data(dune, emma)["weight"] == 0.5
+    saved = json.loads((tmp_path / "graph.json").read_text(encoding="utf-8"))
+    assert [node["label"] for node in saved["nodes"]] == ["Dune", "Emma"]
+
+
+@pytest.mark.parametrize("engine", ["networkx", "csr"])
+def test_failing_operation_rolls_back_the_whole_batch(tmp_path, engine):
+    manager = create_manager(tmp_path, engine)
+    dune = manager.add_node("Dune", {"year": 1965})
+    emma = manager.add_node("Emma", {})
+    manager.add_edge(dune.id, emma.id, 0.5)
+    before, version = manager.show_graph().model_dump(), manager.version
+
+    with pytest.raises(GraphBatchError) as error:
+        manager.apply_batch([
+            {"op": "add_node", "label": "Ulysses", "ref": "ulysses"},
+            {"op": "change_node", "node_id": dune.id, "label": "Dune Messiah", "properties": {}},
+            {"op": "add_edge", "source": emma.id, "target": "$ulysses", "weight": 1.0},
+            {"op": "add_edge", "source": dune.id, "target": emma.id, "weight": 0.9},
+            {"op": "remove_node", "node_id": emma.id},
+            {"op": "remove_edge", "source": dune.id, "target": "$missing"},
+            {"op": "add_node", "label": "Never applied"},
+        ])
+
+    assert error.value.index == 5
+    assert manager.show_graph().model_dump() == before
+    assert manager.version == version
+    assert manager.get_edge_data(dune.id, emma.id)["weight"] == 0.5
@@ -0,0 +1,30 @@
+# python
+import math
+
+# project
+from app.core.graph_metrics import compute_metric
+
+# 3rd party
+import numpy as np
+import pytest
+
+
+PARAMETERS = {"pagerank_alpha": 0.85, "pagerank_max_iter": 100, "pagerank_tol": 1e-6}
+
+
+def pagerank(edges):
+    sources, targets, weights = (np.array(column) for column in zip(*edges))
+    values, _ = compute_metric(
+        "pagerank", 3, sources.astype(np.int64), targets.astype(np.int64),
+        weights.astype(float), PARAMETERS)
+    return values
+
+
+@pytest.mark.parametrize("weight", [0.0, -2.0])
+def test_pagerank_treats_nodes_without_positive_out_weight_as_dangling(weight):
+    values = pagerank([(0, 1, weight), (1, 2, 1.0), (2, 1, 1.0)])
+
+    assert all(math.isfinite(value) for value in values)
+    assert sum(values) == pytest.approx(1.0)
+    # Same as a graph without the edge: node 0 is dangling
+    assert values == pytest.approx(pagerank([(1, 2, 1.0), (2, 1, 1.0)]))
@@ -0,0 +1,59 @@
+# python
+import base64
+
+# project
+from app.api.graph_endpoints import _decode_cursor
+from app.core.config import GraphSettings
+from app.core.graph import GraphManager
+from app.core.graph_persistence import GraphPersistenceService, JsonGraphStorage
+
+# 3rd party
+import pytest
+from fastapi import HTTPException
+
+
+@pytest.fixture(params=["networkx", "csr"])
+def graph_manager(request, tmp_path):
+    settings = GraphSettings(engine=request.param, async_persistence=False, write_behind_enabled=False)
+    manager = GraphManager(
+        persistence_service=GraphPersistenceService(JsonGraphStorage(tmp_path / "graph.json")),
+        settings=settings,
+        load=False,
+    )
+    ids = [manager.add_node(label=f"Book {i}", properties={"code": f"c{i}"}).id for i in range(23)]
+    for i in range(1, len(ids)):
+        manager.add_edge(ids[i - 1], ids[i], 1.0)
+        if i % 3 == 0:
+            manager.add_edge(ids[i], ids[0], 0.5)
+    return manager
+
+
+@pytest.mark.parametrize("limit", [1, 7, 23, 40, 100])
+def test_pages_cover_the_graph_once(graph_manager, limit):
+    nodes, edges, offset, pages = [], [], 0, 0
+    while offset is not None:
+        page, offset = graph_manager.get_page(offset, limit)
+        assert 0 < len(page["nodes"]) + len(page["edges"]) <= limit
+        nodes += page["nodes"]
+        edges += page["edges"]
+        pages += 1
+
+    structure = graph_manager.show_graph()
+    assert nodes == [node.model_dump() for node in structure.nodes]
+    assert edges == [edge.model_dump() for edge in structure.edges]
+    assert pages == -(-(len(nodes) + len(edges)) // limit)
+
+
+def test_page_after_change_uses_the_new_version(graph_manager):
+    graph_manager.get_page(0, 10)
+    graph_manager.add_node(label="New", properties={})
+    page, _ = graph_manager.get_page(len(graph_manager.show_graph().nodes) - 1, 1)
+    assert page["nodes"][0]["label"] == "New"
+
+
+@pytest.mark.parametrize("raw", ["token:1:-5", "token:1", "token:x:1"])
+def test_invalid_cursor_is_rejected(raw):
+    cursor = base64.urlsafe_b64encode(raw.encode()).decode()
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,43 @@
+# python
+import asyncio
+import threading
+
+# project
+from app.core.config import GraphSettings
+from app.core.graph import GraphManager
+from app.core.graph_persistence import GraphPersistenceService, JsonGraphStorage
+
+
+def create_manager(tmp_path):
+    return GraphManager(
+        persistence_service=GraphPersistenceService(JsonGraphStorage(tmp_path / "graph.json")),
+        settings=GraphSettings(async_persistence=False, write_behind_enabled=False),
+        load=False,
+    )
+
+
+def test_waiters_are_woken_by_hydration_without_holding_threads(tmp_path):
+    manager = create_manager(tmp_path)
+
+    async def scenario():
+        waiters = [asyncio.create_task(manager.wait_until_ready(5.0)) for _ in range(50)]
+        await asyncio.sleep(0.05)
+        threads_while_waiting = threading.active_count()
+        await manager.hydrate()
+        return threads_while_waiting, await asyncio.gather(*waiters)
+
+    threads_before = threading.active_count()
+    threads_while_waiting, results = asyncio.run(scenario())
+
+    assert threads_while_waiting == threads_before
+    assert results == [True] * 50
+    assert manager.is_ready
+
+
+def test_wait_times_out_before_the_graph_is_loaded(tmp_path):
+    manager = create_manager(tmp_path)
+
+    assert asyncio.run(manager.wait_until_ready(0.05)) is False
+    manager.load_from_storage()
+    # A later loop sees the graph ready right away
+    assert asyncio.run(manager.wait_until_ready(0.05)) is True
@@ -0,0 +1,41 @@
+# python
+import asyncio
+
+# project
+from app.core.config import GraphSettings
+from app.core.graph import GraphManager
+from app.core.graph_persistence import GraphPersistenceService, JsonGraphStorage
+from app.core.shared_graph_log import SharedGraphLog
+
+
+def create_worker(tmp_path):
+    return GraphManager(
+        persistence_service=GraphPersistenceService(JsonGraphStorage(tmp_path / "graph.json")),
+        settings=GraphSettings(multiprocess=True, checkpoint_interval=1000),
+        shared_log=SharedGraphLog(tmp_path),
+    )
+
+
+def test_refresh_async_applies_changes_of_other_workers(tmp_path):
+    writer, reader = create_worker(tmp_path), create_worker(tmp_path)
+    node = writer.add_node("Dune", {"title": "Dune"})
+
+    asyncio.run(reader.refresh_async())
+
+    assert reader.version == writer.version
+    assert reader.get_node_data(node.id)["label"] == "Dune"
+
+
+def test_refresh_async_reloads_the_checkpoint_after_a_feed_gap(tmp_path):
+    writer, reader = create_worker(tmp_path), create_worker(tmp_path)
+    first = writer.add_node("Dune", {})
+    second = writer.add_node("Emma", {})
+    # Trims the feed: the reader can only get these nodes from the checkpoint
+    assert writer.checkpoint()
+    third = writer.add_node("Ulysses", {})
+
+    asyncio.run(reader.refresh_async())
+
+    assert reader.version == writer.version
+    assert [reader.get_node_data(node.id)["label"] for node in (first, second, third)] == [
+        "Dune", "Emma", "Ulysses"]
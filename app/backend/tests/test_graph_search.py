@@ -0,0 +1,89 @@
+# python
+import asyncio
+
+# project
+from app.core.config import GraphSearchSettings, GraphSettings
+from app.core.graph import GraphManager
+from app.core.graph_persistence import GraphPersistenceService, JsonGraphStorage
+from app.core.graph_search import GraphSearchIndex
+
+
+BOOKS = [
+    ("Dune", {"author": "Frank Herbert", "subjects": ["Science Fiction"],
+              "description": "A desert planet and its spice."}),
+    ("Children of Dune", {"author": "Frank Herbert", "subjects": ["Science Fiction"]}),
+    ("Emma", {"author": "Jane Austen", "subjects": ["Romance"],
+              "description": "A comedy of manners; Emma reads about a desert island."}),
+    ("Les Misérables", {"author": "Victor Hugo", "subjects": ["Historical Fiction"]}),
+]
+
+
+def create_index(tmp_path, persist: bool = False):
+    manager = GraphManager(
+        persistence_service=GraphPersistenceService(JsonGraphStorage(tmp_path / "graph.json")),
+        settings=GraphSettings(async_persistence=False, write_behind_enabled=False),
+        load=False,
+    )
+    manager.load_from_storage()
+    index = GraphSearchIndex(manager, GraphSearchSettings(
+        persist=persist, index_path=str(tmp_path / "graph.search.npz")))
+    return manager, index
+
+
+def labels(manager, results):
+    return [manager.get_node_data(node_id)["label"] for node_id, _ in results]
+
+
+def test_search_ranks_by_bm25_relevance(tmp_path):
+    manager, index = create_index(tmp_path)
+    for label, properties in BOOKS:
+        manager.add_node(label, properties)
+    asyncio.run(index.ensure_built())
+
+    # The shorter label match outranks the longer one
+    count, results = index.search("dune", limit=10)
+    assert count == 2
+    assert labels(manager, results) == ["Dune", "Children of Dune"]
+    # A label match outweighs the same term in a description
+    assert labels(manager, index.search("emma desert", limit=10)[1])[0] == "Emma"
+    # Matching more query terms ranks first; results are capped by limit
+    count, results = index.search("desert spice", limit=1)
+    assert count == 2
+    assert labels(manager, results) == ["Dune"]
+    # Matching ignores case and diacritics
+    assert labels(manager, index.search("MISERABLES", limit=10)[1]) == ["Les Misérables"]
+    assert index.search("tolkien", limit=10) == (0, [])
+
+
+def test_committed_changes_update_the_built_index(tmp_path):
+    manager, index = create_index(tmp_path)
+    dune = manager.add_node("Dune", {"author": "Frank Herbert"})
+    emma = manager.add_node("Emma", {"author": "Jane Austen"})
+    asyncio.run(index.ensure_built())
+
+    manager.change_node(dune.id, "Dune Messiah", {"author": "Frank Herbert"})
+    manager.remove_node(emma.id)
+    manager.add_node("Persuasion", {"author": "Jane Austen"})
+
+    assert labels(manager, index.search("messiah", limit=10)[1]) == ["Dune Messiah"]
+    assert labels(manager, index.search("austen", limit=10)[1]) == ["Persuasion"]
+
+
+def test_rebuild_from_the_saved_index_matches_a_fresh_build(tmp_path):
+    manager, index = create_index(tmp_path, persist=True)
+    nodes = [manager.add_node(label, properties) for label, properties in BOOKS]
+    asyncio.run(index.ensure_built())
+    assert index.save()
+
+    # Changed after the save: the rebuild must index these again
+    manager.change_node(nodes[0].id, "Dune", {"author": "Brian Herbert"})
+    manager.remove_node(nodes[2].id)
+    reloaded = GraphSearchIndex(manager, GraphSearchSettings(
+        persist=True, index_path=str(tmp_path / "graph.search.npz")))
+    fresh = GraphSearchIndex(manager, GraphSearchSettings(persist=False))
+    asyncio.run(reloaded.ensure_built())
+    asyncio.run(fresh.ensure_built())
+
+    for query in ("herbert", "brian", "emma", "fiction dune"):
+        assert reloaded.search(query, limit=10) == fresh.search(query, limit=10)
+    assert labels(manager, reloaded.search("brian", limit=10)[1]) == ["Dune"]
@@ -0,0 +1,55 @@
+# python
+import json
+
+# project
+from app.core.graph_persistence import JournalGraphStorage
+
+
+def node(node_id: str, label: str) -> dict:
+    return {"id": node_id, "label": label, "properties": {}}
+
+
+def create_storage(tmp_path, compact_threshold: int = 100) -> JournalGraphStorage:
+    return JournalGraphStorage(tmp_path / "graph.json", compact_threshold=compact_threshold)
+
+
+def test_appended_mutations_are_replayed_on_load(tmp_path):
+    storage = create_storage(tmp_path)
+    storage.save_graph({"nodes": [node("1", "Dune")], "edges": []})
+    storage.apply_mutations([
+        {"op": "upsert_node", "node": node("2", "Emma")},
+        {"op": "upsert_edge", "edge": {"source": "1", "target": "2", "weight": 0.5}},
+        {"op": "upsert_node", "node": node("1", "Dune Messiah")},
+    ])
+    storage.delete_node("2")
+    storage.upsert_node(node("3", "Ulysses"))
+
+    assert create_storage(tmp_path).load_graph() == {
+        "nodes": [node("1", "Dune Messiah"), node("3", "Ulysses")],
+        "edges": [],
+    }
+    assert len(storage.journal_path.read_text(encoding="utf-8").splitlines()) == 5
+
+
+def test_journal_is_folded_into_the_snapshot_at_the_threshold(tmp_path):
+    storage = create_storage(tmp_path, compact_threshold=3)
+    for number in range(4):
+        storage.upsert_node(node(str(number), f"Book {number}"))
+
+    snapshot = json.loads((tmp_path / "graph.json").read_text(encoding="utf-8"))
+    assert [item["id"] for item in snapshot["nodes"]] == ["0", "1", "2"]
+    assert len(storage.journal_path.read_text(encoding="utf-8").splitlines()) == 1
+    assert [item["id"] for item in create_storage(tmp_path).load_graph()["nodes"]] == ["0", "1", "2", "3"]
+
+
+def test_torn_last_record_is_skipped_and_dropped(tmp_path):
+    storage = create_storage(tmp_path)
+    storage.upsert_node(node("1", "Dune"))
+    with open(storage.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "upsert_node", "node": {"id": "2"')
+
+    reloaded = create_storage(tmp_path)
+    assert reloaded.load_graph()["nodes"] == [node("1", "Dune")]
+    # Loading compacted the journal, so new records start on a clean line
+    reloaded.upsert_node(node("3", "Emma"))
+    assert [item["id"] for item in create_storage(tmp_path).load_graph()["nodes"]] == ["1", "3"]
@@ -0,0 +1,93 @@
+# python
+import asyncio
+from typing import List
+
+# project
+from app.core.books_search_service import IBooksSearchService
+from app.core.config import GraphSettings, LibraryImportSettings
+from app.core.graph import GraphBatchError, GraphManager
+from app.core.graph_persistence import GraphPersistenceService, JsonGraphStorage
+from app.core.library_import import LibraryImportService
+from app.schemas.books_search import BookSearchItem
+
+
+class SlowBooksSearchService(IBooksSearchService):
+    """Resolves every query to its own book, after a delay."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        await asyncio.sleep(self.delay)
+        return [BookSearchItem(author="Author", title=query, code=query)]
+
+
+def create_manager(tmp_path):
+    manager = GraphManager(
+        persistence_service=GraphPersistenceService(JsonGraphStorage(tmp_path / "graph.json")),
+        settings=GraphSettings(async_persistence=False, write_behind_enabled=False),
+        load=False,
+    )
+    manager.load_from_storage()
+    return manager
+
+
+async def chunks_of(text: str):
+    yield text.encode("utf-8")
+
+
+def test_start_import_returns_before_rows_are_resolved(tmp_path):
+    service = LibraryImportService(
+        SlowBooksSearchService(delay=0.05),
+        create_manager(tmp_path),
+        LibraryImportSettings(concurrency=1, batch_size=10),
+    )
+    rows = "".join(f"Title {number}\n" for number in range(40))
+
+    async def scenario():
+        job = await service.start_import(chunks_of(rows), "csv")
+        started = job.to_dict()
+        await job.task
+        return job, started
+
+    job, started = asyncio.run(scenario())
+
+    assert started["status"] == "resolving"
+    assert started["total_rows"] == 40
+    assert started["processed_rows"] < 40
+    assert service.get_job(job.job_id) is job
+    assert job.status == "completed"
+    assert len(job.added_node_ids) == 40
+
+
+def test_failed_batch_reports_its_rows_and_the_import_goes_on(tmp_path):
+    manager = create_manager(tmp_path)
+    apply_batch = manager.apply_batch
+    calls = []
+
+    def fail_first_batch(operations):
+        calls.append(len(operations))
+        if len(calls) == 1:
+            raise GraphBatchError(0, "Storage unavailable")
+        return apply_batch(operations)
+
+    manager.apply_batch = fail_first_batch
+    service = LibraryImportService(
+        SlowBooksSearchService(delay=0),
+        manager,
+        LibraryImportSettings(concurrency=2, batch_size=5),
+    )
+    rows = "".join(f"Title {number}\n" for number in range(20))
+
+    async def scenario():
+        job = await service.start_import(chunks_of(rows), "csv")
+        await asyncio.wait_for(job.task, 5)
+        return job
+
+    job = asyncio.run(scenario())
+
+    assert job.status == "completed"
+    assert job.processed_rows == 20
+    assert len(job.unresolved) == 5
+    assert {row["reason"] for row in job.unresolved} == {"Graph insert failed: Storage unavailable"}
+    assert len(job.added_node_ids) == 15
@@ -0,0 +1,113 @@
+# python
+import asyncio
+from typing import Any, Dict, List
+
+# project
+from app.core.config import GraphSettings
+from app.core.graph import GraphManager
+from app.core.graph_persistence import (
+    GraphPersistenceService,
+    IIncrementalGraphStorage,
+    SqliteGraphStorage,
+)
+from app.core.persistence_writer import PersistenceWriter
+
+
+class FlakyStorage(IIncrementalGraphStorage):
+    """Records writes; the first `failures` mutation writes raise."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.mutations: List[Dict[str, Any]] = []
+        self.snapshots: List[Dict[str, Any]] = []
+
+    def load_graph(self) -> Dict[str, Any]:
+        return {"nodes": [], "edges": []}
+
+    def save_graph(self, graph_data: Dict[str, Any]) -> None:
+        self.snapshots.append(graph_data)
+
+    def apply_mutations(self, mutations: List[Dict[str, Any]]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise IOError("database is locked")
+        self.mutations.extend(mutations)
+
+    def upsert_node(self, node_data):
+        raise NotImplementedError
+
+    def delete_node(self, node_id):
+        raise NotImplementedError
+
+    def upsert_edge(self, edge_data):
+        raise NotImplementedError
+
+    def delete_edge(self, source, target):
+        raise NotImplementedError
+
+
+def run_writer(storage, submit):
+    graph = {"nodes": [{"id": "1", "label": "Dune", "properties": {}}], "edges": []}
+    writer = PersistenceWriter(GraphPersistenceService(storage), lambda: graph, retry_interval=0.01)
+
+    async def scenario():
+        writer.start(asyncio.get_running_loop())
+        submit(writer)
+        drained = await asyncio.to_thread(writer.drain, 5)
+        await asyncio.to_thread(writer.stop)
+        return drained
+
+    assert asyncio.run(scenario())
+    return writer, graph
+
+
+def test_failed_mutation_write_is_replaced_by_a_snapshot():
+    storage = FlakyStorage(failures=1)
+    mutation = {"op": "upsert_node", "node": {"id": "1", "label": "Dune", "properties": {}}}
+
+    writer, graph = run_writer(storage, lambda writer: writer.submit_mutations([mutation]))
+
+    assert storage.snapshots == [graph]
+    assert writer.metrics.failed == 1
+
+
+def test_mutation_writes_keep_their_order():
+    storage = FlakyStorage(failures=0)
+    mutations = [{"op": "delete_node", "id": str(number)} for number in range(5)]
+
+    def submit(writer):
+        for mutation in mutations:
+            writer.submit_mutations([mutation])
+
+    run_writer(storage, submit)
+
+    assert storage.mutations == mutations
+    assert storage.snapshots == []
+
+
+def test_manager_writes_mutations_in_the_background(tmp_path):
+    storage = SqliteGraphStorage(tmp_path / "graph.sqlite3")
+    manager = GraphManager(
+        persistence_service=GraphPersistenceService(storage),
+        settings=GraphSettings(async_persistence=True, write_behind_enabled=False),
+        load=False,
+    )
+    manager.load_from_storage()
+
+    async def scenario():
+        await manager.start_persistence()
+        dune = manager.add_node("Dune", {})
+        emma = manager.add_node("Emma", {})
+        manager.add_edge(dune.id, emma.id, 0.5)
+        manager.remove_node(emma.id)
+        drained = await manager.wait_for_writes(timeout=5)
+        await manager.stop_persistence()
+        return drained
+
+    assert asyncio.run(scenario())
+    assert storage.load_graph() == {
+        "nodes": [{"id": manager.show_graph().nodes[0].id, "label": "Dune", "properties": {}}],
+        "edges": [],
+    }
+    assert manager.persistence_metrics()["writer"]["failed"] == 0
+    storage.close()
@@ -0,0 +1,65 @@
+# python
+import asyncio
+from typing import Any, Dict, List
+
+# project
+from app.core.config import RecommendationSettings
+from app.core.recommendation_service import (
+    HybridRecommendationService,
+    PersistedRecommendationService,
+    create_recommendation_service,
+)
+from app.core.recommendations_persistence import RecommendationsPersistenceService
+from app.schemas.graph import Graph
+from app.schemas.recommendations import BookRecommendation, RecommendationsResponse
+
+# 3rd party
+import pytest
+
+
+class CountingPersistence(RecommendationsPersistenceService):
+    def __init__(self) -> None:
+        self.saved: List[Dict[str, Any]] = []
+
+    def save_recommendations(self, recommendations_data: Dict[str, Any]) -> None:
+        self.saved.append(recommendations_data)
+
+
+class FixedRecommendationService(PersistedRecommendationService):
+    def __init__(self, titles: List[str], persistence: RecommendationsPersistenceService, fail: bool = False):
+        super().__init__(persistence, persist=False)
+        self.titles = titles
+        self.fail = fail
+
+    async def get_recommendations(self, *, user_id: str, graph: Graph, limit: int) -> RecommendationsResponse:
+        if self.fail:
+            raise RuntimeError("Gemini unavailable")
+        response = RecommendationsResponse(
+            user_id=user_id, recommendations=[BookRecommendation(title=title) for title in self.titles])
+        self._save_recommendations(response)
+        return response
+
+
+@pytest.mark.parametrize("remote_fails", [False, True])
+def test_hybrid_saves_each_answer_once(remote_fails):
+    persistence = CountingPersistence()
+    service = HybridRecommendationService(
+        FixedRecommendationService(["Emma", "Dune"], persistence),
+        FixedRecommendationService(["Dune", "Ulysses"], persistence, fail=remote_fails),
+        RecommendationSettings(remote_timeout=1.0),
+        persistence,
+    )
+
+    response = asyncio.run(service.get_recommendations(user_id="u", graph=Graph(nodes=[], edges=[]), limit=3))
+
+    assert persistence.saved == [response.model_dump()]
+    assert [rec.title for rec in response.recommendations] == (
+        ["Emma", "Dune"] if remote_fails else ["Dune", "Ulysses", "Emma"])
+
+
+def test_hybrid_engine_does_not_save_from_its_inner_services():
+    service = create_recommendation_service(RecommendationSettings(engine="hybrid"))
+
+    assert service._persist
+    assert not service._local._persist
+    assert not service._remote._persist
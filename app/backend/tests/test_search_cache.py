@@ -0,0 +1,113 @@
+# python
+import asyncio
+from typing import List
+
+# 3rd party
+import pytest
+
+# project
+from app.core import search_cache as search_cache_module
+from app.core.books_search_service import IBooksSearchService
+from app.core.config import SearchCacheSettings
+from app.core.search_cache import CachingBooksSearchService, SearchResultCache, SqliteSearchCacheStore
+from app.schemas.books_search import BookSearchItem
+
+
+DUNE = BookSearchItem(author="Frank Herbert", title="Dune", code="dune")
+EMMA = BookSearchItem(author="Jane Austen", title="Emma", code="emma")
+
+
+class Clock:
+    """Stands in for the time module of the cache, both clocks move together."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(search_cache_module, "time", clock)
+    return clock
+
+
+class CountingSearchService(IBooksSearchService):
+    def __init__(self):
+        self.calls = 0
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        self.calls += 1
+        return [DUNE]
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchResultCache(SearchCacheSettings(ttl=60, max_entries=2, disk_enabled=False))
+
+    async def scenario():
+        await cache.put("dune", 10, [DUNE])
+        await cache.put("emma", 10, [EMMA])
+        # Queries differing in case and spacing share an entry
+        assert await cache.get("  DUNE ", 10) == [DUNE]
+        await cache.put("ulysses", 10, [])
+        return await cache.get("emma", 10), await cache.get("dune", 10)
+
+    assert asyncio.run(scenario()) == (None, [DUNE])
+    assert cache.metrics()["evictions"] == 1
+    assert cache.metrics()["entries"] == 2
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = SearchResultCache(SearchCacheSettings(ttl=60, disk_enabled=False))
+    asyncio.run(cache.put("dune", 10, [DUNE]))
+
+    clock.now += 59
+    assert cache.contains("dune", 10)
+    clock.now += 1
+    assert not cache.contains("dune", 10)
+    assert asyncio.run(cache.get("dune", 10)) is None
+    assert cache.metrics()["expirations"] == 1
+
+
+def test_disk_tier_serves_a_new_cache_until_the_entry_expires(tmp_path, clock):
+    store = SqliteSearchCacheStore(tmp_path / "cache.sqlite3")
+    asyncio.run(SearchResultCache(SearchCacheSettings(ttl=60), store=store).put("dune", 10, [DUNE]))
+
+    clock.now += 30
+    restarted = SearchResultCache(SearchCacheSettings(ttl=60), store=store)
+    assert asyncio.run(restarted.get("dune", 10)) == [DUNE]
+    assert restarted.metrics()["disk_hits"] == 1
+    # The memory copy keeps the remaining lifetime of the disk row
+    clock.now += 30
+    assert not restarted.contains("dune", 10)
+    assert asyncio.run(SearchResultCache(SearchCacheSettings(ttl=60), store=store).get("dune", 10)) is None
+    store.close()
+
+
+def test_closed_disk_store_reopens_on_next_use(tmp_path):
+    store = SqliteSearchCacheStore(tmp_path / "cache.sqlite3")
+    cache = SearchResultCache(SearchCacheSettings(ttl=60), store=store)
+    asyncio.run(cache.put("dune", 10, [DUNE]))
+    cache.close()
+
+    restarted = SearchResultCache(SearchCacheSettings(ttl=60), store=store)
+
+    assert asyncio.run(restarted.get("dune", 10)) == [DUNE]
+    restarted.close()
+
+
+def test_caching_service_calls_upstream_once_per_search():
+    upstream = CountingSearchService()
+    service = CachingBooksSearchService(
+        upstream, SearchResultCache(SearchCacheSettings(ttl=60, disk_enabled=False)))
+
+    async def scenario():
+        return [await service.search("dune", 10) for _ in range(3)] + [await service.search("dune", 20)]
+
+    assert asyncio.run(scenario()) == [[DUNE]] * 4
+    assert upstream.calls == 2
@@ -0,0 +1,90 @@
+# python
+import asyncio
+
+# project
+from app.core.config import GraphSettings, SimilarityEdgeSettings
+from app.core.graph import GraphManager
+from app.core.graph_persistence import GraphPersistenceService, JsonGraphStorage
+from app.core.shared_graph_log import SharedGraphLog
+from app.core.similarity_edges import SimilarityEdgeJob
+
+
+SETTINGS = SimilarityEdgeSettings(top_k=2, min_score=0.1, debounce=0.0, feed_poll_interval=0.05)
+BOOKS = [
+    ("Dune", "Frank Herbert", "desert planet spice empire"),
+    ("Dune Messiah", "Frank Herbert", "desert planet spice jihad"),
+    ("Children of Dune", "Frank Herbert", "desert planet spice twins"),
+    ("Emma", "Jane Austen", "matchmaking village society"),
+]
+
+
+def create_manager(tmp_path, shared_log=None):
+    manager = GraphManager(
+        persistence_service=GraphPersistenceService(JsonGraphStorage(tmp_path / "graph.json")),
+        settings=GraphSettings(async_persistence=False, write_behind_enabled=False),
+        shared_log=shared_log,
+        load=False,
+    )
+    manager.load_from_storage()
+    return manager
+
+
+def add_books(manager):
+    return [
+        manager.add_node(title, {"title": title, "author": author, "description": description}).id
+        for title, author, description in BOOKS
+    ]
+
+
+async def settle(rounds=20):
+    for _ in range(rounds):
+        await asyncio.sleep(0.05)
+
+
+def test_edges_of_a_deleted_book_are_forgotten(tmp_path):
+    manager = create_manager(tmp_path)
+    job = SimilarityEdgeJob(manager, SETTINGS)
+    ids = add_books(manager)
+
+    async def scenario():
+        job.start()
+        await settle()
+        linked = manager.get_edge_data(ids[0], ids[1]) is not None
+        manager.remove_node(ids[1])
+        await settle()
+        await job.stop()
+        return linked
+
+    assert asyncio.run(scenario())
+    assert all(ids[1] not in targets for targets in job._inferred.values())
+    assert ids[1] not in job._inferred and ids[1] not in job._inferred_by
+    assert job._inferred_by == {
+        target: {source for source, targets in job._inferred.items() if target in targets}
+        for target in {target for targets in job._inferred.values() for target in targets}
+    }
+
+
+def test_only_one_worker_runs_the_job(tmp_path):
+    workers = [create_manager(tmp_path, SharedGraphLog(tmp_path)) for _ in range(2)]
+    jobs = [SimilarityEdgeJob(manager, SETTINGS) for manager in workers]
+    ids = add_books(workers[1])
+
+    async def scenario():
+        for job in jobs:
+            job.start()
+        await settle()
+        active = [job.metrics()["active"] for job in jobs]
+        # The other worker takes over once the first one stops
+        await jobs[active.index(True)].stop()
+        await settle()
+        taken_over = [job.metrics()["active"] for job in jobs]
+        for job in jobs:
+            await job.stop()
+        return active, taken_over
+
+    active, taken_over = asyncio.run(scenario())
+
+    assert sorted(active) == [False, True]
+    assert taken_over == [not flag for flag in active]
+    workers[0].refresh()
+    assert workers[0].get_edge_data(ids[0], ids[1]) is not None
@@ -0,0 +1,95 @@
+# python
+import asyncio
+from typing import List
+
+# 3rd party
+import pytest
+
+# project
+from app.core.books_search_service import IBooksSearchService
+from app.core.single_flight import CoalescingBooksSearchService, SingleFlight
+from app.schemas.books_search import BookSearchItem
+
+
+DUNE = BookSearchItem(author="Frank Herbert", title="Dune", code="dune")
+
+
+class SlowSearchService(IBooksSearchService):
+    def __init__(self):
+        self.calls = 0
+
+    async def search(self, query: str, max_results: int, start_index: int = 0) -> List[BookSearchItem]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return [DUNE]
+
+
+def test_concurrent_calls_of_a_key_share_one_execution():
+    flight = SingleFlight("test")
+    executions = []
+
+    async def call(key):
+        executions.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(flight.do(key, lambda key=key: call(key)) for key in ["dune", "dune", "emma", "dune"]))
+        # Finished calls are forgotten: a later caller runs the call again
+        results.append(await flight.do("dune", lambda: call("dune")))
+        return results
+
+    assert asyncio.run(scenario()) == ["DUNE", "DUNE", "EMMA", "DUNE", "DUNE"]
+    assert executions == ["dune", "emma", "dune"]
+    metrics = flight.metrics()
+    assert (metrics["calls"], metrics["executions"], metrics["coalesced"]) == (5, 3, 2)
+    assert metrics["in_flight"] == 0
+
+
+def test_failure_is_raised_to_every_waiting_caller():
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("upstream unavailable")
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("dune", fail) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(scenario())
+    assert [type(error) for error in errors] == [ConnectionError] * 3
+    assert flight.metrics()["executions"] == 1
+    assert flight.metrics()["in_flight"] == 0
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = SingleFlight("test")
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return "dune"
+
+    async def scenario():
+        first = asyncio.create_task(flight.do("dune", call))
+        second = asyncio.create_task(flight.do("dune", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "dune"
+
+
+def test_coalesced_searches_get_their_own_lists():
+    upstream = SlowSearchService()
+    service = CoalescingBooksSearchService(upstream, SingleFlight("books_search"))
+
+    async def scenario():
+        return await asyncio.gather(service.search("Dune", 10), service.search(" dune ", 10))
+
+    first, second = asyncio.run(scenario())
+    assert first == second == [DUNE]
+    assert first is not second
+    assert upstream.calls == 1
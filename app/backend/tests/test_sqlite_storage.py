@@ -0,0 +1,67 @@
+# python
+import json
+
+# 3rd party
+import pytest
+
+# project
+from app.core.graph_persistence import JsonGraphStorage, SqliteGraphStorage
+
+
+def node(node_id: str, label: str) -> dict:
+    return {"id": node_id, "label": label, "properties": {"title": label}}
+
+
+def edge(source: str, target: str, weight: float = 1.0) -> dict:
+    return {"source": source, "target": target, "weight": weight}
+
+
+def test_incremental_writes_round_trip(tmp_path):
+    storage = SqliteGraphStorage(tmp_path / "graph.sqlite3")
+    storage.save_graph({"nodes": [node("1", "Dune"), node("2", "Emma")], "edges": [edge("1", "2")]})
+    storage.apply_mutations([
+        {"op": "upsert_node", "node": node("3", "Ulysses")},
+        {"op": "upsert_node", "node": node("1", "Dune Messiah")},
+        {"op": "upsert_edge", "edge": edge("1", "2", 0.5)},
+        {"op": "upsert_edge", "edge": edge("3", "1")},
+        {"op": "upsert_edge", "edge": edge("3", "2")},
+    ])
+    # Removing a node also removes the edges on both of its ends
+    storage.delete_node("2")
+    storage.delete_edge("3", "1")
+    storage.close()
+
+    reopened = SqliteGraphStorage(tmp_path / "graph.sqlite3")
+    assert reopened.load_graph() == {"nodes": [node("1", "Dune Messiah"), node("3", "Ulysses")], "edges": []}
+    reopened.close()
+
+
+def test_failed_batch_leaves_the_database_unchanged(tmp_path):
+    storage = SqliteGraphStorage(tmp_path / "graph.sqlite3")
+    storage.upsert_node(node("1", "Dune"))
+
+    with pytest.raises(ValueError):
+        storage.apply_mutations([
+            {"op": "upsert_node", "node": node("2", "Emma")},
+            {"op": "rename_node", "id": "1"},
+        ])
+
+    assert storage.load_graph()["nodes"] == [node("1", "Dune")]
+    storage.close()
+
+
+@pytest.mark.parametrize("database_exists", [False, True])
+def test_legacy_json_is_imported_only_into_a_new_database(tmp_path, database_exists):
+    legacy_path = tmp_path / "graph.json"
+    JsonGraphStorage(legacy_path).save_graph({"nodes": [node("1", "Dune"), node("2", "Emma")], "edges": [edge("1", "2")]})
+    if database_exists:
+        SqliteGraphStorage(tmp_path / "graph.sqlite3").close()
+
+    storage = SqliteGraphStorage(tmp_path / "graph.sqlite3", legacy_json_path=legacy_path)
+
+    graph_data = storage.load_graph()
+    if database_exists:
+        assert graph_data == {"nodes": [], "edges": []}
+    else:
+        assert graph_data == json.loads(legacy_path.read_text(encoding="utf-8"))
+    storage.close()
@@ -0,0 +1,64 @@
+# python
+import asyncio
+
+# project
+from app.core.write_behind import WriteBehindFlusher
+
+
+class Storage:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.saves = 0
+
+    def save(self) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise IOError("disk full")
+        self.saves += 1
+
+
+def test_marks_are_coalesced_into_one_flush():
+    storage = Storage()
+    flusher = WriteBehindFlusher(storage.save, interval=60, max_dirty=100)
+
+    async def scenario():
+        await flusher.start()
+        for _ in range(50):
+            flusher.mark_dirty()
+        saves_while_running = storage.saves
+        await flusher.stop()
+        return saves_while_running
+
+    assert asyncio.run(scenario()) == 0
+    assert storage.saves == 1
+    assert flusher.metrics.coalesced_mutations == 50
+
+
+def test_max_dirty_triggers_an_early_flush():
+    storage = Storage()
+    flusher = WriteBehindFlusher(storage.save, interval=60, max_dirty=10)
+
+    async def scenario():
+        await flusher.start()
+        for _ in range(10):
+            flusher.mark_dirty()
+        await asyncio.sleep(0.05)
+        saves = storage.saves
+        await flusher.stop()
+        return saves
+
+    assert asyncio.run(scenario()) == 1
+    assert flusher.dirty_count == 0
+
+
+def test_failed_flush_keeps_the_mutations_dirty():
+    storage = Storage(failures=1)
+    flusher = WriteBehindFlusher(storage.save)
+
+    # Not started: every mark is flushed right away
+    flusher.mark_dirty(3)
+    assert flusher.dirty_count == 3
+    assert flusher.flush()
+    assert flusher.dirty_count == 0
+    assert storage.saves == 1
+    assert flusher.metrics.failed_flushes == 1